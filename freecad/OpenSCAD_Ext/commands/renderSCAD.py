@@ -96,6 +96,11 @@ def _is_scad_mesh_feature(obj):
             and bool(getattr(obj, "sourceFile", "")))
 
 
+def _is_scad_project(obj):
+    from freecad.OpenSCAD_Ext.objects.SCADProjectObject import SCADProjectObject
+    return isinstance(getattr(obj, "Proxy", None), SCADProjectObject)
+
+
 def _find_render_targets(sel):
     """
     Return the list of SCAD objects to render.
@@ -105,6 +110,7 @@ def _find_render_targets(sel):
     2. User selected a finalized Mesh::Feature SCAD object → use it.
     3. User selected an App::VarSet → find every SCAD object (FeaturePython
        or Mesh::Feature) whose linked_varset points to that VarSet.
+    4. User selected a SCAD project → Render All of its files.
 
     This means the user never has to manually re-select the SCAD object after
     tweaking a customizer parameter — clicking Render with the VarSet focused
@@ -120,6 +126,9 @@ def _find_render_targets(sel):
         elif _is_scad_mesh_feature(obj):
             targets.append(obj)
 
+        elif obj.TypeId == "App::FeaturePython" and _is_scad_project(obj):
+            targets.append(obj)
+
         elif obj.TypeId == "App::VarSet" and doc is not None:
             # Find all SCAD objects linked to this VarSet.
             # linked_varset is a PropertyString holding the VarSet's object name.
@@ -203,7 +212,12 @@ class RenderSCADFileObject_Class:
                 write_log("INFO", "Has renderFunction")
                 try:
                     write_log("Render", f"obj.sourceFile {obj.sourceFile}")
-                    obj.Proxy.renderFunction(obj)
+                    if isinstance(obj.Proxy, SCADfileBase) and not _is_scad_project(obj):
+                        # explicit Render: run OpenSCAD even if the key matches;
+                        # a project's Render All keeps its manifest
+                        obj.Proxy.renderFunction(obj, force=True)
+                    else:
+                        obj.Proxy.renderFunction(obj)
                 except Exception as e:
                     FreeCAD.Console.PrintError(
                         f"Failed to Render SCAD file for {obj.Label}: {e}\n"
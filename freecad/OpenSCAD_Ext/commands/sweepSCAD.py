@@ -0,0 +1,105 @@
+import FreeCAD
+import FreeCADGui
+
+from PySide import QtGui, QtCore
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.objects.SCADObject import SCADfileBase
+
+
+def _split_selection(sel):
+    """(SCAD objects, first selected Spreadsheet or None)"""
+    objs, sheet = [], None
+    for obj in sel:
+        if obj.TypeId == "Spreadsheet::Sheet" and sheet is None:
+            sheet = obj
+        elif isinstance(getattr(obj, "Proxy", None), SCADfileBase):
+            objs.append(obj)
+    return objs, sheet
+
+
+def _ask_for_table(obj):
+    """
+    No Spreadsheet selected: ask for a CSV file, or create a template sheet
+    from the linked VarSet.  Returns a CSV path, or None.
+    """
+    box = QtGui.QMessageBox(FreeCADGui.getMainWindow())
+    box.setWindowTitle("Parameter Sweep")
+    box.setText(
+        "Select a Spreadsheet together with the SCAD object, or choose a CSV\n"
+        "file with one variant per row (first row: parameter names)."
+    )
+    csv_button = box.addButton("CSV File…", QtGui.QMessageBox.AcceptRole)
+    sheet_button = None
+    varset_name = getattr(obj, "linked_varset", "")
+    if varset_name:
+        sheet_button = box.addButton("Create Table from VarSet", QtGui.QMessageBox.ActionRole)
+    box.addButton(QtGui.QMessageBox.Cancel)
+    box.exec_()
+
+    clicked = box.clickedButton()
+    if clicked is csv_button:
+        path, _ = QtGui.QFileDialog.getOpenFileName(
+            FreeCADGui.getMainWindow(), "Parameter table", "", "CSV files (*.csv);;All files (*)")
+        return path or None
+    if sheet_button is not None and clicked is sheet_button:
+        from freecad.OpenSCAD_Ext.core.scad_sweep import create_sweep_sheet
+        varset = obj.Document.getObject(varset_name)
+        sheet = create_sweep_sheet(obj.Document, varset, f"{obj.Label}_Sweep_Table")
+        obj.Document.recompute()
+        FreeCAD.Console.PrintMessage(
+            f"Created {sheet.Label}: add one row per variant, then select it "
+            f"with {obj.Label} and run Parameter Sweep again\n"
+        )
+    return None
+
+
+class SweepSCADFile_Class:
+    """Render a SCAD object once per row of a parameter table."""
+
+    def GetResources(self):
+        return {
+            'MenuText': 'Parameter Sweep',
+            'ToolTip': 'Render a SCAD File Object once per row of a Spreadsheet / CSV parameter table',
+            'Pixmap': 'sweepScadFileObj.svg',
+        }
+
+    def Activated(self):
+        from freecad.OpenSCAD_Ext.core.scad_sweep import read_sweep_table, run_sweep
+
+        objs, sheet = _split_selection(FreeCADGui.Selection.getSelection())
+        if not objs:
+            FreeCAD.Console.PrintWarning(
+                "Parameter Sweep: select a SCAD object (and its parameter Spreadsheet)\n"
+            )
+            return
+
+        for obj in objs:
+            table = sheet if sheet is not None else _ask_for_table(obj)
+            if table is None:
+                return
+            variants = read_sweep_table(table)
+            if not variants:
+                FreeCAD.Console.PrintWarning("Parameter Sweep: the table has no variant rows\n")
+                return
+
+            write_log("Sweep", f"Sweep {obj.Label} over {len(variants)} variants")
+            QtGui.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            try:
+                summary = run_sweep(obj, variants)
+            finally:
+                QtGui.QApplication.restoreOverrideCursor()
+
+            failed = [e for e in summary if not e["ok"]]
+            FreeCAD.Console.PrintMessage(
+                f"Parameter Sweep {obj.Label}: {len(summary) - len(failed)} of "
+                f"{len(summary)} variants rendered\n"
+            )
+            for e in failed:
+                FreeCAD.Console.PrintError(f"  {e['variant']}: {e.get('error')}\n")
+
+    def IsActive(self):
+        return FreeCAD.ActiveDocument is not None
+
+
+FreeCADGui.addCommand("SweepSCADFileObject_CMD", SweepSCADFile_Class())
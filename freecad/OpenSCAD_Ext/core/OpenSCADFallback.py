@@ -26,12 +26,14 @@ import Mesh
 from Part import Shape
 
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.logger.import_profiler import profiled
 from freecad.OpenSCAD_Ext.parsers.csg_parser.ast_helpers import (
     ast_to_scad_string,
     class_ast_to_scad_string,
 )
 
 
+@profiled("fallback")
 def fallback_to_OpenSCAD(doc, node, reason="Fallback requested"):
     """
     Convert an AST node into a FreeCAD Shape using OpenSCAD → STL.
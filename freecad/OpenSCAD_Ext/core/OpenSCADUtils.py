@@ -32,6 +32,7 @@ import os
 import tempfile
 from PySide import QtCore
 from freecad.OpenSCAD_Ext.core.checkObjectShapes import *
+from freecad.OpenSCAD_Ext.logger.import_profiler import profiled
 
 try:
     from PySide import QtGui
@@ -162,6 +163,7 @@ def errorDialog(msg):
     diag.exec_()
 
 
+@profiled("openscad")
 def callopenscad(
     inputfilename,
     outputfilename=None,
@@ -227,6 +229,7 @@ def callopenscad(
     else:
         raise OpenSCADError('OpenSCAD executable unavailable')
 
+@profiled("openscad")
 def callopenscad_with_overrides(
     inputfilename,
     outputfilename=None,
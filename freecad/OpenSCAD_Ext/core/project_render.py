@@ -0,0 +1,222 @@
+# core/project_render.py
+"""
+Render All for SCAD projects (.scadproj): every file of a project rendered
+concurrently, and only when something changed.
+
+    1. closure hashes   one walk of the include graph for the whole project
+                        (closure_hashes), so an include shared by many files
+                        is scanned and hashed once
+    2. manifest         per file: closure hash, mode, fnmax, -D overrides and
+                        the render / shape cache keys of the last Render All;
+                        an unchanged file is loaded from the cache and never
+                        reaches OpenSCAD or the importer
+    3. OpenSCAD         changed files in a thread pool of at most
+                        ProjectRenderWorkers processes for the whole project
+    4. import           on the calling thread (FreeCAD documents are not
+                        thread safe), through core/render_cache
+
+The manifest lives in the cache directory, keyed by the project file path,
+so reopening the project finds it again.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import FreeCAD
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import default_cache_dir
+
+_MANIFEST_VERSION = 1
+
+
+def project_workers():
+    """Project-wide cap on concurrent OpenSCAD processes (0 = CPUs - 1)."""
+    workers = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/OpenSCAD_Ext") \
+        .GetInt("ProjectRenderWorkers", 0)
+    return workers if workers > 0 else max(1, (os.cpu_count() or 2) - 1)
+
+
+# ------------------------------------------------
+# Manifest
+# ------------------------------------------------
+
+def manifest_path(project_file):
+    digest = hashlib.sha256(os.path.abspath(project_file).encode("utf-8")).hexdigest()
+    return os.path.join(default_cache_dir(), "projects", digest[:24] + ".json")
+
+
+def load_manifest(project_file):
+    """{file key: entry} of the last Render All, {} if none (or unreadable)."""
+    try:
+        with open(manifest_path(project_file), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != _MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_manifest(project_file, files):
+    path = manifest_path(project_file)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {"version": _MANIFEST_VERSION, "project": os.path.abspath(project_file),
+            "files": files}
+    fd, tmp = tempfile.mkstemp(suffix=".json", dir=os.path.dirname(path))
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# ------------------------------------------------
+# Render All
+# ------------------------------------------------
+
+def project_members(project_obj):
+    """SCAD file objects in the project group."""
+    from freecad.OpenSCAD_Ext.objects.SCADObject import SCADfileBase
+    return [o for o in getattr(project_obj, "Group", [])
+            if isinstance(getattr(o, "Proxy", None), SCADfileBase)
+            and getattr(o, "sourceFile", "")]
+
+
+def _d_params(obj):
+    from freecad.OpenSCAD_Ext.objects.SCADObject import _get_linked_varset
+    varset = _get_linked_varset(obj)
+    if varset is None:
+        return None
+    from freecad.OpenSCAD_Ext.core.varset_utils import varset_to_D_params
+    return sorted(varset_to_D_params(varset)) or None
+
+
+def _from_cache(entry, mode):
+    """Result recorded in the manifest entry, if still in the cache."""
+    from freecad.OpenSCAD_Ext.core import render_cache
+    if mode == "Mesh":
+        stl = entry.get("output")
+        if stl and os.path.isfile(stl):
+            try:
+                return render_cache.load_mesh(stl)
+            except ValueError:
+                return None
+        return None
+    key = entry.get("shape_key")
+    return render_cache.cached_shape(key) if key else None
+
+
+def render_project(project_obj, workers=None, force=False):
+    """
+    Render every SCAD file object of *project_obj*.  Files whose closure and
+    settings match the manifest are taken from the cache (or left alone if
+    already showing that render); *force* runs OpenSCAD and the importer
+    for everything, bypassing the manifest and core/render_cache.  Returns
+    {"rendered": n, "cached": n, "unchanged": n, "failed": n, "secs": t}.
+    """
+    from freecad.OpenSCAD_Ext.core import render_cache
+    from freecad.OpenSCAD_Ext.objects.SCADObject import _render_key
+    from freecad.OpenSCAD_Ext.parsers.scadmeta import closure_hashes
+
+    start = time.perf_counter()
+    project_file = project_obj.sourceFile
+    project_dir = os.path.dirname(os.path.abspath(project_file))
+    members = project_members(project_obj)
+    workers = workers or project_workers()
+    stats = {"rendered": 0, "cached": 0, "unchanged": 0, "failed": 0}
+
+    for obj in [o for o in members if not os.path.isfile(o.sourceFile)]:
+        write_log("Error", f"{obj.Label}: source file {obj.sourceFile} not found")
+        members.remove(obj)
+        stats["failed"] += 1
+
+    closures = closure_hashes([o.sourceFile for o in members])
+    manifest = {} if force else load_manifest(project_file)
+    new_manifest = {}
+
+    jobs = []
+    for obj in members:
+        name = os.path.relpath(os.path.abspath(obj.sourceFile), project_dir)
+        d_params = _d_params(obj)
+        closure = closures[obj.sourceFile]
+        render_key = _render_key(obj, d_params, closure)
+        entry = {"closure": closure, "mode": obj.mode, "fnmax": int(obj.fnmax),
+                 "d_params": [list(p) for p in d_params or ()]}
+        old = manifest.get(name, {})
+        same = all(old.get(k) == v for k, v in entry.items())
+
+        if same and render_key == getattr(obj.Proxy, "_render_key", None) \
+                and obj.Proxy._has_render(obj):
+            new_manifest[name] = old
+            stats["unchanged"] += 1
+            continue
+        result = _from_cache(old, obj.mode) if same else None
+        if result is not None:
+            obj.Proxy._last_d_params = d_params
+            obj.Proxy._show_result(obj, result, render_key)
+            new_manifest[name] = old
+            stats["cached"] += 1
+            continue
+        # the workers only see plain values - FreeCAD objects stay on this thread
+        jobs.append({"obj": obj, "name": name, "d_params": d_params,
+                     "render_key": render_key, "entry": entry,
+                     "source": obj.sourceFile, "timeout": int(obj.timeout) or None,
+                     "use_cache": not force,
+                     "outputext": "stl" if obj.mode == "Mesh" else "csg"})
+
+    def run_openscad(job):
+        # worker thread: render_output raises on a timeout instead of
+        # opening a dialog, and never caches a failed render
+        try:
+            job["output"], _ = render_cache.render_output(
+                job["source"], job["d_params"], job["outputext"], job["timeout"],
+                job["entry"]["closure"], use_cache=job["use_cache"])
+        except Exception as e:
+            job["error"] = str(getattr(e, "value", e)).strip()
+
+    if jobs:
+        write_log("ScadProject", f"{project_obj.Label}: rendering {len(jobs)} of "
+                                 f"{len(members)} files, {workers} OpenSCAD processes")
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            list(pool.map(run_openscad, jobs))
+
+    for job in jobs:
+        obj = job["obj"]
+        entry = job["entry"]
+        result = None
+        if "output" in job:
+            try:
+                entry["output"] = job["output"]
+                if obj.mode == "Mesh":
+                    result = render_cache.load_mesh(job["output"])
+                else:
+                    entry["shape_key"] = render_cache.shape_key(job["output"], obj.mode, obj.fnmax)
+                    result, _ = render_cache.csg_to_shape(
+                        job["output"], obj.mode, obj.fnmax, use_cache=job["use_cache"])
+                    if result.isNull():
+                        raise ValueError("import produced no shape")
+            except Exception as e:
+                job["error"] = str(e)
+                result = None
+        obj.Proxy._last_d_params = job["d_params"]
+        if result is None:
+            obj.message = job.get("error", "")[:500]
+            write_log("Error", f"{job['name']}: {job.get('error')}")
+            obj.Proxy._show_result(obj, None, None)
+            stats["failed"] += 1
+            continue
+        obj.message = ""
+        obj.Proxy._show_result(obj, result, job["render_key"])
+        new_manifest[job["name"]] = entry
+        stats["rendered"] += 1
+
+    save_manifest(project_file, new_manifest)
+    project_obj.Document.recompute()
+    stats["secs"] = round(time.perf_counter() - start, 2)
+    write_log("ScadProject",
+              f"{project_obj.Label}: {stats['rendered']} rendered, {stats['cached']} from cache, "
+              f"{stats['unchanged']} unchanged, {stats['failed']} failed in {stats['secs']} secs")
+    return stats
@@ -0,0 +1,258 @@
+# core/render_cache.py
+"""
+Content addressed on-disk cache of OpenSCAD renders and imported shapes.
+
+Two stages are cached under default_cache_dir()/renders:
+
+    SCAD -> CSG    key: closure_hash of the source (the file plus everything
+                   it includes / uses) and the -D overrides (other OpenSCAD
+                   outputs, e.g. STL for Mesh mode, the same way)
+    CSG  -> shape  key: hash of the CSG text, importer mode and fnmax;
+                   stored as .brep
+
+An unchanged closure with the same overrides finds its CSG without running
+OpenSCAD, and identical CSG (the same part rendered from two files, or a
+parameter set that does not change the geometry) finds its shape without
+importing.  Entries are written to a temporary name and renamed into
+place, so concurrent processes sharing the cache never read partial files.
+"""
+
+import hashlib
+import os
+import subprocess
+import tempfile
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import default_cache_dir
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_deps import closure_hash
+
+# bump when the OpenSCAD call or the importers change output
+_RENDER_VERSION = "1"
+
+MODES = ("AST-Brep", "Brep")
+
+
+def render_dir():
+    return os.path.join(default_cache_dir(), "renders")
+
+
+def _key(*parts):
+    h = hashlib.sha256()
+    for part in (_RENDER_VERSION,) + parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _key_path(key, ext):
+    return os.path.join(render_dir(), key[:2], key + ext)
+
+
+def _store(key, ext, write):
+    """
+    Call *write(tmp_path)* and move the result to the key's path.  An empty
+    result is never stored (ValueError), so it cannot be served as a hit.
+    """
+    path = _key_path(key, ext)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=ext, dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        write(tmp)
+        if os.path.getsize(tmp) == 0:
+            raise ValueError(f"empty {ext} output, not cached")
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+
+def _format_d_params(d_params):
+    return ";".join(f"{name}={value}" for name, value in (d_params or ()))
+
+
+# ------------------------------------------------
+# SCAD -> CSG / STL
+# ------------------------------------------------
+
+def output_key(path, d_params=None, outputext="csg", closure=None):
+    """
+    Key of the OpenSCAD output of *path* rendered with *d_params*
+    ([(name, value), ...]).  *closure* is closure_hash(path) if the caller
+    already has it.
+    """
+    if closure is None:
+        closure = closure_hash(path)
+    return _key(outputext, closure, _format_d_params(d_params))
+
+
+def cached_output(path, d_params=None, outputext="csg", closure=None):
+    """Return (key, output path or None) without running OpenSCAD."""
+    key = output_key(path, d_params, outputext, closure)
+    out = _key_path(key, "." + outputext)
+    return key, (out if os.path.isfile(out) else None)
+
+
+def run_openscad(path, outputfilename, d_params=None, timeout=None):
+    """
+    Run OpenSCAD on *path* writing *outputfilename* (format from its
+    extension).  Raises OpenSCADError on a non-zero exit or a timeout -
+    unlike callopenscad() it never opens a dialog, so it is safe to call
+    from worker threads and processes.
+    """
+    from freecad.OpenSCAD_Ext.core.OpenSCADUtils import OpenSCADError
+    from freecad.OpenSCAD_Ext.core.scad_thumbnails import _openscad_executable
+
+    exe = _openscad_executable()
+    if exe is None:
+        raise OpenSCADError("OpenSCAD executable unavailable")
+    cmd = [exe]
+    for name, value in d_params or ():
+        cmd += ["-D", f"{name}={value}"]
+    cmd += ["-o", outputfilename, path]
+
+    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        stdout, stderr = p.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        p.kill()
+        p.communicate()
+        raise OpenSCADError(f"Call to OpenSCAD timed out after {timeout} secs")
+    if p.returncode != 0:
+        raise OpenSCADError(f"{stdout.decode('utf8', 'replace').strip()} "
+                            f"{stderr.decode('utf8', 'replace').strip()}")
+
+
+def render_output(path, d_params=None, outputext="csg", timeout=None,
+                  closure=None, use_cache=True):
+    """
+    OpenSCAD output of *path* with *d_params*, from the cache or by running
+    OpenSCAD (use_cache False always runs it, refreshing the cache entry).
+    Returns (output path, hit).  Raises OpenSCADError if OpenSCAD fails or
+    times out, ValueError if it produces no output - neither is cached.
+    Safe to call from several threads - each miss is its own OpenSCAD process.
+    """
+    key, out = cached_output(path, d_params, outputext, closure)
+    if out is not None and use_cache:
+        return out, True
+
+    def write(tmp):
+        run_openscad(path, tmp, d_params, timeout)
+
+    out = store_output(key, outputext, write)
+    write_log("Render", f"{outputext.upper()} cached for {os.path.basename(path)} "
+                        f"{_format_d_params(d_params)}")
+    return out, False
+
+
+def store_output(key, outputext, write):
+    """
+    Store an output rendered by the caller: *write(tmp_path)* produces it
+    (e.g. an OpenSCAD run the caller wants to be able to kill).
+    """
+    return _store(key, "." + outputext, write)
+
+
+def render_csg(path, d_params=None, timeout=None, closure=None, use_cache=True):
+    """render_output() for CSG, the input of the Brep importers."""
+    return render_output(path, d_params, "csg", timeout, closure, use_cache)
+
+
+def load_mesh(stl_path):
+    """Mesh.Mesh of an STL output (Mesh mode); ValueError if it has no facets."""
+    import Mesh
+    mesh = Mesh.Mesh(stl_path)
+    if mesh.CountFacets == 0:
+        raise ValueError("OpenSCAD produced an empty mesh")
+    return mesh
+
+
+# ------------------------------------------------
+# CSG -> shape
+# ------------------------------------------------
+
+def shape_key(csg_path, mode="AST-Brep", fnmax=16):
+    with open(csg_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return _key("shape", digest, mode, int(fnmax))
+
+
+def cached_shape(key):
+    """The cached Part.Shape for *key*, or None."""
+    brep = _key_path(key, ".brep")
+    if not os.path.isfile(brep):
+        return None
+    import Part
+    shape = Part.Shape()
+    try:
+        shape.importBrep(brep)
+    except Exception as e:
+        write_log("Render", f"Unreadable cached shape {brep}: {e}")
+        return None
+    return shape
+
+
+def store_shape(key, shape):
+    return _store(key, ".brep", shape.exportBrep)
+
+
+def import_csg(csg_path, mode="AST-Brep", fnmax=16):
+    """
+    Import *csg_path* into a scratch document and return one Part.Shape
+    (a compound if the import made several root objects).
+    """
+    import FreeCAD
+    import Part
+
+    active = FreeCAD.ActiveDocument
+    doc = FreeCAD.newDocument("render_work")
+    try:
+        if mode == "AST-Brep":
+            from freecad.OpenSCAD_Ext.importers import importASTCSG
+            # result must be a Part.Shape so keep polyhedra as BRep
+            importASTCSG.processCSG(doc, csg_path, fnmax, mesh_threshold=0)
+        elif mode == "Brep":
+            from freecad.OpenSCAD_Ext.importers import importAltCSG
+            importAltCSG.pathName = os.path.dirname(csg_path)
+            importAltCSG.processCSG(doc, csg_path, fnmax)
+        else:
+            raise ValueError(f"Unknown import mode {mode}")
+        shapes = [obj.Shape.copy() for obj in doc.RootObjects
+                  if hasattr(obj, "Shape") and not obj.Shape.isNull()]
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+        if active is not None:
+            FreeCAD.setActiveDocument(active.Name)
+    if not shapes:
+        return Part.Shape()
+    return shapes[0] if len(shapes) == 1 else Part.makeCompound(shapes)
+
+
+def export_shape(shape, path):
+    """Write *shape* as BREP, STEP or STL, chosen by the extension of *path*."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".brep", ".brp"):
+        shape.exportBrep(path)
+    elif ext in (".step", ".stp"):
+        shape.exportStep(path)
+    elif ext == ".stl":
+        shape.exportStl(path)
+    else:
+        raise ValueError(f"Cannot export {ext} files")
+
+
+def csg_to_shape(csg_path, mode="AST-Brep", fnmax=16, use_cache=True):
+    """
+    Shape of *csg_path*, from the cache or by importing (use_cache False
+    always imports, refreshing the cache entry).  Returns (shape, hit).
+    """
+    key = shape_key(csg_path, mode, fnmax)
+    if use_cache:
+        shape = cached_shape(key)
+        if shape is not None:
+            return shape, True
+    shape = import_csg(csg_path, mode, fnmax)
+    if not shape.isNull():
+        store_shape(key, shape)
+    return shape, False
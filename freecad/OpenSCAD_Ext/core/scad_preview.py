@@ -0,0 +1,146 @@
+# core/scad_preview.py
+"""
+Low resolution preview renders of SCAD objects, for live parameter tuning.
+
+A preview is an STL rendered with coarse faceting and ``$preview`` set:
+
+    openscad -D width=20 -D '$fn=12' -D '$fa=12' -D '$fs=2' -D '$preview=true' -o p.stl file.scad
+
+OpenSCAD's own preview (F5) only exists for the GUI and PNG output, so the
+fast path is taken by the same variables instead - libraries already skip
+costly detail when ``$preview`` is true.  The ``PreviewBackend`` preference
+(e.g. ``manifold`` for OpenSCAD 2024+) adds ``--backend=...`` for a faster
+CGAL-free render.
+
+PreviewRenderer runs one preview at a time in a background thread.  Each
+request supersedes the previous one: its OpenSCAD process is killed and its
+result discarded, so only the newest parameter state is ever delivered.
+Previews go through core/render_cache, so returning to an earlier value
+shows its preview without running OpenSCAD.
+"""
+
+import os
+import subprocess
+import threading
+
+import FreeCAD
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+
+PREVIEW_FN = 12             # default $fn of a preview
+PREVIEW_DELAY = 300         # ms without edits before a preview starts
+FULL_RENDER_DELAY = 3000    # ms without edits before the full render, 0 = on demand only
+PREVIEW_TIMEOUT = 60        # seconds per preview
+
+
+def _prefs():
+    return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/OpenSCAD_Ext")
+
+
+def preview_settings():
+    """(preview $fn, preview delay ms, full render delay ms, backend) from preferences."""
+    p = _prefs()
+    return (p.GetInt("PreviewFN", PREVIEW_FN),
+            p.GetInt("PreviewDelay", PREVIEW_DELAY),
+            p.GetInt("PreviewFullRenderDelay", FULL_RENDER_DELAY),
+            p.GetString("PreviewBackend", ""))
+
+
+def preview_params(d_params, fn=PREVIEW_FN):
+    """*d_params* with the coarse faceting and $preview overrides appended."""
+    return list(d_params or ()) + [
+        ("$fn", str(int(fn))), ("$fa", "12"), ("$fs", "2"), ("$preview", "true"),
+    ]
+
+
+class PreviewCancelled(Exception):
+    """The preview was superseded before OpenSCAD finished."""
+
+
+class PreviewRenderer:
+    """
+    Render previews of one source file in the background.
+
+    request() returns at once; *callback(generation, stl_path, error)* is
+    called from the worker thread for the newest request only - a superseded
+    request is cancelled and never calls back.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._process = None
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def request(self, source, d_params, fn=PREVIEW_FN, backend=""):
+        """Start a preview of *source* with *d_params*; returns its generation."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._kill_locked()
+        threading.Thread(
+            target=self._run, args=(generation, source, preview_params(d_params, fn), backend),
+            name=f"scad-preview-{generation}", daemon=True,
+        ).start()
+        return generation
+
+    def cancel(self):
+        """Drop the current preview, killing its OpenSCAD process."""
+        with self._lock:
+            self._generation += 1
+            self._kill_locked()
+
+    def _kill_locked(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+        self._process = None
+
+    def _current(self, generation):
+        return generation == self._generation
+
+    def _run(self, generation, source, params, backend):
+        from freecad.OpenSCAD_Ext.core import render_cache
+        from freecad.OpenSCAD_Ext.core.scad_thumbnails import _openscad_executable
+
+        try:
+            # the backend is part of the cache key, not an override
+            key_params = params + [("--backend", backend)] if backend else params
+            key, stl = render_cache.cached_output(source, key_params, "stl")
+            if stl is None:
+                exe = _openscad_executable()
+                if exe is None:
+                    raise RuntimeError("OpenSCAD executable not set")
+                cmd = [exe] + ([f"--backend={backend}"] if backend else [])
+                for name, value in params:
+                    cmd += ["-D", f"{name}={value}"]
+                stl = render_cache.store_output(
+                    key, "stl", lambda tmp: self._openscad(generation, cmd + ["-o", tmp, source]))
+            error = None
+        except PreviewCancelled:
+            return
+        except Exception as e:
+            stl, error = None, str(e).strip()
+        if self._current(generation):
+            self._callback(generation, stl, error)
+
+    def _openscad(self, generation, cmd):
+        with self._lock:
+            if not self._current(generation):
+                raise PreviewCancelled()
+            self._process = p = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            _, stderr = p.communicate(timeout=PREVIEW_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.communicate()
+            raise RuntimeError(f"Preview timed out after {PREVIEW_TIMEOUT} secs")
+        if not self._current(generation):
+            raise PreviewCancelled()
+        if p.returncode != 0:
+            raise RuntimeError(stderr.decode("utf8", "replace").strip()[-300:])
+        write_log("Preview", f"Preview rendered {os.path.basename(cmd[-1])}")
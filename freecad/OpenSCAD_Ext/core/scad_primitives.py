@@ -0,0 +1,146 @@
+# core/scad_primitives.py
+"""
+Shared primitive factory for the AST and PLY (importAltCSG) importers.
+
+OpenSCAD facets circles, cylinders and spheres according to $fn.  A small
+$fn is deliberate (e.g. $fn=6 hexagonal nut pockets) so must be built as an
+exact prism / pyramid / polyhedral sphere.  A large $fn is just a smooth
+surface, so the analytic Part solid is used.  The switch point is fnmax:
+
+    smooth  if $fn < 3 (fragments from $fa/$fs) or fnmax != 0 and $fn > fnmax
+    faceted otherwise
+
+Generated shapes are cached by (type, dims, fn) and the same Part.Shape is
+returned for every node using it.  Callers must copy() before modifying a
+returned shape (the importers already copy before transforms / booleans).
+"""
+
+import math
+
+import FreeCAD
+import Part
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+
+_cache = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def use_smooth(fn, fnmax):
+    """True if a $fn primitive should be built as a smooth analytic shape."""
+    fn = int(round(float(fn or 0)))
+    return fn < 3 or (fnmax != 0 and fn > fnmax)
+
+
+def clear_primitive_cache():
+    """Drop cached primitives, logging hit / miss counts."""
+    if _cache:
+        write_log("Primitive", f"Cache cleared, hits={_stats['hits']} misses={_stats['misses']}")
+    _cache.clear()
+    _stats["hits"] = _stats["misses"] = 0
+
+
+def _cached(key, build):
+    shape = _cache.get(key)
+    if shape is not None:
+        _stats["hits"] += 1
+        return shape
+    _stats["misses"] += 1
+    shape = build()
+    _cache[key] = shape
+    return shape
+
+
+def _polygon_points(n, r, z=0.0):
+    """OpenSCAD circle vertices: n points on radius r, first at angle 0."""
+    return [
+        FreeCAD.Vector(r * math.cos(2 * math.pi * i / n),
+                       r * math.sin(2 * math.pi * i / n), z)
+        for i in range(n)
+    ]
+
+
+def _polygon_wire(n, r, z=0.0):
+    pts = _polygon_points(n, r, z)
+    return Part.makePolygon(pts + [pts[0]])
+
+
+# ------------------------------------------------
+# Builders
+# ------------------------------------------------
+
+def _build_cube(sx, sy, sz):
+    return Part.makeBox(sx, sy, sz)
+
+
+def _build_cylinder(h, r1, r2, fn, fnmax):
+    if use_smooth(fn, fnmax):
+        if r1 == r2:
+            return Part.makeCylinder(r1, h)
+        return Part.makeCone(r1, r2, h)
+
+    n = int(round(fn))
+    if r1 == r2:
+        return Part.Face(_polygon_wire(n, r1)).extrude(FreeCAD.Vector(0, 0, h))
+
+    # frustum or pyramid - ruled loft, apex as vertex
+    bottom = _polygon_wire(n, r1) if r1 > 0 else Part.Vertex(FreeCAD.Vector(0, 0, 0))
+    top = _polygon_wire(n, r2, h) if r2 > 0 else Part.Vertex(FreeCAD.Vector(0, 0, h))
+    return Part.makeLoft([bottom, top], True, True)
+
+
+def _build_sphere(r, fn, fnmax):
+    if use_smooth(fn, fnmax):
+        return Part.makeSphere(r)
+
+    # OpenSCAD sphere: (fn + 1) // 2 rings of fn points, ring i at
+    # polar angle 180 * (i + 0.5) / rings, consecutive rings joined by
+    # quads and the end rings closed by planar polygons.
+    n = int(round(fn))
+    rings = (n + 1) // 2
+    wires = []
+    for i in range(rings):
+        phi = math.pi * (i + 0.5) / rings
+        wires.append(_polygon_wire(n, r * math.sin(phi), r * math.cos(phi)))
+    return Part.makeLoft(wires, True, True)
+
+
+def _build_circle(r, fn, fnmax):
+    if use_smooth(fn, fnmax):
+        return Part.Face(Part.Wire([Part.makeCircle(r)]))
+    return Part.Face(_polygon_wire(int(round(fn)), r))
+
+
+# ------------------------------------------------
+# Factory
+# ------------------------------------------------
+
+def make_primitive(kind, dims, fn=0, fnmax=16):
+    """
+    Return a cached Part.Shape for an OpenSCAD primitive in local coords
+    (no centering applied).
+
+    kind : "cube"      dims = (sx, sy, sz)
+           "cylinder"  dims = (h, r1, r2)
+           "sphere"    dims = (r,)
+           "circle"    dims = (r,)
+    fn   : OpenSCAD $fn (ignored for cube)
+    fnmax: switch point between faceted and smooth, see module doc
+    """
+    dims = tuple(float(d) for d in dims)
+    fn = int(round(float(fn or 0)))
+    smooth = use_smooth(fn, fnmax)
+    # smooth shapes do not depend on fn, share them
+    key = (kind, dims, 0 if smooth else fn)
+
+    if kind == "cube":
+        key = (kind, dims, 0)
+        return _cached(key, lambda: _build_cube(*dims))
+    if kind == "cylinder":
+        return _cached(key, lambda: _build_cylinder(*dims, fn, fnmax))
+    if kind == "sphere":
+        return _cached(key, lambda: _build_sphere(dims[0], fn, fnmax))
+    if kind == "circle":
+        return _cached(key, lambda: _build_circle(dims[0], fn, fnmax))
+
+    raise ValueError(f"Unsupported primitive type: {kind}")
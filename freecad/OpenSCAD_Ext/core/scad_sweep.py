@@ -0,0 +1,269 @@
+# core/scad_sweep.py
+"""
+Parameter sweep: render one SCAD object once per row of a parameter table.
+
+The table is a Spreadsheet or a CSV file laid out one variant per row:
+
+    Name    width   height  tolerance
+    S       20      10      0.2
+    M       30      15      0.2
+    L       40      20      0.3
+
+The first row holds parameter names, an optional ``Name`` (or ``Variant``)
+column labels the rows, and empty cells leave the parameter at its base
+value - the linked VarSet's value if the object has one, else the file's
+own default.  create_sweep_sheet() writes such a table from the linked
+VarSet as a starting point.
+
+Rendering runs in two stages.  OpenSCAD runs for all rows in parallel (one
+process per row, at most *workers* at a time) through core/render_cache,
+so rows already rendered before come straight from the cache and the
+source's include closure is hashed once for all rows.  The results are then
+imported on the calling thread (FreeCAD documents are not thread safe),
+where rows producing identical CSG share one cached shape.
+"""
+
+import csv
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import FreeCAD
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+
+NAME_COLUMNS = ("name", "variant", "label")
+
+# parallel OpenSCAD processes when the caller does not say
+DEFAULT_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+# ------------------------------------------------
+# Parameter tables
+# ------------------------------------------------
+
+def scad_value(text):
+    """
+    OpenSCAD literal for a table cell: numbers, booleans, vectors and quoted
+    strings pass through, anything else is quoted as a string.
+    """
+    s = str(text).strip()
+    if s.lower() in ("true", "false"):
+        return s.lower()
+    try:
+        float(s)
+        return s
+    except ValueError:
+        pass
+    if (s.startswith("[") and s.endswith("]")) or (s.startswith('"') and s.endswith('"')):
+        return s
+    return '"' + s.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _rows_to_variants(rows):
+    """[header, row, ...] of strings -> [(label, [(name, value), ...]), ...]"""
+    rows = [r for r in rows if any(str(c).strip() for c in r)]
+    if not rows:
+        return []
+    header = [str(h).strip() for h in rows[0]]
+    name_col = next((i for i, h in enumerate(header) if h.lower() in NAME_COLUMNS), None)
+    variants = []
+    for n, row in enumerate(rows[1:], start=1):
+        label = None
+        params = []
+        for i, name in enumerate(header):
+            cell = str(row[i]).strip() if i < len(row) and row[i] is not None else ""
+            if i == name_col:
+                label = cell or None
+            elif name and cell:
+                params.append((name, scad_value(cell)))
+        variants.append((label or f"row{n}", params))
+    return variants
+
+
+def read_sweep_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        return _rows_to_variants(list(csv.reader(f, dialect)))
+
+
+def _column_letters(col):
+    letters = ""
+    while col > 0:
+        col, r = divmod(col - 1, 26)
+        letters = chr(65 + r) + letters
+    return letters
+
+
+def _cell_text(sheet, cell):
+    try:
+        value = sheet.get(cell)
+    except Exception:
+        return ""
+    if hasattr(value, "Value"):         # Quantity
+        value = value.Value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def read_sweep_sheet(sheet):
+    """Variants from a Spreadsheet::Sheet (evaluated cell values)."""
+    columns = []
+    col = 1
+    while _cell_text(sheet, f"{_column_letters(col)}1"):
+        columns.append(_column_letters(col))
+        col += 1
+    rows = []
+    row = 1
+    while True:
+        values = [_cell_text(sheet, f"{c}{row}") for c in columns]
+        if not any(values):
+            break
+        rows.append(values)
+        row += 1
+    return _rows_to_variants(rows)
+
+
+def read_sweep_table(source):
+    """Variants from a Spreadsheet object or a CSV path."""
+    if isinstance(source, str):
+        return read_sweep_csv(source)
+    return read_sweep_sheet(source)
+
+
+def create_sweep_sheet(doc, varset, name="Sweep"):
+    """
+    Spreadsheet with a header of the VarSet's SCAD parameters and one row of
+    its current values, to be extended with a row per variant.
+    """
+    from freecad.OpenSCAD_Ext.core.createSpreadSheet import safe_set
+    from freecad.OpenSCAD_Ext.core.varset_utils import varset_to_D_params
+
+    sheet = doc.addObject("Spreadsheet::Sheet", name)
+    safe_set(sheet, 1, 1, "Name")
+    safe_set(sheet, 2, 1, "base")
+    for col, (param, value) in enumerate(varset_to_D_params(varset), start=2):
+        safe_set(sheet, 1, col, param)
+        safe_set(sheet, 2, col, value)
+    return sheet
+
+
+# ------------------------------------------------
+# Sweep
+# ------------------------------------------------
+
+def _base_params(obj):
+    from freecad.OpenSCAD_Ext.core.varset_utils import varset_to_D_params
+    name = getattr(obj, "linked_varset", "")
+    varset = obj.Document.getObject(name) if name else None
+    return varset_to_D_params(varset) if varset is not None else []
+
+
+def _merge(base, overrides):
+    merged = dict(base)
+    merged.update(overrides)
+    return sorted(merged.items())
+
+
+def run_sweep(obj, variants, workers=DEFAULT_WORKERS, export_dir=None,
+              export_ext=".step", create_objects=True):
+    """
+    Render SCAD object *obj* once per variant ([(label, d_params), ...]).
+
+    Each variant becomes a Part::Feature (Mesh::Feature in Mesh mode) in a
+    ``<label>_Sweep`` group if *create_objects*, and / or a file
+    ``<label>_<variant><export_ext>`` in *export_dir*.  Returns one summary
+    dict per variant, in table order.
+    """
+    from freecad.OpenSCAD_Ext.core import render_cache
+    from freecad.OpenSCAD_Ext.parsers.scadmeta import closure_hash
+
+    source = obj.sourceFile
+    mode = obj.mode
+    fnmax = int(obj.fnmax)
+    timeout = int(getattr(obj, "timeout", 0)) or None
+    outputext = "stl" if mode == "Mesh" else "csg"
+    base = _base_params(obj)
+    closure = closure_hash(source)          # once for every row
+    start = time.perf_counter()
+
+    summary = [{"variant": label, "d_params": _merge(base, params), "ok": False}
+               for label, params in variants]
+
+    def render(entry):
+        # worker thread: render_output raises on a timeout instead of
+        # opening a dialog, and never caches a failed render
+        t = time.perf_counter()
+        try:
+            entry["output"], entry["openscad_cached"] = render_cache.render_output(
+                source, entry["d_params"], outputext, timeout, closure)
+        except Exception as e:
+            entry["error"] = str(getattr(e, "value", e)).strip()
+        entry["openscad_secs"] = round(time.perf_counter() - t, 4)
+
+    write_log("Sweep", f"{obj.Label}: {len(variants)} variants, {workers} OpenSCAD processes")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(render, summary))
+
+    doc = obj.Document
+    group = None
+    if create_objects:
+        group = doc.addObject("App::DocumentObjectGroup", f"{obj.Label}_Sweep")
+    if export_dir:
+        os.makedirs(export_dir, exist_ok=True)
+
+    for entry in summary:
+        if "output" not in entry:
+            continue
+        t = time.perf_counter()
+        try:
+            if mode == "Mesh":
+                result = render_cache.load_mesh(entry["output"])
+                entry["shape_cached"] = None
+            else:
+                result, entry["shape_cached"] = render_cache.csg_to_shape(
+                    entry["output"], mode, fnmax)
+                if result.isNull():
+                    raise ValueError("import produced no shape")
+            name = f"{obj.Label}_{entry['variant']}"
+            if group is not None:
+                if mode == "Mesh":
+                    feature = doc.addObject("Mesh::Feature", name)
+                    feature.Mesh = result
+                else:
+                    feature = doc.addObject("Part::Feature", name)
+                    feature.Shape = result
+                group.addObject(feature)
+                entry["object"] = feature.Name
+            if export_dir:
+                path = os.path.join(export_dir, name + export_ext)
+                if mode == "Mesh":
+                    result.write(path)
+                else:
+                    render_cache.export_shape(result, path)
+                entry["file"] = path
+            entry["ok"] = True
+        except Exception as e:
+            entry["error"] = str(e)
+        entry["import_secs"] = round(time.perf_counter() - t, 4)
+
+    total = time.perf_counter() - start
+    ok = sum(1 for e in summary if e["ok"])
+    write_log("Sweep", f"{obj.Label}: {ok}/{len(summary)} variants in {total:.2f} secs")
+    for e in summary:
+        if e["ok"]:
+            write_log("Sweep", f"  {e['variant']}: openscad {e['openscad_secs']:.2f}s"
+                               f"{' (cached)' if e.get('openscad_cached') else ''}, "
+                               f"import {e['import_secs']:.2f}s"
+                               f"{' (cached)' if e.get('shape_cached') else ''}")
+        else:
+            write_log("Error", f"  {e['variant']} failed: {e.get('error')}")
+    if group is not None:
+        doc.recompute()
+    return summary
@@ -0,0 +1,225 @@
+# core/scad_thumbnails.py
+"""
+Rendered PNG thumbnails of SCAD files and modules, cached on disk.
+
+A thumbnail is made by OpenSCAD itself:
+
+    openscad --render --imgsize=W,H --viewall --autocenter -o thumb.png file.scad
+
+For a module a two line wrapper is rendered instead (``use <file>`` then
+``name();``, i.e. the module with its default arguments).
+
+Thumbnails are content addressed: the file name is a hash of the file's
+closure_hash (the file plus everything it includes / uses), the module
+name and the image size.  Editing the file or any include gives a new key,
+an unchanged closure finds the old PNG, so warm browsing never starts
+OpenSCAD.  Failed renders (no geometry, missing arguments, errors) leave a
+``.fail`` marker under the same key so they are not retried either.
+
+Misses are rendered by ThumbnailQueue: a few worker threads (the
+concurrency cap), newest request first, OpenSCAD at low OS priority.
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import default_cache_dir
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_deps import closure_hash
+
+THUMB_SIZE = (256, 256)
+RENDER_TIMEOUT = 60          # seconds per OpenSCAD call
+
+# bump when the render command changes so old images are not reused
+_THUMB_VERSION = "1"
+
+# requests kept waiting at most, the oldest are dropped first
+_MAX_PENDING = 200
+
+
+def thumbnail_dir():
+    return os.path.join(default_cache_dir(), "thumbnails")
+
+
+def thumbnail_key(path, module=None, size=THUMB_SIZE, closure=None):
+    """
+    Content key of the thumbnail of *path* (or of *module* in it).
+    *closure* is closure_hash(path) if the caller already has it.
+    """
+    if closure is None:
+        closure = closure_hash(path)
+    h = hashlib.sha256()
+    for part in (_THUMB_VERSION, closure, module or "", "%dx%d" % size):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _key_path(key, ext):
+    return os.path.join(thumbnail_dir(), key[:2], key + ext)
+
+
+def cached_thumbnail(path, module=None, size=THUMB_SIZE, closure=None):
+    """
+    Look up a thumbnail without rendering.
+    Returns (key, png_path or None, failed) - failed is True if an earlier
+    render produced nothing, so there is no point queueing it.
+    """
+    key = thumbnail_key(path, module, size, closure)
+    png = _key_path(key, ".png")
+    if os.path.isfile(png):
+        return key, png, False
+    return key, None, os.path.isfile(_key_path(key, ".fail"))
+
+
+# ------------------------------------------------
+# Rendering
+# ------------------------------------------------
+
+def _openscad_executable():
+    import FreeCAD
+    exe = FreeCAD.ParamGet(
+        "User parameter:BaseApp/Preferences/Mod/OpenSCAD"
+    ).GetString("openscadexecutable")
+    return exe if exe and os.path.isfile(exe) else None
+
+
+def thumbnails_available():
+    """True if OpenSCAD is configured, i.e. misses can be rendered."""
+    return _openscad_executable() is not None
+
+
+def _run_low_priority(cmd, timeout):
+    """Run *cmd* below normal priority; return (returncode, stderr text)."""
+    kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    p = subprocess.Popen(cmd, **kwargs)
+    if hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, p.pid, 10)
+        except OSError:
+            pass
+    try:
+        _, stderr = p.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        p.kill()
+        p.communicate()
+        return -1, f"timed out after {timeout} secs"
+    return p.returncode, stderr.decode("utf8", "replace")
+
+
+def render_thumbnail(path, module=None, size=THUMB_SIZE, key=None):
+    """
+    Render a thumbnail into the cache (blocking).
+    Returns the PNG path, or None if OpenSCAD produced no image.
+    """
+    exe = _openscad_executable()
+    if exe is None:
+        write_log("Thumbnail", "OpenSCAD executable unavailable")
+        return None
+    if key is None:
+        key = thumbnail_key(path, module, size)
+    png = _key_path(key, ".png")
+    os.makedirs(os.path.dirname(png), exist_ok=True)
+
+    wrapper = None
+    source = path
+    if module:
+        fd, wrapper = tempfile.mkstemp(suffix=".scad")
+        with os.fdopen(fd, "w") as f:
+            f.write("use <%s>\n%s();\n" % (os.path.abspath(path).replace("\\", "/"), module))
+        source = wrapper
+
+    fd, tmp_png = tempfile.mkstemp(suffix=".png", dir=os.path.dirname(png))
+    os.close(fd)
+    cmd = [
+        exe, "--render",
+        "--imgsize=%d,%d" % size,
+        "--viewall", "--autocenter",
+        "-o", tmp_png, source,
+    ]
+    try:
+        code, stderr = _run_low_priority(cmd, RENDER_TIMEOUT)
+        if code == 0 and os.path.getsize(tmp_png) > 0:
+            os.replace(tmp_png, png)
+            return png
+        what = f"{os.path.basename(path)}" + (f" {module}()" if module else "")
+        write_log("Thumbnail", f"No thumbnail for {what}: {stderr.strip()[-200:]}")
+        open(_key_path(key, ".fail"), "w").close()
+        return None
+    finally:
+        for tmp in (tmp_png, wrapper):
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+
+
+# ------------------------------------------------
+# Background queue
+# ------------------------------------------------
+
+class ThumbnailQueue:
+    """
+    Render thumbnails in the background, at most *workers* OpenSCAD
+    processes at a time.
+
+    request() takes the key from cached_thumbnail(); the same key is only
+    queued once.  The newest request is rendered first, so the file the user
+    is looking at now wins over ones clicked past.  *callback(path, module,
+    png_or_None)* is called from a worker thread.
+    """
+
+    def __init__(self, callback, workers=2, size=THUMB_SIZE):
+        self._callback = callback
+        self._size = size
+        self._pending = OrderedDict()   # key -> (path, module)
+        self._running = set()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._threads = [
+            threading.Thread(target=self._run, name=f"scad-thumb-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def request(self, key, path, module=None):
+        with self._cond:
+            if key in self._running:
+                return
+            self._pending.pop(key, None)
+            self._pending[key] = (path, module)
+            while len(self._pending) > _MAX_PENDING:
+                self._pending.popitem(last=False)
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                key, (path, module) = self._pending.popitem(last=True)
+                self._running.add(key)
+            try:
+                png = render_thumbnail(path, module, self._size, key=key)
+            except Exception as e:
+                write_log("Thumbnail", f"Render failed for {path}: {e}")
+                png = None
+            finally:
+                with self._cond:
+                    self._running.discard(key)
+            if not self._stopped:
+                self._callback(path, module, png)
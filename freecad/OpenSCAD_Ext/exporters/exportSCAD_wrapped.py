@@ -30,6 +30,7 @@ __title__ = "FreeCAD OpenSCAD Workbench - CSG exporter Version"
 __author__ = "Keith Sloan <keith@sloan-home.co.uk>"
 __url__ = ["http://www.sloan-home.co.uk/Export/Export.html"]
 
+import itertools
 import math
 import re
 from contextlib import contextmanager
@@ -38,6 +39,7 @@ from typing import Sequence
 
 import FreeCAD
 import Part
+import numpy as np
 
 if FreeCAD.GuiUp:
     gui = True
@@ -56,6 +58,8 @@ fs = params.GetFloat('exportFs', 2.0)
 conv = params.GetInt('exportConvexity', 10)
 # TODO: parameters for SIGNIFICANT_DIGITS and other decisions (and fn?)
 
+MESH_CHUNK = 50000  # polyhedron rows formatted per file write
+
 #***************************************************************************
 # Radius values not fixed for value apart from cylinder & Cone
 # no doubt there will be a problem when they do implement Value
@@ -70,25 +74,28 @@ def writer(filename):
         def write(s: str):
             nonlocal level
             nonlocal next_indentation
-            new_s = ""  # todo: use join (more efficient than constructing a new str in each loop iteration)
+            new_s = []
             for c in str(s):
                 if c == "\n":
                     next_indentation = step * level
-                    new_s += c
+                    new_s.append(c)
                 else:
                     if c == "{":
                         level += 1
-                        new_s += next_indentation
+                        new_s.append(next_indentation)
                     elif c == "}":
                         level -= 1
                         if next_indentation:
-                            new_s += (step * level)
+                            new_s.append(step * level)
                     else:
-                        new_s += next_indentation
-                    new_s += c
+                        new_s.append(next_indentation)
+                    new_s.append(c)
                     next_indentation = ""
-            f.write(new_s)
+            f.write("".join(new_s))
 
+        # Bulk data (polyhedron points / faces) bypasses the indentation
+        # scan; it must end with a newline so indentation resumes after it.
+        write.raw = f.write
         yield write
     finally:
         f.close()
@@ -226,21 +233,71 @@ def placement(write, ob, x, y, z):
     #     write("}\n")  # TODO: Do we actually need the braces?
 
 
+def mesh_arrays(mesh):
+    """(points, triangles) of a Mesh as (N, 3) float and (M, 3) int arrays"""
+    points, facets = mesh.Topology
+    pts = np.fromiter(itertools.chain.from_iterable(points), dtype=np.float64,
+                      count=3 * len(points)).reshape(-1, 3)
+    del points
+    tris = np.fromiter(itertools.chain.from_iterable(facets), dtype=np.int64,
+                       count=3 * len(facets)).reshape(-1, 3)
+    return pts, tris
+
+
+def write_rows(raw, rows, row_fmt):
+    """Write the rows of a 2D array as OpenSCAD vectors, MESH_CHUNK rows per write"""
+    n = len(rows)
+    for start in range(0, n, MESH_CHUNK):
+        chunk = rows[start:start + MESH_CHUNK]
+        # one format operation per chunk instead of one per row
+        raw(",\n".join([row_fmt] * len(chunk)) % tuple(chunk.ravel().tolist()))
+        raw(",\n" if start + MESH_CHUNK < n else "\n")
+
+
+def write_polyhedron(write, pts, tris, comment=""):
+    """Stream a polyhedron to the file; memory use is bounded by MESH_CHUNK"""
+    write("polyhedron(points=[\n")
+    write_rows(write.raw, pts, "  [%f, %f, %f]")
+    # avoiding deprecation warning by using faces rather than triangles
+    write("], faces=[\n")
+    write_rows(write.raw, tris, "  [%d, %d, %d]")
+    write(f"]);{'  // ' + comment if comment else ''}\n")
+
+
 def mesh2polyhedron(mesh):
-    pointstr = ', '.join(['[%f, %f, %f]' % tuple(vec) for vec in mesh.Topology[0]])
-    trianglestr = ', '.join(['[%d, %d, %d]' % tuple(tri) for tri in mesh.Topology[1]])
-    # avoiding deprecation warning by changing triangles to faces
-    #return 'polyhedron ( points = [%s], triangles = [%s]);' % (pointstr, trianglestr)
-    return 'polyhedron(points=[%s], faces=[%s]);' % (pointstr, trianglestr)
+    """The polyhedron of a Mesh as one string; export() streams instead"""
+    import io
+    out = io.StringIO()
+
+    def write(s):
+        out.write(s)
+    write.raw = out.write
+    write_polyhedron(write, *mesh_arrays(mesh))
+    return out.getvalue()
 
 
 def vector2d(v):
     return [v[0], v[1]]
 
 
-def shape2polyhedron(shape):
+# Tessellations made during one export(), so objects sharing a shape
+# (links, arrays of the same part) are meshed once
+_mesh_cache = {}
+
+
+def shape_mesh_arrays(shape):
+    """Mesh arrays of *shape* in its own coordinates (placement excluded)"""
     import MeshPart
-    return mesh2polyhedron(MeshPart.meshFromShape(Shape=shape, Deflection=params.GetFloat('meshdeflection', 0.0)))
+    deflection = params.GetFloat('meshdeflection', 0.0)
+    placement = shape.Placement
+    shape.Placement = FreeCAD.Placement()  # the caller writes the placement
+    try:
+        key = (shape.hashCode(), deflection)
+        if key not in _mesh_cache:
+            _mesh_cache[key] = mesh_arrays(MeshPart.meshFromShape(Shape=shape, Deflection=deflection))
+    finally:
+        shape.Placement = placement
+    return _mesh_cache[key]
 
 
 def process_object(write, ob):
@@ -619,7 +676,7 @@ def process_object(write, ob):
     elif ob.isDerivedFrom('Part::Feature'):
         print("Part::Feature", ob.Name)  # TODO: Handle that the base object of BezCurve, BSpline and Wire has been changed to Part::FeaturePython.
         with placement(write, ob, 0, 0, 0):
-            write(f"{shape2polyhedron(ob.Shape)}  // {ob.Label}: mesh fallback.\n")
+            write_polyhedron(write, *shape_mesh_arrays(ob.Shape), comment=f"{ob.Label}: mesh fallback.")
 
     else:
         # TODO: Compound
@@ -671,6 +728,7 @@ def export(export_list, filename):
     # process Objects
     print("\nStart Export 0.1d\n")
     print("Open Output File")
+    _mesh_cache.clear()
     with writer(filename) as write:
         print("Write Initial Output")
         # Not sure if comments as per scad are allowed in csg file
@@ -678,15 +736,13 @@ def export(export_list, filename):
         write(f"$fn = 0;\n$fa = {fa};\n$fs = {fs};\n")
         write(f"$convexity = {conv};\n\n")
         for ob in export_list:
-            print(ob)
             print("Name : " + ob.Name)
             print("Type : " + ob.TypeId)
             if ob.Visibility:
-                print("Shape : ")
-                print(ob.Shape)
                 process_object(write, ob)
                 write("\n")
             else:
                 print(f"{ob.Name} is invisible. Skipping")
+    _mesh_cache.clear()
 
     FreeCAD.Console.PrintMessage("Successfully exported" + " " + filename)
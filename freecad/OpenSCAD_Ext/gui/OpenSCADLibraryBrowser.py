@@ -1,10 +1,12 @@
 import os
+import threading
+import time
 from pathlib import Path
 import FreeCAD
 import FreeCADGui
 from PySide import QtWidgets
-from PySide.QtCore import QSize
-from PySide.QtGui import QBrush, QColor
+from PySide.QtCore import QObject, QSize, Qt, QTimer, Signal
+from PySide.QtGui import QIcon, QPixmap
 
 from freecad.OpenSCAD_Ext.libraries.ensure_openSCADPATH import ensure_openSCADPATH
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
@@ -12,21 +14,21 @@ from freecad.OpenSCAD_Ext.core.create_scad_object import create_scad_object
 from freecad.OpenSCAD_Ext.core.exporters import export_variables
 from freecad.OpenSCAD_Ext.core.varset_utils import create_module_varsets, create_toplevel_varset
 from freecad.OpenSCAD_Ext.core.attach_varset import attach_customizer_varset
+from freecad.OpenSCAD_Ext.core.scad_thumbnails import (
+    ThumbnailQueue, cached_thumbnail, thumbnails_available,
+)
 from freecad.OpenSCAD_Ext.gui.OpenSCADeditOptions import OpenSCADeditOptions
 
 # Lark-based scanner – single import for all metadata needs
-from freecad.OpenSCAD_Ext.parsers.scadmeta import scan_scad_file, ScadFileType
+from freecad.OpenSCAD_Ext.parsers.scadmeta import (
+    scan_scad_file, scan_scad_directory, ScadFileType,
+)
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_index import get_symbol_index
 from freecad.OpenSCAD_Ext.gui.SCAD_Module_Dialog import SCAD_Module_Dialog
+from freecad.OpenSCAD_Ext.gui.library_tree_model import LibraryTreeModel, MetaLoader
 
 # Display helpers: labels, colours, icons
-from freecad.OpenSCAD_Ext.gui.scad_type_display import (
-    FILE_TYPE_LABELS,
-    FILE_TYPE_TIPS,
-    DIR_COLOUR,
-    get_file_type_icon,
-    get_dir_icon,
-    get_file_type_color,
-)
+from freecad.OpenSCAD_Ext.gui.scad_type_display import FILE_TYPE_LABELS
 
 
 # ---------------------------------------------------------------------------
@@ -71,6 +73,18 @@ class _VarPreviewDialog(QtWidgets.QDialog):
         layout.addWidget(btns)
 
 
+# ---------------------------------------------------------------------------
+# Thumbnail results (worker thread -> GUI thread)
+# ---------------------------------------------------------------------------
+
+class _ThumbnailSignals(QObject):
+    ready = Signal(str, str, str)   # path, module ("" = file), png ("" = none)
+
+
+# Module thumbnails shown for one file at most
+MAX_MODULE_THUMBNAILS = 48
+
+
 # ---------------------------------------------------------------------------
 # Main browser dialog
 # ---------------------------------------------------------------------------
@@ -83,21 +97,24 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
     the scadmeta file-type classification.  Each SCAD file is scanned for
     metadata (modules, functions, variables) using the Lark-based scanner.
 
+    The tree is a lazy :class:`LibraryTreeModel`: folders are listed when
+    expanded and file rows show placeholders until the background
+    :class:`MetaLoader` delivers their metadata.
+
     Caching strategy
     ----------------
     A session-level dict ``_meta_cache`` stores ``(mtime, ScadMeta)`` pairs so
     that repeated accesses within one dialog session are cheap.  Before
     returning a cached result the file's mtime is compared.  If it has changed
     the session entry is discarded and ``scan_scad_file()`` is called again,
-    which in turn validates against the TinyDB persistent cache via SHA-256 and
+    which in turn validates against the SQLite persistent cache via SHA-256 and
     re-parses only when the content has actually changed.
     """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("OpenSCAD Library Browser")
-        self.resize(820, 560)
-        self.selected_item = None
+        self.resize(1000, 560)
         self.selected_scad = None
         self.selected_dir = None
 
@@ -105,6 +122,22 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
         self._meta_cache: dict = {}
         self._root_path = None
 
+        # background library scan feeding the symbol index
+        self._index_thread = None
+        self._index_stop = threading.Event()
+
+        # thumbnails: (path, module) -> preview list item of the current file
+        self._thumb_items: dict = {}
+        self._thumb_signals = _ThumbnailSignals(self)
+        self._thumb_signals.ready.connect(self._on_thumbnail_ready)
+        self._thumbs = None
+        if thumbnails_available():
+            self._thumbs = ThumbnailQueue(
+                lambda path, module, png: self._thumb_signals.ready.emit(
+                    path, module or "", png or ""),
+                workers=2,
+            )
+
         self._setup_ui()
         self._populate_tree()
 
@@ -128,17 +161,71 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
         nav_layout.addWidget(self.path_label, 1)
         layout.addLayout(nav_layout)
 
+        # Symbol search – debounced, results replace the tree while non-empty
+        self.search_edit = QtWidgets.QLineEdit()
+        self.search_edit.setPlaceholderText("Search modules, functions and variables in all libraries")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self._on_search_changed)
+        layout.addWidget(self.search_edit)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._run_search)
+
+        self._index_poll = QTimer(self)
+        self._index_poll.setInterval(500)
+        self._index_poll.timeout.connect(self._check_index_thread)
+
+        # Search results – columns: Symbol | Kind | File | Line
+        self.results = QtWidgets.QTreeWidget()
+        self.results.setHeaderLabels(["Symbol", "Kind", "File", "Line"])
+        self.results.setColumnWidth(0, 300)
+        self.results.setColumnWidth(1, 80)
+        self.results.setColumnWidth(2, 330)
+        self.results.setRootIsDecorated(False)
+        self.results.itemClicked.connect(self._on_result_clicked)
+        self.results.hide()
+        browse = QtWidgets.QWidget()
+        browse_layout = QtWidgets.QVBoxLayout(browse)
+        browse_layout.setContentsMargins(0, 0, 0, 0)
+        browse_layout.addWidget(self.results)
+
         # Tree – columns: Name | Type | Mods | Funcs | Vars
-        self.tree = QtWidgets.QTreeWidget()
-        self.tree.setHeaderLabels(["Name", "File Type", "Mods", "Funcs", "Vars"])
+        self._loader = MetaLoader(self)
+        self._loader.loaded.connect(self._on_meta_loaded)
+        self.finished.connect(self._loader.stop)
+        self.finished.connect(self._stop_thumbnails)
+        self.finished.connect(self._index_stop.set)
+        self._model = LibraryTreeModel(self._loader, self)
+
+        self.tree = QtWidgets.QTreeView()
+        self.tree.setModel(self._model)
+        self.tree.setUniformRowHeights(True)
         self.tree.setColumnWidth(0, 380)
         self.tree.setColumnWidth(1, 130)
         self.tree.setColumnWidth(2, 50)
         self.tree.setColumnWidth(3, 50)
         self.tree.setColumnWidth(4, 50)
         self.tree.setIconSize(QSize(16, 16))
-        self.tree.itemClicked.connect(self._on_item_clicked)
-        layout.addWidget(self.tree)
+        self.tree.clicked.connect(self._on_item_clicked)
+        browse_layout.addWidget(self.tree)
+
+        # Preview – rendered thumbnails of the file and its modules
+        self.preview = QtWidgets.QListWidget()
+        self.preview.setViewMode(QtWidgets.QListView.IconMode)
+        self.preview.setIconSize(QSize(128, 128))
+        self.preview.setResizeMode(QtWidgets.QListView.Adjust)
+        self.preview.setMovement(QtWidgets.QListView.Static)
+        self.preview.setWordWrap(True)
+        self.preview.setMinimumWidth(160)
+
+        splitter = QtWidgets.QSplitter(Qt.Horizontal)
+        splitter.addWidget(browse)
+        splitter.addWidget(self.preview)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+        layout.addWidget(splitter)
 
         # Action buttons
         btn_layout = QtWidgets.QHBoxLayout()
@@ -179,77 +266,16 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
     # Tree population
     # ------------------------------------------------------------------
 
-    def _populate_tree(self, path=None, parent_item=None):
-        """Populate the tree starting at *path* (defaults to OPENSCADPATH root)."""
+    def _populate_tree(self, path=None):
+        """Show the tree rooted at *path* (defaults to OPENSCADPATH root)."""
         if path is None:
             path = ensure_openSCADPATH()
             self._root_path = path
             self.path_label.setText(path)
             write_log("Info", f"Displaying SCAD library directory: {path}")
 
-        try:
-            entries = os.listdir(path)
-        except Exception as exc:
-            write_log("Error", f"Cannot list folder {path}: {exc}")
-            return
-
-        dir_icon = get_dir_icon()
-
-        for name in sorted(entries):
-            if name.startswith("."):
-                continue
-            full_path = os.path.join(path, name)
-
-            if os.path.isdir(full_path):
-                item = QtWidgets.QTreeWidgetItem([name, "Directory", "", "", ""])
-                if dir_icon:
-                    item.setIcon(0, dir_icon)
-                item.setForeground(1, QBrush(QColor(DIR_COLOUR)))
-                item.full_path = full_path
-                _add_to_tree(self.tree, parent_item, item)
-
-            elif name.lower().endswith(".scad"):
-                item = self._make_scad_item(name, full_path)
-                _add_to_tree(self.tree, parent_item, item)
-
-    def _make_scad_item(self, name: str, full_path: str) -> QtWidgets.QTreeWidgetItem:
-        """Build a decorated tree item for a single SCAD file."""
-        meta = self._get_meta(full_path)
-        label = FILE_TYPE_LABELS.get(meta.file_type, "SCAD File")
-        tip   = FILE_TYPE_TIPS.get(meta.file_type, "")
-        icon  = get_file_type_icon(meta.file_type)
-        color = get_file_type_color(meta.file_type)
-
-        mod_count = str(meta.module_count)   if meta.module_count   else ""
-        fn_count  = str(meta.function_count) if meta.function_count else ""
-        var_count = str(len(meta.variables)) if meta.variables      else ""
-
-        item = QtWidgets.QTreeWidgetItem([name, label, mod_count, fn_count, var_count])
-        if icon:
-            item.setIcon(1, icon)
-        if color:
-            item.setForeground(1, QBrush(color))
-        item.setToolTip(1, tip)
-        item.full_path = full_path
-        return item
-
-    def _refresh_item_display(self, item: QtWidgets.QTreeWidgetItem, full_path: str):
-        """Refresh the visual state of a tree row after a re-scan."""
-        meta  = self._get_meta(full_path)
-        label = FILE_TYPE_LABELS.get(meta.file_type, "SCAD File")
-        tip   = FILE_TYPE_TIPS.get(meta.file_type, "")
-        icon  = get_file_type_icon(meta.file_type)
-        color = get_file_type_color(meta.file_type)
-
-        item.setText(1, label)
-        item.setText(2, str(meta.module_count)   if meta.module_count   else "")
-        item.setText(3, str(meta.function_count) if meta.function_count else "")
-        item.setText(4, str(len(meta.variables)) if meta.variables      else "")
-        if icon:
-            item.setIcon(1, icon)
-        if color:
-            item.setForeground(1, QBrush(color))
-        item.setToolTip(1, tip)
+        # rows are listed by the model when the view asks for them
+        self._model.set_root(path)
 
     # ------------------------------------------------------------------
     # Session-level metadata cache (mtime-aware)
@@ -264,7 +290,7 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
 
         * Re-clicking an unchanged file → dict lookup only (free).
         * File modified while browser is open → session entry discarded,
-          ``scan_scad_file()`` called (which validates TinyDB via hash).
+          ``scan_scad_file()`` called (which validates the persistent cache via hash).
         """
         try:
             current_mtime = os.path.getmtime(path)
@@ -282,11 +308,15 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
                 f"{os.path.basename(path)}")
             del self._meta_cache[path]
 
-        # scan_scad_file() checks TinyDB (mtime then SHA-256) before parsing
+        # scan_scad_file() checks the persistent cache (mtime then SHA-256) before parsing
         meta = scan_scad_file(path)
         self._meta_cache[path] = (current_mtime, meta)
         return meta
 
+    def _on_meta_loaded(self, path: str, mtime: float, meta):
+        """Keep background-loaded metadata for clicks on the row."""
+        self._meta_cache.setdefault(path, (mtime, meta))
+
     def _invalidate_session_cache(self, path: str):
         """Remove *path* from the session cache so the next access re-scans."""
         self._meta_cache.pop(path, None)
@@ -297,13 +327,13 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
 
     def _navigate_up(self):
         """Navigate to the parent of the currently selected tree item."""
-        current = self.tree.currentItem()
-        if current is None:
+        current = self.tree.currentIndex()
+        if not current.isValid():
             return
         parent = current.parent()
-        if parent is not None:
-            self.tree.setCurrentItem(parent)
-            self._on_item_clicked(parent, 0)
+        if parent.isValid():
+            self.tree.setCurrentIndex(parent)
+            self._on_item_clicked(parent)
         else:
             # Current item is a top-level directory — go back to root view
             self.tree.clearSelection()
@@ -321,20 +351,20 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
     # Item click handler
     # ------------------------------------------------------------------
 
-    def _on_item_clicked(self, item, column):
-        self.selected_item = item
-        if not hasattr(item, "full_path"):
+    def _on_item_clicked(self, index):
+        full_path = self._model.full_path(index)
+        if full_path is None:
             return
-
-        full_path = item.full_path
+        index = index.sibling(index.row(), 0)
 
         # Enable Up button whenever the selected path is not the root
         self.up_btn.setEnabled(full_path != self._root_path)
         self.path_label.setText(full_path)
 
-        if os.path.isdir(full_path):
-            item.takeChildren()
-            self._populate_tree(path=full_path, parent_item=item)
+        if self._model.is_dir(index):
+            # list the folder again, picking up files added since
+            self._model.reload(index)
+            self.tree.expand(index)
             self.selected_dir = full_path
             self.selected_scad = None
             self.create_btn.setEnabled(False)
@@ -342,28 +372,172 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
             self.scan_btn.setEnabled(False)
             self.refresh_btn.setEnabled(False)
             self.status.setText(f"Directory: {full_path}")
+            self._show_thumbnails(None, None)
 
         elif full_path.lower().endswith(".scad"):
-            self.selected_scad = full_path
-            self.selected_dir = None
+            self._select_scad(full_path)
+
+    def _select_scad(self, full_path: str):
+        """Make *full_path* the current SCAD file and update buttons / status."""
+        self.selected_scad = full_path
+        self.selected_dir = None
 
-            meta = self._get_meta(full_path)
-            has_modules   = meta.module_count > 0
-            has_variables = bool(meta.variables)
+        meta = self._get_meta(full_path)
+        has_modules   = meta.module_count > 0
+        has_variables = bool(meta.variables)
 
-            self.create_btn.setEnabled(True)
-            self.extract_btn.setEnabled(has_modules or has_variables)
-            self.scan_btn.setEnabled(has_modules)
-            self.refresh_btn.setEnabled(True)
+        self.create_btn.setEnabled(True)
+        self.extract_btn.setEnabled(has_modules or has_variables)
+        self.scan_btn.setEnabled(has_modules)
+        self.refresh_btn.setEnabled(True)
 
-            label = FILE_TYPE_LABELS.get(meta.file_type, "?")
-            self.status.setText(
-                f"{os.path.basename(full_path)}  "
-                f"[{label}]  "
-                f"mods={meta.module_count}  "
-                f"funcs={meta.function_count}  "
-                f"vars={len(meta.variables)}"
-            )
+        label = FILE_TYPE_LABELS.get(meta.file_type, "?")
+        self.status.setText(
+            f"{os.path.basename(full_path)}  "
+            f"[{label}]  "
+            f"mods={meta.module_count}  "
+            f"funcs={meta.function_count}  "
+            f"vars={len(meta.variables)}"
+        )
+        self._show_thumbnails(full_path, meta)
+
+    # ------------------------------------------------------------------
+    # Thumbnails
+    # ------------------------------------------------------------------
+
+    def _show_thumbnails(self, path: str, meta):
+        """
+        Fill the preview with the file's thumbnail (models only) and one per
+        module.  Cached images show at once, misses are queued for rendering.
+        """
+        self.preview.clear()
+        self._thumb_items.clear()
+        if path is None:
+            return
+
+        wanted = []
+        if meta.file_type in (ScadFileType.PURE_SCAD, ScadFileType.CUSTOMIZER):
+            wanted.append((None, os.path.basename(path)))
+        for mod in meta.modules[:MAX_MODULE_THUMBNAILS]:
+            wanted.append((mod.name, f"{mod.name}()"))
+        if not wanted:
+            return
+
+        from freecad.OpenSCAD_Ext.parsers.scadmeta import closure_hash
+        try:
+            closure = closure_hash(path)
+        except Exception as exc:
+            write_log("Thumbnail", f"closure hash failed for {path}: {exc}")
+            return
+
+        misses = []
+        for module, label in wanted:
+            key, png, failed = cached_thumbnail(path, module, closure=closure)
+            item = QtWidgets.QListWidgetItem(label)
+            item.setToolTip(label)
+            if png:
+                item.setIcon(QIcon(QPixmap(png)))
+            elif failed or self._thumbs is None:
+                item.setText(f"{label}\n(no preview)")
+            else:
+                item.setText(f"{label}\n(rendering…)")
+                misses.append((key, module))
+            self.preview.addItem(item)
+            self._thumb_items[(path, module or "")] = (item, label)
+
+        # newest request renders first, queue in reverse to keep list order
+        for key, module in reversed(misses):
+            self._thumbs.request(key, path, module)
+
+    def _on_thumbnail_ready(self, path: str, module: str, png: str):
+        entry = self._thumb_items.get((path, module))
+        if entry is None:
+            return   # a different file is shown now, the PNG stays cached
+        item, label = entry
+        if png:
+            item.setIcon(QIcon(QPixmap(png)))
+            item.setText(label)
+        else:
+            item.setText(f"{label}\n(no preview)")
+
+    def _stop_thumbnails(self):
+        if self._thumbs is not None:
+            self._thumbs.stop()
+
+    # ------------------------------------------------------------------
+    # Symbol search
+    # ------------------------------------------------------------------
+
+    def _on_search_changed(self, text):
+        searching = bool(text.strip())
+        self.results.setVisible(searching)
+        self.tree.setVisible(not searching)
+        if searching:
+            self._start_indexing()
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+            self.results.clear()
+            self.status.setText("")
+
+    def _start_indexing(self):
+        """
+        Scan every library under OPENSCADPATH once in the background so that
+        files never opened in the browser are searchable too.  Cached files
+        are cache hits; new results reach the index through the cache.
+        """
+        if self._index_thread is not None:
+            return
+
+        def work():
+            get_symbol_index().load()
+            for root in ensure_openSCADPATH().split(os.pathsep):
+                if self._index_stop.is_set():
+                    return
+                if os.path.isdir(root):
+                    scan_scad_directory(root, recursive=True, workers=None,
+                                        stop=self._index_stop)
+
+        self._index_thread = threading.Thread(target=work, name="scad-index", daemon=True)
+        self._index_thread.start()
+        self._index_poll.start()
+
+    def _check_index_thread(self):
+        if self._index_thread is not None and not self._index_thread.is_alive():
+            self._index_poll.stop()
+            if self.search_edit.text().strip():
+                self._run_search()
+
+    def _run_search(self):
+        query = self.search_edit.text().strip()
+        if not query:
+            return
+        start = time.perf_counter()
+        matches = get_symbol_index().search(query, limit=200)
+        elapsed = (time.perf_counter() - start) * 1000.0
+
+        self.results.clear()
+        for sym in matches:
+            signature = f"{sym.name}({sym.params})" if sym.kind != "variable" else sym.name
+            item = QtWidgets.QTreeWidgetItem([
+                signature, sym.kind, os.path.basename(sym.path),
+                str(sym.line) if sym.line else "",
+            ])
+            item.setToolTip(0, sym.description or signature)
+            item.setToolTip(2, sym.path)
+            item.full_path = sym.path
+            self.results.addTopLevelItem(item)
+
+        indexing = self._index_thread is not None and self._index_thread.is_alive()
+        self.status.setText(
+            f"{len(matches)} match{'es' if len(matches) != 1 else ''} "
+            f"in {elapsed:.1f} ms" + ("  (indexing libraries…)" if indexing else "")
+        )
+
+    def _on_result_clicked(self, item, column):
+        self.up_btn.setEnabled(False)
+        self.path_label.setText(item.full_path)
+        self._select_scad(item.full_path)
 
     # ------------------------------------------------------------------
     # Button actions
@@ -487,7 +661,7 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
         # Drop session cache entry
         self._invalidate_session_cache(path)
 
-        # Drop TinyDB persistent cache entry
+        # Drop persistent cache entry
         try:
             from freecad.OpenSCAD_Ext.parsers.scadmeta import get_cache
             get_cache().invalidate(path)
@@ -504,8 +678,7 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
         self._meta_cache[path] = (mtime, meta)
 
         # Refresh the tree row
-        if self.selected_item and hasattr(self.selected_item, "full_path"):
-            self._refresh_item_display(self.selected_item, path)
+        self._model.set_meta(path, meta)
 
         label = FILE_TYPE_LABELS.get(meta.file_type, "?")
         self.status.setText(
@@ -518,14 +691,5 @@ class OpenSCADLibraryBrowser(QtWidgets.QDialog):
         # Update button states after refresh
         self.extract_btn.setEnabled(meta.module_count > 0 or bool(meta.variables))
         self.scan_btn.setEnabled(meta.module_count > 0)
+        self._show_thumbnails(path, meta)
 
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _add_to_tree(tree: QtWidgets.QTreeWidget, parent, item):
-    if parent:
-        parent.addChild(item)
-    else:
-        tree.addTopLevelItem(item)
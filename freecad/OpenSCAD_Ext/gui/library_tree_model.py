@@ -0,0 +1,319 @@
+"""
+Lazy item model for the OpenSCAD Library Browser tree.
+
+Directories are listed only when Qt asks for their children
+(``canFetchMore`` / ``fetchMore``), and SCAD rows appear immediately with
+placeholder type / count columns.  A :class:`MetaLoader` thread fills them
+in from the metadata cache (or a parse) and hands each result back through
+a queued signal, so opening a large folder never waits on the scanner.
+
+Columns: Name | File Type | Mods | Funcs | Vars
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+from PySide.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt, Signal
+from PySide.QtGui import QBrush, QColor
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.parsers.scadmeta import scan_scad_files
+from freecad.OpenSCAD_Ext.gui.scad_type_display import (
+    FILE_TYPE_LABELS,
+    FILE_TYPE_TIPS,
+    DIR_COLOUR,
+    get_file_type_icon,
+    get_dir_icon,
+    get_file_type_color,
+)
+
+COLUMNS = ["Name", "File Type", "Mods", "Funcs", "Vars"]
+PLACEHOLDER = "…"
+
+# files handed to scan_scad_files() at a time, results are emitted per file
+_BATCH = 32
+
+
+# ---------------------------------------------------------------------------
+# Background metadata loader
+# ---------------------------------------------------------------------------
+
+class MetaLoader(QObject):
+    """
+    Worker thread turning SCAD paths into :class:`ScadMeta`.
+
+    ``request()`` may be called from the GUI thread at any time; the most
+    recent request is served first, so the folder the user just opened
+    fills in before ones expanded earlier.  ``loaded`` is emitted from the
+    worker thread and delivered to GUI-thread receivers as a queued call.
+    """
+
+    loaded = Signal(str, float, object)   # path, mtime, ScadMeta
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: deque = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="scad-meta-loader", daemon=True)
+        self._thread.start()
+
+    def request(self, paths: List[str]) -> None:
+        if not paths:
+            return
+        batches = [paths[i:i + _BATCH] for i in range(0, len(paths), _BATCH)]
+        with self._cond:
+            self._pending.extendleft(reversed(batches))
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                batch = self._pending.popleft()
+            try:
+                metas = scan_scad_files(batch)
+            except Exception as exc:
+                write_log("Error", f"[LibraryBrowser] metadata load failed: {exc}")
+                continue
+            for path, meta in zip(batch, metas):
+                if self._stopped:
+                    return
+                try:
+                    mtime = os.path.getmtime(path)
+                except OSError:
+                    mtime = 0.0
+                self.loaded.emit(path, mtime, meta)
+
+
+# ---------------------------------------------------------------------------
+# Tree model
+# ---------------------------------------------------------------------------
+
+class _Node:
+    __slots__ = ("name", "path", "is_dir", "parent", "row", "children", "fetched", "meta")
+
+    def __init__(self, name: str, path: str, is_dir: bool,
+                 parent: Optional["_Node"], row: int = 0):
+        self.name = name
+        self.path = path
+        self.is_dir = is_dir
+        self.parent = parent
+        self.row = row
+        self.children: List["_Node"] = []
+        self.fetched = not is_dir
+        self.meta = None
+
+
+class LibraryTreeModel(QAbstractItemModel):
+    """
+    Directory / SCAD file tree under one root folder.
+
+    ``full_path(index)`` gives the path of a row; ``set_meta()`` updates a
+    file row after an explicit re-scan.
+    """
+
+    def __init__(self, loader: MetaLoader, parent=None):
+        super().__init__(parent)
+        self._loader = loader
+        self._root = _Node("", "", True, None)
+        self._files: Dict[str, _Node] = {}
+        self._dir_icon = get_dir_icon()
+        loader.loaded.connect(self._on_loaded)
+
+    # ------------------------------------------------------------------
+    # Root / lookup
+    # ------------------------------------------------------------------
+
+    def set_root(self, path: str) -> None:
+        self.beginResetModel()
+        self._root = _Node(os.path.basename(path), path, True, None)
+        self._files.clear()
+        self.endResetModel()
+
+    def root_path(self) -> str:
+        return self._root.path
+
+    def _node(self, index: QModelIndex) -> _Node:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def full_path(self, index: QModelIndex) -> Optional[str]:
+        return self._node(index).path if index.isValid() else None
+
+    def is_dir(self, index: QModelIndex) -> bool:
+        return self._node(index).is_dir
+
+    def meta(self, index: QModelIndex):
+        return self._node(index).meta
+
+    def set_meta(self, path: str, meta) -> None:
+        node = self._files.get(path)
+        if node is None:
+            return
+        node.meta = meta
+        row = node.row
+        self.dataChanged.emit(
+            self.createIndex(row, 1, node), self.createIndex(row, len(COLUMNS) - 1, node)
+        )
+
+    def _on_loaded(self, path: str, mtime: float, meta) -> None:
+        self.set_meta(path, meta)
+
+    def reload(self, index: QModelIndex) -> None:
+        """Forget the children of a directory row so they are listed again."""
+        node = self._node(index)
+        if not node.is_dir or not node.fetched:
+            return
+        if node.children:
+            self.beginRemoveRows(index, 0, len(node.children) - 1)
+            self._forget(node)
+            node.children = []
+            self.endRemoveRows()
+        node.fetched = False
+
+    def _forget(self, node: _Node) -> None:
+        for child in node.children:
+            if child.is_dir:
+                self._forget(child)
+            else:
+                self._files.pop(child.path, None)
+
+    # ------------------------------------------------------------------
+    # Lazy population
+    # ------------------------------------------------------------------
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        return node.is_dir and (not node.fetched or bool(node.children))
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.is_dir and not node.fetched
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if not node.is_dir or node.fetched:
+            return
+        node.fetched = True
+        try:
+            with os.scandir(node.path) as it:
+                entries = sorted(
+                    (e for e in it if not e.name.startswith(".")),
+                    key=lambda e: e.name,
+                )
+        except OSError as exc:
+            write_log("Error", f"Cannot list folder {node.path}: {exc}")
+            return
+
+        children = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir or entry.name.lower().endswith(".scad"):
+                children.append(_Node(entry.name, entry.path, is_dir, node, len(children)))
+        if not children:
+            return
+
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        for child in children:
+            if not child.is_dir:
+                self._files[child.path] = child
+        self.endInsertRows()
+
+        scad_paths = [c.path for c in children if not c.is_dir]
+        if scad_paths:
+            from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_scanner import watch_scad_path
+            watch_scad_path(scad_paths[0])
+            self._loader.request(scad_paths)
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel
+    # ------------------------------------------------------------------
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(COLUMNS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        col = index.column()
+        meta = node.meta
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return node.name
+            if node.is_dir:
+                return "Directory" if col == 1 else ""
+            if meta is None:
+                return PLACEHOLDER if col == 1 else ""
+            if col == 1:
+                return FILE_TYPE_LABELS.get(meta.file_type, "SCAD File")
+            if col == 2:
+                return str(meta.module_count) if meta.module_count else ""
+            if col == 3:
+                return str(meta.function_count) if meta.function_count else ""
+            if col == 4:
+                return str(len(meta.variables)) if meta.variables else ""
+
+        elif role == Qt.DecorationRole:
+            if node.is_dir and col == 0:
+                return self._dir_icon or None
+            if meta is not None and col == 1:
+                return get_file_type_icon(meta.file_type) or None
+
+        elif role == Qt.ForegroundRole and col == 1:
+            if node.is_dir:
+                return QBrush(QColor(DIR_COLOUR))
+            if meta is not None:
+                color = get_file_type_color(meta.file_type)
+                if color:
+                    return QBrush(color)
+
+        elif role == Qt.ToolTipRole:
+            if col == 0:
+                return node.path
+            if col == 1 and meta is not None:
+                return FILE_TYPE_TIPS.get(meta.file_type, "")
+
+        return None
@@ -0,0 +1,206 @@
+# gui/scad_live_preview.py
+"""
+Live preview of a SCAD object while its VarSet is being edited.
+
+Every edit of the linked VarSet cancels the preview in flight and restarts
+two timers:
+
+    preview timer   (PreviewDelay ms)            low resolution STL render in
+                                                 the background, shown as a
+                                                 scene graph overlay
+    full timer      (PreviewFullRenderDelay ms)  the normal render at the
+                                                 object's mode and fnmax
+
+so a burst of edits renders one preview of the final values, and the full
+render only runs once the edits stop.  The overlay is plain Coin geometry,
+not a document object: no recompute, no undo entry, no TNP element map.
+"""
+
+import FreeCAD
+import FreeCADGui
+from PySide.QtCore import QObject, QTimer, Signal
+
+from freecad.OpenSCAD_Ext.core.scad_preview import PreviewRenderer, preview_settings
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+
+# VarSet properties whose change does not alter the parameters
+_IGNORED_PROPS = {"Label", "Label2", "ExpressionEngine", "Visibility", "Proxy"}
+
+PREVIEW_COLOR = (0.45, 0.65, 0.95)
+
+
+class _PreviewSignals(QObject):
+    ready = Signal(int, str, str)   # generation, stl ("" = none), error ("" = none)
+
+
+class _VarSetObserver:
+    """Document observer forwarding VarSet edits to a LivePreview."""
+
+    def __init__(self, preview):
+        self._preview = preview
+
+    def slotChangedObject(self, obj, prop):
+        self._preview.object_changed(obj, prop)
+
+    def slotDeletedObject(self, obj):
+        if obj is self._preview.fp:
+            self._preview.stop()
+
+    def slotDeletedDocument(self, doc):
+        if doc is self._preview.fp.Document:
+            self._preview.stop()
+
+
+def _mesh_node(mesh, placement):
+    """Coin separator drawing *mesh* (Mesh.Mesh) at *placement*."""
+    from pivy import coin
+
+    points, facets = mesh.Topology
+    sep = coin.SoSeparator()
+
+    transform = coin.SoTransform()
+    transform.translation.setValue(tuple(placement.Base))
+    transform.rotation.setValue(placement.Rotation.Q)
+    sep.addChild(transform)
+
+    material = coin.SoMaterial()
+    material.diffuseColor.setValue(PREVIEW_COLOR)
+    sep.addChild(material)
+
+    coords = coin.SoCoordinate3()
+    coords.point.setValues(0, len(points), [(p.x, p.y, p.z) for p in points])
+    sep.addChild(coords)
+
+    index = []
+    for a, b, c in facets:
+        index += (a, b, c, -1)
+    faces = coin.SoIndexedFaceSet()
+    faces.coordIndex.setValues(0, len(index), index)
+    sep.addChild(faces)
+    return sep
+
+
+class LivePreview:
+    """Live preview controller of one SCAD object (*fp*)."""
+
+    def __init__(self, fp):
+        self.fp = fp
+        self._fn, preview_delay, full_delay, self._backend = preview_settings()
+
+        self._signals = _PreviewSignals()
+        self._signals.ready.connect(self._on_ready)
+        self._renderer = PreviewRenderer(
+            lambda generation, stl, error: self._signals.ready.emit(
+                generation, stl or "", error or ""))
+
+        self._preview_timer = QTimer()
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(max(0, preview_delay))
+        self._preview_timer.timeout.connect(self._start_preview)
+
+        self._full_timer = QTimer()
+        self._full_timer.setSingleShot(True)
+        self._full_timer.setInterval(max(0, full_delay))
+        self._full_timer.timeout.connect(self.render_full)
+        self._auto_full = full_delay > 0
+
+        self._node = None
+        self._scene = None
+        self._hidden = []           # view objects hidden behind the overlay
+
+        self._observer = _VarSetObserver(self)
+        FreeCAD.addDocumentObserver(self._observer)
+        write_log("Preview", f"Live preview on for {fp.Label}")
+
+    # ------------------------------------------------
+    # Edits
+    # ------------------------------------------------
+
+    def object_changed(self, obj, prop):
+        if prop in _IGNORED_PROPS or self._observer is None:
+            return
+        if obj.Document is not self.fp.Document or obj.Name != getattr(self.fp, "linked_varset", ""):
+            return
+        self.edited()
+
+    def edited(self):
+        """Parameters changed: supersede the running preview and restart both timers."""
+        self._renderer.cancel()
+        self._preview_timer.start()
+        if self._auto_full:
+            self._full_timer.start()
+
+    def _start_preview(self):
+        from freecad.OpenSCAD_Ext.core.varset_utils import varset_to_D_params
+
+        varset = self.fp.Document.getObject(self.fp.linked_varset) \
+            if self.fp.linked_varset else None
+        d_params = varset_to_D_params(varset) if varset is not None else []
+        self._renderer.request(self.fp.sourceFile, d_params, self._fn, self._backend)
+
+    def _on_ready(self, generation, stl, error):
+        if generation != self._renderer.generation or self._observer is None:
+            return                  # superseded while the signal was queued
+        if error:
+            write_log("Preview", f"{self.fp.Label}: preview failed: {error}")
+            return
+        import Mesh
+        try:
+            self._show(_mesh_node(Mesh.Mesh(stl), self.fp.Placement))
+        except Exception as e:
+            write_log("Preview", f"{self.fp.Label}: cannot show preview: {e}")
+
+    # ------------------------------------------------
+    # Overlay
+    # ------------------------------------------------
+
+    def _show(self, node):
+        self._remove_overlay()
+        gui_doc = FreeCADGui.getDocument(self.fp.Document.Name)
+        view = getattr(gui_doc, "ActiveView", None) if gui_doc else None
+        if view is None or not hasattr(view, "getSceneGraph"):
+            return
+        # hide the stale full render behind the preview
+        for obj in (self.fp, self.fp.Document.getObject(getattr(self.fp, "companion_mesh", "") or "")):
+            vo = getattr(obj, "ViewObject", None) if obj is not None else None
+            if vo is not None and vo.Visibility:
+                vo.Visibility = False
+                self._hidden.append(vo)
+        self._scene = view.getSceneGraph()
+        self._scene.addChild(node)
+        self._node = node
+
+    def _remove_overlay(self):
+        if self._node is not None and self._scene is not None:
+            self._scene.removeChild(self._node)
+        self._node = self._scene = None
+        for vo in self._hidden:
+            try:
+                vo.Visibility = True
+            except Exception:
+                pass                # object deleted meanwhile
+        self._hidden = []
+
+    # ------------------------------------------------
+    # Full render / lifetime
+    # ------------------------------------------------
+
+    def clear(self):
+        """Cancel pending work and drop the overlay (a full render is starting)."""
+        self._preview_timer.stop()
+        self._full_timer.stop()
+        self._renderer.cancel()
+        self._remove_overlay()
+
+    def render_full(self):
+        """Full quality render now (also what the full timer runs)."""
+        write_log("Preview", f"{self.fp.Label}: edits settled - full render")
+        self.fp.Proxy.executeFunction(self.fp)
+
+    def stop(self):
+        if self._observer is None:
+            return
+        self.clear()
+        FreeCAD.removeDocumentObserver(self._observer)
+        self._observer = None
+        write_log("Preview", f"Live preview off for {self.fp.Label}")
@@ -0,0 +1,22 @@
+"""
+headless – tools that run under FreeCADCmd, without the GUI.
+
+    benchmark.py       import speed / memory over testcases/, with regression check
+    convert.py         batch SCAD / CSG -> BREP / STEP / STL in a worker pool
+    fake_openscad.py   OpenSCAD stand-in replaying recorded outputs
+"""
+
+import sys
+
+
+def script_args(argv=None):
+    """
+    Arguments meant for the script.  FreeCADCmd passes everything after
+    ``--pass`` through untouched, e.g.
+
+        FreeCADCmd benchmark.py --pass run -o bench.json
+    """
+    argv = list(sys.argv if argv is None else argv)
+    if "--pass" in argv:
+        return argv[argv.index("--pass") + 1:]
+    return argv[1:]
@@ -0,0 +1,436 @@
+"""
+Import benchmark over the CSG files in testcases/.
+
+Runs each ``.csg`` through the AST importer (importASTCSG) and the legacy
+Brep importer (importAltCSG) in a forked child per import, and records
+
+    wall_secs       time of processCSG (best of --repeat runs)
+    peak_rss_kb     peak resident memory of the child
+    import_rss_kb   growth of peak RSS during the import
+    booleans        boolean operations performed (AST: union / difference /
+                    intersection nodes, legacy: Part boolean features)
+    openscad_calls  OpenSCAD runs, served by fake_openscad.py from recordings
+    shapes          valid / invalid / null top-level shapes
+    categories      AST importer self time per category (import_profiler)
+
+OpenSCAD is replaced by fake_openscad.py for the run, so results do not
+depend on the installed OpenSCAD; hull / minkowski fallbacks without a
+recording show up as ``openscad_misses``.  Record them once with a real
+binary using --record.
+
+Usage (FreeCADCmd passes the arguments after --pass through):
+
+    FreeCADCmd benchmark.py --pass run -o bench.json
+    FreeCADCmd benchmark.py --pass run testcases/Hull_Tests --importer ast
+    FreeCADCmd benchmark.py --pass run --record /usr/bin/openscad
+    FreeCADCmd benchmark.py --pass compare base.json bench.json
+
+``run --baseline base.json`` compares straight away.  compare exits with
+status 1 when something regressed, for use in CI.
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+from freecad.OpenSCAD_Ext.headless import script_args
+from freecad.OpenSCAD_Ext.headless.fake_openscad import DEFAULT_REPLAY_DIR
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.normpath(os.path.join(_HERE, "..", "..", ".."))
+TESTCASES = os.path.join(REPO_ROOT, "testcases")
+FAKE_OPENSCAD = os.path.join(_HERE, "fake_openscad.py")
+
+DEFAULT_SUITES = [
+    "Hull_Tests", "Micro_8088_Case", "gear_tests", "openflexure_tests",
+    "polyhedron", "textTests", "2d_tests",
+]
+
+IMPORTERS = ("ast", "legacy")
+
+AST_BOOLEANS = {"union", "difference", "intersection"}
+LEGACY_BOOLEANS = {"Part::Cut", "Part::Fuse", "Part::MultiFuse",
+                   "Part::Common", "Part::MultiCommon"}
+
+OPENSCAD_PREFS = "User parameter:BaseApp/Preferences/Mod/OpenSCAD"
+
+# regression thresholds for compare
+TIME_TOLERANCE = 0.15        # 15 % slower ...
+TIME_MIN_DELTA = 0.05        # ... and at least 50 ms
+MEMORY_TOLERANCE = 0.20
+MEMORY_MIN_DELTA_KB = 10240
+
+
+# ------------------------------------------------
+# Discovery
+# ------------------------------------------------
+
+def find_csg_files(paths=None):
+    """The .csg files under *paths* (files, directories or globs)."""
+    if not paths:
+        paths = [os.path.join(TESTCASES, s) for s in DEFAULT_SUITES]
+    found = []
+    for p in paths:
+        for match in sorted(glob.glob(p)) or [p]:
+            if os.path.isdir(match):
+                for root, dirs, files in os.walk(match):
+                    dirs.sort()
+                    found += [os.path.join(root, f) for f in sorted(files)
+                              if f.lower().endswith(".csg")]
+            elif match.lower().endswith(".csg") and os.path.isfile(match):
+                found.append(match)
+    return list(dict.fromkeys(os.path.abspath(f) for f in found))
+
+
+def _relpath(path):
+    try:
+        return os.path.relpath(path, REPO_ROOT)
+    except ValueError:
+        return path
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "-C", REPO_ROOT, "rev-parse", "--short", "HEAD"],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10)
+        return out.stdout.decode().strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# ------------------------------------------------
+# One import (runs in the child)
+# ------------------------------------------------
+
+def _peak_rss_kb(usage):
+    # ru_maxrss is kB on Linux, bytes on macOS
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def _import_ast(doc, path):
+    from freecad.OpenSCAD_Ext.importers import importASTCSG
+    importASTCSG.processCSG(doc, path)
+
+
+def _import_legacy(doc, path):
+    # importAltCSG imports its lexer rules as a top-level module
+    importers = os.path.join(os.path.dirname(_HERE), "importers")
+    if importers not in sys.path:
+        sys.path.append(importers)
+    from freecad.OpenSCAD_Ext.importers import importAltCSG
+    importAltCSG.pathName = os.path.dirname(path)
+    importAltCSG.processCSG(doc, path)
+
+
+def _shape_stats(doc):
+    valid = invalid = null = 0
+    for obj in doc.Objects:
+        if obj.InList or not hasattr(obj, "Shape"):
+            continue
+        shape = obj.Shape
+        if shape.isNull():
+            null += 1
+        elif shape.isValid():
+            valid += 1
+        else:
+            invalid += 1
+    return {"valid": valid, "invalid": invalid, "null": null}
+
+
+def run_import(path, importer):
+    """Import *path* into a new document; return the measurements."""
+    import FreeCAD
+    from freecad.OpenSCAD_Ext.logger.import_profiler import import_profile, NODE_CATEGORY
+
+    result = {"file": _relpath(path), "importer": importer}
+    doc = FreeCAD.newDocument("Benchmark")
+    try:
+        with import_profile(os.path.basename(path)) as profile:
+            start = time.perf_counter()
+            if importer == "ast":
+                _import_ast(doc, path)
+            else:
+                _import_legacy(doc, path)
+            result["wall_secs"] = round(time.perf_counter() - start, 4)
+        result["ok"] = True
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    if importer == "ast":
+        report = profile.report(top=5)
+        result["booleans"] = sum(1 for e in profile.events
+                                 if e[1] == NODE_CATEGORY and e[0] in AST_BOOLEANS)
+        result["categories"] = {c["name"]: c["self_secs"] for c in report["by_category"]}
+        result["slowest_nodes"] = report["slowest_nodes"]
+    else:
+        result["booleans"] = sum(1 for o in doc.Objects if o.TypeId in LEGACY_BOOLEANS)
+    result["shapes"] = _shape_stats(doc)
+    FreeCAD.closeDocument(doc.Name)
+    return result
+
+
+def _replay_counts(log_path):
+    counts = {"hit": 0, "miss": 0, "recorded": 0, "failed": 0}
+    if os.path.isfile(log_path):
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    counts[json.loads(line)["status"]] += 1
+                except (ValueError, KeyError):
+                    pass
+    return counts
+
+
+def measure(path, importer, timeout=600):
+    """
+    run_import() in a forked child, so each import starts from the same
+    state and its peak RSS can be read from wait4().  Without fork (Windows)
+    the import runs in this process and peak RSS is that of the process.
+    """
+    fd, log_path = tempfile.mkstemp(suffix=".jsonl", prefix="openscad-calls-")
+    os.close(fd)
+    os.environ["OPENSCAD_REPLAY_LOG"] = log_path
+    try:
+        if not hasattr(os, "fork"):
+            result = run_import(path, importer)
+            try:
+                import resource
+                result["peak_rss_kb"] = _peak_rss_kb(resource.getrusage(resource.RUSAGE_SELF))
+            except ImportError:
+                result["peak_rss_kb"] = None
+        else:
+            result = _measure_forked(path, importer, timeout)
+        calls = _replay_counts(log_path)
+        result["openscad_calls"] = sum(calls.values())
+        result["openscad_misses"] = calls["miss"] + calls["failed"]
+        return result
+    finally:
+        os.environ.pop("OPENSCAD_REPLAY_LOG", None)
+        os.remove(log_path)
+
+
+def _measure_forked(path, importer, timeout):
+    import resource
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        status = 0
+        try:
+            start_rss = _peak_rss_kb(resource.getrusage(resource.RUSAGE_SELF))
+            result = run_import(path, importer)
+            peak = _peak_rss_kb(resource.getrusage(resource.RUSAGE_SELF))
+            result["import_rss_kb"] = max(0, peak - start_rss)
+            with os.fdopen(write_fd, "w") as f:
+                json.dump(result, f)
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    deadline = time.monotonic() + timeout
+    while True:
+        done, status, usage = os.wait4(pid, os.WNOHANG)
+        if done:
+            break
+        if time.monotonic() > deadline:
+            os.kill(pid, 9)
+            _, status, usage = os.wait4(pid, 0)
+            os.close(read_fd)
+            return {"file": _relpath(path), "importer": importer, "ok": False,
+                    "error": f"timed out after {timeout} secs"}
+        time.sleep(0.02)
+
+    with os.fdopen(read_fd) as f:
+        data = f.read()
+    try:
+        result = json.loads(data)
+    except ValueError:
+        result = {"file": _relpath(path), "importer": importer, "ok": False,
+                  "error": f"import process died (exit {os.waitstatus_to_exitcode(status)})"}
+    result["peak_rss_kb"] = _peak_rss_kb(usage)
+    return result
+
+
+# ------------------------------------------------
+# Run / compare
+# ------------------------------------------------
+
+def _use_openscad(executable):
+    """Point the OpenSCAD preference at *executable*; return the old value."""
+    import FreeCAD
+    prefs = FreeCAD.ParamGet(OPENSCAD_PREFS)
+    old = prefs.GetString("openscadexecutable", "")
+    prefs.SetString("openscadexecutable", executable)
+    return old
+
+
+def run_benchmark(files, importers=IMPORTERS, repeat=1, timeout=600,
+                  openscad=None, replay_dir=None, record=None, progress=None):
+    """Measure every file with every importer; return the result document."""
+    import FreeCAD
+
+    if replay_dir:
+        os.environ["OPENSCAD_REPLAY_DIR"] = replay_dir
+    if record:
+        os.environ["OPENSCAD_REPLAY_REAL"] = record
+    old_exe = _use_openscad(openscad or FAKE_OPENSCAD)
+    results = []
+    try:
+        for path in files:
+            for importer in importers:
+                runs = [measure(path, importer, timeout) for _ in range(max(1, repeat))]
+                ok = [r for r in runs if r.get("ok")]
+                best = min(ok, key=lambda r: r["wall_secs"]) if ok else runs[-1]
+                best["peak_rss_kb"] = max((r.get("peak_rss_kb") or 0) for r in runs) or None
+                results.append(best)
+                if progress:
+                    progress(best)
+    finally:
+        _use_openscad(old_exe)
+        os.environ.pop("OPENSCAD_REPLAY_REAL", None)
+
+    return {
+        "commit": _git_commit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "freecad": ".".join(FreeCAD.Version()[:3]),
+        "python": sys.version.split()[0],
+        "openscad": record or openscad or "replay",
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(base, new, time_tolerance=TIME_TOLERANCE, memory_tolerance=MEMORY_TOLERANCE):
+    """
+    Compare two result documents.  Returns a list of
+    (file, importer, kind, detail) for every regression of *new*.
+    """
+    before = {(r["file"], r["importer"]): r for r in base["results"]}
+    regressions = []
+    for r in new["results"]:
+        key = (r["file"], r["importer"])
+        b = before.get(key)
+        if b is None:
+            continue
+
+        def flag(kind, detail):
+            regressions.append((r["file"], r["importer"], kind, detail))
+
+        if b.get("ok") and not r.get("ok"):
+            flag("failed", r.get("error", ""))
+            continue
+        if not r.get("ok"):
+            continue
+
+        bt, nt = b.get("wall_secs"), r.get("wall_secs")
+        if bt is not None and nt is not None and \
+                nt > bt * (1 + time_tolerance) and nt - bt > TIME_MIN_DELTA:
+            flag("slower", f"{bt:.3f} -> {nt:.3f} secs ({(nt / bt - 1) * 100 if bt else 0:+.0f}%)")
+
+        bm, nm = b.get("import_rss_kb"), r.get("import_rss_kb")
+        if bm is not None and nm is not None and \
+                nm > bm * (1 + memory_tolerance) and nm - bm > MEMORY_MIN_DELTA_KB:
+            flag("memory", f"{bm // 1024} -> {nm // 1024} MB")
+
+        bs, ns = b.get("shapes", {}), r.get("shapes", {})
+        if ns.get("invalid", 0) > bs.get("invalid", 0) or ns.get("null", 0) > bs.get("null", 0) \
+                or ns.get("valid", 0) < bs.get("valid", 0):
+            flag("validity", f"{bs} -> {ns}")
+
+        if r.get("openscad_calls", 0) > b.get("openscad_calls", 0):
+            flag("openscad", f"{b.get('openscad_calls', 0)} -> {r['openscad_calls']} calls")
+    return regressions
+
+
+def _print_result(r):
+    if not r.get("ok"):
+        print(f"FAIL  {r['importer']:<6} {r['file']}: {r.get('error')}")
+        return
+    s = r.get("shapes", {})
+    print(f"{r['wall_secs']:8.3f}s {(r.get('peak_rss_kb') or 0) // 1024:6d}MB "
+          f"{r['importer']:<6} bool={r.get('booleans', 0):<4} "
+          f"scad={r.get('openscad_calls', 0):<3} "
+          f"valid={s.get('valid', 0)}/{sum(s.values())}  {r['file']}")
+
+
+def _report_regressions(regressions, base, new):
+    print(f"\nCompared {base.get('commit')} -> {new.get('commit')}")
+    if not regressions:
+        print("No regressions")
+        return 0
+    for file, importer, kind, detail in regressions:
+        print(f"REGRESSION {kind:<9} {importer:<6} {file}: {detail}")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="benchmark", description="OpenSCAD_Ext import benchmark")
+    sub = parser.add_subparsers(dest="command")
+
+    run = sub.add_parser("run", help="measure imports")
+    run.add_argument("paths", nargs="*", help="CSG files, directories or globs (default: testcases suites)")
+    run.add_argument("--importer", choices=IMPORTERS + ("both",), default="both")
+    run.add_argument("-o", "--output", help="write results JSON here")
+    run.add_argument("--baseline", help="results JSON to compare against")
+    run.add_argument("--repeat", type=int, default=1, help="runs per import, best time kept")
+    run.add_argument("--timeout", type=float, default=600, help="seconds per import")
+    run.add_argument("--openscad", help="OpenSCAD executable instead of the replay stub")
+    run.add_argument("--replay-dir", help=f"recordings (default {_relpath(DEFAULT_REPLAY_DIR)})")
+    run.add_argument("--record", metavar="OPENSCAD",
+                     help="run this real OpenSCAD and record its outputs for replay")
+
+    cmp_ = sub.add_parser("compare", help="flag regressions between two result files")
+    cmp_.add_argument("base")
+    cmp_.add_argument("new")
+    cmp_.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE)
+    cmp_.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE)
+
+    args = parser.parse_args(script_args() if argv is None else argv)
+
+    if args.command == "compare":
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        return _report_regressions(
+            compare(base, new, args.time_tolerance, args.memory_tolerance), base, new)
+
+    if args.command != "run":
+        parser.print_help()
+        return 2
+
+    files = find_csg_files(args.paths)
+    if not files:
+        print("No .csg files found")
+        return 2
+    importers = IMPORTERS if args.importer == "both" else (args.importer,)
+    print(f"Benchmarking {len(files)} files with {', '.join(importers)}")
+    doc = run_benchmark(files, importers, args.repeat, args.timeout,
+                        args.openscad, args.replay_dir, args.record, _print_result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(doc, f, indent=2)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            base = json.load(f)
+        return _report_regressions(compare(base, doc), base, doc)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
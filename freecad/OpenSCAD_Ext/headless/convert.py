@@ -0,0 +1,228 @@
+"""
+Batch conversion of SCAD / CSG files to BREP, STEP or STL.
+
+Each input is taken through OpenSCAD -> CSG -> AST importer -> shape and
+written to the requested formats.  Both stages use core/render_cache.py, so
+re-running over unchanged files (and unchanged includes) neither runs
+OpenSCAD nor imports again.  Files are converted in a pool of worker
+processes; one JSON line per conversion is printed as it finishes:
+
+    {"file": "parts/bracket.scad", "set": 0, "d_params": [["width", "20"]],
+     "ok": true, "outputs": ["out/bracket.step"], "csg_cached": false,
+     "shape_cached": false, "openscad_secs": 1.8, "import_secs": 0.4,
+     "export_secs": 0.1, "total_secs": 2.3}
+
+Usage (FreeCADCmd passes the arguments after --pass through):
+
+    FreeCADCmd convert.py --pass parts/*.scad -f step -o out
+    FreeCADCmd convert.py --pass gear.scad -D teeth=20 -D "bore=5" -f brep,stl
+    FreeCADCmd convert.py --pass gear.scad --set "teeth=12" --set "teeth=24" -f step
+
+``-D`` values apply to every conversion; each ``--set "a=1;b=2"`` adds a
+parameter set, converted as ``<name>_<n>``.  Exit status is 1 if any
+conversion failed.
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from freecad.OpenSCAD_Ext.headless import script_args
+
+FORMATS = ("brep", "step", "stl")
+
+
+def _parse_assignment(text):
+    name, sep, value = text.partition("=")
+    if not sep or not name.strip():
+        raise argparse.ArgumentTypeError(f"expected name=value, got {text!r}")
+    return name.strip(), value.strip()
+
+
+def _parse_set(text):
+    return [_parse_assignment(item) for item in text.split(";") if item.strip()]
+
+
+def _parse_formats(text):
+    formats = [f.strip().lower() for f in text.split(",") if f.strip()]
+    for f in formats:
+        if f not in FORMATS:
+            raise argparse.ArgumentTypeError(f"unknown format {f!r}, use {', '.join(FORMATS)}")
+    return formats
+
+
+def expand_inputs(patterns):
+    """SCAD / CSG files named by *patterns* (files, directories or globs)."""
+    found = []
+    for p in patterns:
+        for match in sorted(glob.glob(p, recursive=True)) or [p]:
+            if os.path.isdir(match):
+                for root, dirs, files in os.walk(match):
+                    dirs.sort()
+                    found += [os.path.join(root, f) for f in sorted(files)
+                              if f.lower().endswith((".scad", ".csg"))]
+            elif os.path.isfile(match):
+                found.append(match)
+    return list(dict.fromkeys(os.path.abspath(f) for f in found))
+
+
+# ------------------------------------------------
+# One conversion (runs in a worker)
+# ------------------------------------------------
+
+def convert_file(job):
+    """
+    Convert one (file, parameter set) job.  Never raises - failures are
+    reported in the returned dict.
+    """
+    from freecad.OpenSCAD_Ext.core.render_cache import render_csg, csg_to_shape, export_shape
+
+    path, set_index, d_params, stem = job["file"], job["set"], job["d_params"], job["stem"]
+    result = {"file": path, "set": set_index, "d_params": d_params, "ok": False}
+    start = time.perf_counter()
+    try:
+        if path.lower().endswith(".scad"):
+            csg, result["csg_cached"] = render_csg(
+                path, d_params or None, job["timeout"], use_cache=job["use_cache"])
+        else:
+            if d_params:
+                result["warning"] = "-D parameters ignored for .csg input"
+            csg, result["csg_cached"] = path, None
+        after_openscad = time.perf_counter()
+        result["openscad_secs"] = round(after_openscad - start, 4)
+
+        shape, result["shape_cached"] = csg_to_shape(
+            csg, job["mode"], job["fnmax"], use_cache=job["use_cache"])
+        after_import = time.perf_counter()
+        result["import_secs"] = round(after_import - after_openscad, 4)
+        if shape.isNull():
+            raise ValueError("import produced no shape")
+        result["valid"] = shape.isValid()
+
+        outputs = []
+        for fmt in job["formats"]:
+            out = os.path.join(job["outdir"], f"{stem}.{fmt}")
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            export_shape(shape, out)
+            outputs.append(out)
+        result["outputs"] = outputs
+        result["export_secs"] = round(time.perf_counter() - after_import, 4)
+        result["ok"] = True
+    except Exception as e:
+        # OpenSCADError keeps its message in .value
+        result["error"] = f"{type(e).__name__}: {getattr(e, 'value', e)}".strip()
+    result["total_secs"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+# ------------------------------------------------
+# Driver
+# ------------------------------------------------
+
+def make_jobs(files, param_sets, outdir, formats, mode="AST-Brep", fnmax=16,
+              timeout=None, use_cache=True):
+    """
+    One job per file and parameter set.  Outputs mirror the input folders
+    below their common parent; a .scad and a .csg of the same name get the
+    extension appended.
+    """
+    root = os.path.commonpath([os.path.dirname(f) for f in files]) if files else ""
+    names = [os.path.splitext(os.path.relpath(f, root))[0] for f in files]
+    jobs = []
+    for path, name in zip(files, names):
+        if names.count(name) > 1:
+            name += "_" + os.path.splitext(path)[1][1:].lower()
+        for i, d_params in enumerate(param_sets):
+            jobs.append({
+                "file": path, "set": i, "d_params": d_params,
+                "stem": name if len(param_sets) == 1 else f"{name}_{i}",
+                "outdir": outdir, "formats": formats, "mode": mode,
+                "fnmax": fnmax, "timeout": timeout, "use_cache": use_cache,
+            })
+    return jobs
+
+
+def run_jobs(jobs, workers=None, emit=None):
+    """
+    Run *jobs* in *workers* processes (forked, so each worker starts with
+    FreeCAD already loaded); without fork, or with one worker, in this
+    process.  *emit(result)* is called as each job finishes.
+    """
+    workers = workers or os.cpu_count() or 1
+    results = []
+    if workers == 1 or len(jobs) == 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for job in jobs:
+            results.append(convert_file(job))
+            if emit:
+                emit(results[-1])
+        return results
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as pool:
+        futures = [pool.submit(convert_file, job) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if emit:
+                emit(results[-1])
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="convert",
+                                     description="Convert SCAD / CSG files to BREP, STEP or STL")
+    parser.add_argument("inputs", nargs="+", help="SCAD / CSG files, directories or globs")
+    parser.add_argument("-o", "--outdir", default=".", help="output directory")
+    parser.add_argument("-f", "--format", type=_parse_formats, default=["step"],
+                        help="comma separated: brep, step, stl (default step)")
+    parser.add_argument("-D", dest="defines", action="append", type=_parse_assignment,
+                        default=[], metavar="NAME=VALUE", help="OpenSCAD override for every file")
+    parser.add_argument("--set", dest="sets", action="append", type=_parse_set, default=[],
+                        metavar="'A=1;B=2'", help="add a parameter set (repeatable)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPUs)")
+    parser.add_argument("--mode", choices=("AST-Brep", "Brep"), default="AST-Brep",
+                        help="CSG importer")
+    parser.add_argument("--fnmax", type=int, default=None,
+                        help="faceting limit (default: the useMaxFN preference)")
+    parser.add_argument("--timeout", type=int, default=None, help="seconds per OpenSCAD run")
+    parser.add_argument("--no-cache", action="store_true", help="always run OpenSCAD and import")
+    args = parser.parse_args(script_args() if argv is None else argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        sys.stderr.write("No SCAD / CSG files found\n")
+        return 2
+
+    fnmax = args.fnmax
+    if fnmax is None:
+        import FreeCAD
+        fnmax = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/OpenSCAD") \
+            .GetInt("useMaxFN", 16)
+
+    param_sets = [args.defines + s for s in args.sets] or [args.defines]
+    jobs = make_jobs(files, param_sets, os.path.abspath(args.outdir), args.format,
+                     args.mode, fnmax, args.timeout, not args.no_cache)
+
+    # importers print freely - keep stdout for the JSON lines only
+    sys.stdout.flush()
+    results_out = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    def emit(result):
+        results_out.write(json.dumps(result) + "\n")
+        results_out.flush()
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, args.jobs, emit)
+    failed = sum(1 for r in results if not r["ok"])
+    sys.stderr.write(f"{len(results) - failed} converted, {failed} failed "
+                     f"in {time.perf_counter() - start:.1f} secs\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
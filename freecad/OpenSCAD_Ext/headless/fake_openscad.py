@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Stand-in OpenSCAD executable that replays recorded outputs.
+
+Point the OpenSCAD executable preference at this file (benchmark.py does
+this itself) and every call
+
+    openscad [options] -o out.ext input.scad
+
+is looked up by a key made of the options, the output extension and the
+*content* of the input file - the importers always pass fresh temp file
+names, so the names themselves are ignored.  A recorded output is copied to
+``out.ext``; a miss exits with status 1 like a failed OpenSCAD run.
+
+Environment
+-----------
+OPENSCAD_REPLAY_DIR    recordings directory (default testcases/openscad_recordings)
+OPENSCAD_REPLAY_REAL   path of a real openscad - calls are passed through to
+                       it and their outputs recorded (record mode)
+OPENSCAD_REPLAY_LOG    file to append one JSON line per call to
+                       ({"key", "status": "hit" | "miss" | "recorded" | "failed"})
+
+Only the standard library is used, so any python3 can run it.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_REPLAY_DIR = os.path.normpath(
+    os.path.join(_HERE, "..", "..", "..", "testcases", "openscad_recordings")
+)
+
+# options followed by a separate value (--opt=value forms are one argument)
+_VALUE_OPTIONS = {"-D", "-p", "-P", "-d", "-m", "--export-format", "--imgsize",
+                  "--camera", "--colorscheme", "--projection", "--csglimit"}
+
+
+def parse_args(argv):
+    """Return (options, output path, input path) from an OpenSCAD command line."""
+    options, output, inputs = [], None, []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "-o" and i + 1 < len(argv):
+            output = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith("-"):
+            if arg in _VALUE_OPTIONS and i + 1 < len(argv):
+                options += [arg, argv[i + 1]]
+                i += 2
+            else:
+                options.append(arg)
+                i += 1
+            continue
+        inputs.append(arg)
+        i += 1
+    return options, output, (inputs[-1] if inputs else None)
+
+
+def replay_key(options, output, source):
+    h = hashlib.sha256()
+    for part in options:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    ext = os.path.splitext(output or "")[1].lower()
+    h.update(ext.encode("utf-8"))
+    h.update(b"\0")
+    if source and os.path.isfile(source):
+        with open(source, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest() + ext
+
+
+def _log(key, status):
+    path = os.environ.get("OPENSCAD_REPLAY_LOG")
+    if not path:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"key": key, "status": status}) + "\n")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv in (["-v"], ["--version"]):
+        sys.stderr.write("OpenSCAD version 2021.01 (replay)\n")
+        return 0
+
+    options, output, source = parse_args(argv)
+    if not output:
+        sys.stderr.write("fake_openscad: no -o output given\n")
+        return 1
+
+    replay_dir = os.environ.get("OPENSCAD_REPLAY_DIR") or DEFAULT_REPLAY_DIR
+    key = replay_key(options, output, source)
+    recorded = os.path.join(replay_dir, key)
+    real = os.environ.get("OPENSCAD_REPLAY_REAL")
+
+    if real:
+        p = subprocess.run([real] + argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        sys.stdout.write(p.stdout.decode("utf8", "replace"))
+        sys.stderr.write(p.stderr.decode("utf8", "replace"))
+        if p.returncode == 0 and os.path.isfile(output):
+            os.makedirs(replay_dir, exist_ok=True)
+            shutil.copyfile(output, recorded)
+            _log(key, "recorded")
+        else:
+            _log(key, "failed")
+        return p.returncode
+
+    if not os.path.isfile(recorded):
+        _log(key, "miss")
+        sys.stderr.write(f"fake_openscad: no recording {key} for {source}\n")
+        return 1
+    shutil.copyfile(recorded, output)
+    _log(key, "hit")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,6 +37,9 @@ from pathlib import Path
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
 from freecad.OpenSCAD_Ext.parsers.csg_parser.processAST import process_AST
 from freecad.OpenSCAD_Ext.parsers.csg_parser.parse_csg_to_AST import parse_csg_file_to_AST_nodes
+from freecad.OpenSCAD_Ext.logger.import_profiler import (
+    span, profiling, profile_imports_enabled, start_profile, end_profile, save_profile,
+)
 #from freecad.OpenSCAD_Ext.parsers.csg_parser.parse_csg_file_to_AST_nodes import normalize_ast
 
 #
@@ -239,16 +242,24 @@ def add_shapes_to_document(doc, name, shapes):
 
 import FreeCAD as App
 import Part
+import Mesh
 
 def add_shape_to_doc(doc, shape, placement, name="Part"):
     write_log("Add Object",f"Name {name} Shape {shape} Placement{placement}")
 
+    # Oversized polyhedra are kept as Mesh (see processAST mesh mode)
+    if isinstance(shape, Mesh.Mesh):
+        obj = doc.addObject("Mesh::Feature", name)
+        obj.Mesh = shape
+        obj.Placement = placement
+        return obj
+
     obj = doc.addObject("Part::Feature", name)
     obj.Shape = shape
     obj.Placement = placement
     return obj
 
-def processCSG(docSrc, filename, fnmax_param = None):
+def processCSG(docSrc, filename, fnmax_param = None, mesh_threshold = None):
     global doc
     global fnmax
     if fnmax_param is None:
@@ -263,22 +274,37 @@ def processCSG(docSrc, filename, fnmax_param = None):
     FreeCAD.Console.PrintMessage(f'ImportAstCSG Version {__version__}\n')
     write_log("Info","Using OpenSCAD AST / CSG Importer")
     write_log("Info",f"Doc {doc.Name} useMaxFn {fnmax}")
-    raw_ast_nodes = parse_csg_file_to_AST_nodes(filename)
-    ast_nodes = raw_ast_nodes
-    #ast_nodes = normalize_ast(raw_ast_nodes)
-    shapePlaceList = process_AST(ast_nodes, mode="multiple")
-    write_log("AST",f"shapePlaceList {shapePlaceList}")
-    for sp in shapePlaceList:
-        write_log("Import",f"{sp}")
-        obj=add_shape_to_doc(doc,sp[1],sp[2],sp[0])
-        # obj.recompute() per-object is redundant — setting obj.Shape already
-        # marks it for display; calling it here just adds an extra tessellation
-        # pass per shape before doc.recompute() runs at the end.
-
-    #add_shapes_to_document(doc, name, shapes)
-    FreeCAD.Console.PrintMessage(f'ImportAstCSG Version {__version__}\n')
-    FreeCAD.Console.PrintMessage('End processing CSG file\n')
-    doc.recompute()
+
+    # Span timings: profile this import if asked to and no caller (e.g. a
+    # benchmark) is already profiling, see logger/import_profiler.py
+    profile = None
+    if not profiling() and profile_imports_enabled():
+        profile = start_profile(name)
+    try:
+        with span("processCSG", "import", file=filename):
+            raw_ast_nodes = parse_csg_file_to_AST_nodes(filename)
+            ast_nodes = raw_ast_nodes
+            #ast_nodes = normalize_ast(raw_ast_nodes)
+            with span("process_AST", "ast"):
+                shapePlaceList = process_AST(ast_nodes, mode="multiple", fnmax=fnmax,
+                                             mesh_threshold=mesh_threshold)
+            write_log("AST",f"shapePlaceList {shapePlaceList}")
+            with span("add_shape_to_doc", "document", shapes=len(shapePlaceList)):
+                for sp in shapePlaceList:
+                    write_log("Import",f"{sp}")
+                    obj=add_shape_to_doc(doc,sp[1],sp[2],sp[0])
+                    # obj.recompute() per-object is redundant — setting obj.Shape already
+                    # marks it for display; calling it here just adds an extra tessellation
+                    # pass per shape before doc.recompute() runs at the end.
+
+            #add_shapes_to_document(doc, name, shapes)
+            FreeCAD.Console.PrintMessage(f'ImportAstCSG Version {__version__}\n')
+            FreeCAD.Console.PrintMessage('End processing CSG file\n')
+            with span("recompute", "recompute"):
+                doc.recompute()
+    finally:
+        if profile is not None:
+            save_profile(end_profile())
     # ViewFit deferred — calling it synchronously here hangs in FreeCAD 1.1.x
     # because the shape tessellation hasn't completed yet.
     from PySide.QtCore import QTimer
@@ -55,6 +55,7 @@ from freecad.OpenSCAD_Ext.core.checkObjectShapes import checkObjShape
 from freecad.OpenSCAD_Ext.core.OpenSCADUtils import *
 from freecad.OpenSCAD_Ext.core.OpenSCADHull import *
 from freecad.OpenSCAD_Ext.core.OpenSCADMinkowski import *
+from freecad.OpenSCAD_Ext.core.scad_primitives import use_smooth, make_primitive, clear_primitive_cache
 
 # In theory FC 1.1+ should use ths for display import prompt
 DisplayName = "OpenSCAD Ext – CSG Importer"
@@ -156,6 +157,7 @@ def processCSG(docSrc, filename, fnmax_param = None):
     else:
         fnmax = fnmax_param
     doc = docSrc
+    clear_primitive_cache()
 
     print('Using Alternate OpenSCAD Importer')
     print(f"Doc {doc.Name} useMaxFn {fnmax}")
@@ -832,7 +834,7 @@ def p_rotate_extrude_action(p):
     else :
         part = p[6][0]
 
-    if n < 3 or fnmax != 0 and n > fnmax:
+    if use_smooth(n, fnmax):
         p[0] = [process_rotate_extrude(part,angle)]
     else:
         p[0] = [process_rotate_extrude_prism(part,angle,n)]
@@ -851,7 +853,7 @@ def p_rotate_extrude_file(p):
     #    "User parameter:BaseApp/Preferences/Mod/OpenSCAD").\
     #    GetInt('useMaxFN', 16)
 
-    if n < 3 or fnmax != 0 and n > fnmax:
+    if use_smooth(n, fnmax):
         p[0] = [process_rotate_extrude(obj,angle)]
     else:
         p[0] = [process_rotate_extrude_prism(obj,angle,n)]
@@ -1215,8 +1217,15 @@ def p_sphere_action(p):
     'sphere_action : sphere LPAREN keywordargument_list RPAREN SEMICOL'
     if printverbose: write_log("INFO",f"Sphere : {p[3]}")
     r = float(p[3]['r'])
-    mysphere = doc.addObject("Part::Sphere",p[1])
-    mysphere.Radius = r
+    n = num(p[3].get('$fn', 0))
+    if use_smooth(n, fnmax):
+        mysphere = doc.addObject("Part::Sphere",p[1])
+        mysphere.Radius = r
+    else:
+        # Small $fn is a deliberate polyhedral sphere
+        if printverbose: write_log("INFO",f"Faceted Sphere $fn={n}")
+        mysphere = doc.addObject("Part::Feature",p[1])
+        mysphere.Shape = make_primitive("sphere", (r,), n, fnmax)
     if printverbose: write_log("INFO","Push Sphere")
     p[0] = [mysphere]
     if printverbose: write_log("INFO","End Sphere")
@@ -1258,7 +1267,7 @@ def p_cylinder_action(p):
     if h > 0:
         if ( r1 == r2 and r1 > 0):
             if printverbose: write_log("INFO","Make Cylinder")
-            if n < 3 or fnmax != 0 and n > fnmax:
+            if use_smooth(n, fnmax):
                 mycyl=doc.addObject("Part::Cylinder",p[1])
                 mycyl.Height = h
                 mycyl.Radius = r1
@@ -1289,7 +1298,7 @@ def p_cylinder_action(p):
                     mycyl.Height  = h
 
         elif (r1 != r2):
-            if n < 3 or fnmax != 0 and n > fnmax:
+            if use_smooth(n, fnmax):
                 if printverbose: write_log("INFO","Make Cone")
                 mycyl=doc.addObject("Part::Cone",p[1])
                 mycyl.Height = h
@@ -1368,7 +1377,7 @@ def p_circle_action(p) :
     # Alter Max polygon to control if polygons are circles or polygons
     # in the modules preferences
     import Draft
-    if n == 0 or fnmax != 0 and n >= fnmax:
+    if use_smooth(n, fnmax):
         #mycircle = FreeCAD.ActiveDocument.addObject("Part::Part2DObjectPython",'circle')
         #Draft._Circle(mycircle)
         #mycircle.Radius = r
@@ -128,14 +128,23 @@ def importSCADProject(doc, proj_filename):
             sourceFile=sourceName,
             mode=project_fc_obj.DefaultImportMode # Project Default Mode
         )
+        project_fc_obj.addObject(file_fc_obj)
+        created_objects.append(file_fc_obj)
 
         write_log(
             "ScadProject",
-            f"Added SCAD file '{scad_path}' with mode={project_fc_obj.mode}"
+            f"Added SCAD file '{scad_path}' with mode={file_fc_obj.mode}"
         )
 
     doc.recompute()
 
+    # Render All - files unchanged since the project was last rendered
+    # come from the render cache without running OpenSCAD
+    try:
+        project_proxy.renderFunction(project_fc_obj)
+    except Exception as e:
+        write_log("ScadProject", f"Render All failed: {e}")
+
     write_log(
         "ScadProject",
         f"Imported {len(created_objects)} SCAD files into project '{project_name}'"
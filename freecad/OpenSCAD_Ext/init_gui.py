@@ -61,6 +61,7 @@ class OpenSCADWorkbench_Ext(Gui.Workbench):
         from freecad.OpenSCAD_Ext.commands import openSCADstudio
         from freecad.OpenSCAD_Ext.commands import renderSCAD
         from freecad.OpenSCAD_Ext.commands import varsSCAD
+        from freecad.OpenSCAD_Ext.commands import sweepSCAD
         from freecad.OpenSCAD_Ext.commands import librarySCAD
  
         commands = [
@@ -69,6 +70,7 @@ class OpenSCADWorkbench_Ext(Gui.Workbench):
             "EditStudioSCADFileObject_CMD",
             "RenderSCADFileObject_CMD",
             "VarsSCADFileObject_CMD",
+            "SweepSCADFileObject_CMD",
             "LibrarySCAD_CMD",
 
         ]
@@ -1,4 +1,5 @@
-import os, sys, datetime, threading, FreeCAD
+import os, sys, datetime, threading, time, atexit, itertools, FreeCAD
+from collections import deque
 
 # --- Log file path ---
 LOG_DIR = os.path.join(FreeCAD.getUserAppDataDir(), "OpenSCAD_Ext")
@@ -9,22 +10,227 @@ if not os.path.exists(LOG_DIR):
 
 _lock = threading.Lock()
 
-def _timestamp():
-    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# --- Levels ---
+#
+# The first argument of write_log is either a level name ("Info", "WARN",
+# "ERROR", ...) or a category ("AST", "Hull", "Primitive", ...).  Categories
+# are the per-node chatter of the importers and count as DEBUG, so they go
+# to the log file but not to the Report View unless asked for.
+#
+# Thresholds (file and console) can be set per category, e.g. in
+#   Preferences/Mod/OpenSCAD_Ext  LogLevels = "Hull=WARNING, AST=OFF"
+#                                 LogConsoleLevel = "INFO"
+# or at run time with set_log_level() / set_console_level().
+
+DEBUG, INFO, WARNING, ERROR, OFF = 10, 20, 30, 40, 100
+
+_LEVEL_NAMES = {
+    "DEBUG": DEBUG,
+    "INFO": INFO, "INIT": INFO, "PRINT": INFO,
+    "WARN": WARNING, "WARNING": WARNING,
+    "ERROR": ERROR, "FC-ERR": ERROR,
+    "OFF": OFF,
+}
+
+_file_levels = {}            # category -> threshold for the log file
+_console_levels = {}         # category -> threshold for the Report View
+_default_file_level = DEBUG
+_default_console_level = INFO
+
+# level / category string -> (severity, to_file, to_console); cleared on change
+_route_cache = {}
+
+# --- Buffer / writer ---
+RING_SIZE = 20000            # messages held before the oldest are dropped
+FLUSH_INTERVAL = 0.5         # seconds between writer flushes
+FLUSH_BATCH = 2000           # wake the writer early at this many messages
+_FLUSH_SYNC = RING_SIZE - FLUSH_BATCH   # writer behind - caller flushes itself
+
+_buffer = deque(maxlen=RING_SIZE)   # (seq, time, level, msg)
+_seq = itertools.count()
+_seq_lock = threading.Lock()        # seq order == buffer order, never held for I/O
+_written_seq = -1
+_wake = threading.Event()
+_writer = None
+
+
+def _timestamp(t=None):
+    return datetime.datetime.fromtimestamp(t if t is not None else time.time()) \
+        .strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _severity(level):
+    return _LEVEL_NAMES.get(str(level).upper(), DEBUG)
+
+
+def _route(level):
+    severity = _severity(level)
+    file_level = _file_levels.get(level, _default_file_level)
+    console_level = _console_levels.get(level, _default_console_level)
+    if severity >= ERROR:
+        # errors always reach both
+        route = (severity, True, True)
+    else:
+        route = (severity, severity >= file_level, severity >= console_level)
+    _route_cache[level] = route
+    return route
+
+
+def log_enabled(level):
+    """True if write_log(level, ...) would output anything - use to skip
+    building expensive messages in hot loops."""
+    route = _route_cache.get(level) or _route(level)
+    return route[1] or route[2]
+
 
 def write_log(level, msg):
-    """Write message to log file."""
-    with _lock:
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"{_timestamp()} [{level}] {msg}\n")
+    """
+    Log *msg* under *level* (a level name or a category).
+
+    File output is buffered and written by a background thread; Report View
+    output is immediate but only for messages at or above the console level.
+    """
+    route = _route_cache.get(level)
+    if route is None:
+        route = _route(level)
+    severity, to_file, to_console = route
+
+    if to_file:
+        with _seq_lock:
+            _buffer.append((next(_seq), time.time(), level, msg))
+        if _writer is None:
+            _start_writer()
+        pending = len(_buffer)
+        if pending >= _FLUSH_SYNC:
+            flush_log()
+        elif severity >= ERROR or pending >= FLUSH_BATCH:
+            _wake.set()
 
     # Also send to FreeCAD Report View
-    #if FreeCAD.GuiUp:
-        if level in ("ERROR", "FC-ERR"):
+    if to_console:
+        if severity >= ERROR:
             FreeCAD.Console.PrintError(f"[{level}] {msg}\n")
+        elif severity >= WARNING:
+            FreeCAD.Console.PrintWarning(f"[{level}] {msg}\n")
         else:
             FreeCAD.Console.PrintMessage(f"[{level}] {msg}\n")
 
+
+# --- Configuration ---
+
+def _parse_level(value):
+    value = str(value).strip().upper()
+    if value.isdigit():
+        return int(value)
+    return _LEVEL_NAMES.get(value, DEBUG)
+
+
+def set_log_level(category, file_level=None, console_level=None):
+    """
+    Set the thresholds of one category ("AST", "Hull", ...) or, with
+    category None, the defaults.  Levels are DEBUG..ERROR / OFF or names.
+    """
+    global _default_file_level, _default_console_level
+    if file_level is not None:
+        if category is None:
+            _default_file_level = _parse_level(file_level)
+        else:
+            _file_levels[category] = _parse_level(file_level)
+    if console_level is not None:
+        if category is None:
+            _default_console_level = _parse_level(console_level)
+        else:
+            _console_levels[category] = _parse_level(console_level)
+    _route_cache.clear()
+
+
+def set_console_level(level):
+    """Default Report View threshold, e.g. DEBUG to see every category."""
+    set_log_level(None, console_level=level)
+
+
+def _load_preferences():
+    try:
+        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/OpenSCAD_Ext")
+        levels = prefs.GetString("LogLevels", "") or ""
+        console = prefs.GetString("LogConsoleLevel", "") or ""
+    except Exception:
+        return
+    for item in levels.split(","):
+        if "=" in item:
+            category, value = item.split("=", 1)
+            set_log_level(category.strip(), file_level=value, console_level=value)
+    if console:
+        set_console_level(console)
+
+
+# --- Writer thread ---
+
+def _drain():
+    """Write everything buffered so far in one append (caller holds _lock)."""
+    global _written_seq
+    if not _buffer:
+        return
+    lines = []
+    second, stamp = None, ""
+    while True:
+        try:
+            seq, t, level, msg = _buffer.popleft()
+        except IndexError:
+            break
+        if int(t) != second:
+            second, stamp = int(t), _timestamp(t)
+        if seq > _written_seq + 1 and _written_seq >= 0:
+            # the ring overflowed before the writer caught up
+            lines.append(f"{stamp} [LOG] {seq - _written_seq - 1} messages dropped\n")
+        _written_seq = seq
+        lines.append(f"{stamp} [{level}] {msg}\n")
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+def _run_writer():
+    while True:
+        _wake.wait(FLUSH_INTERVAL)
+        _wake.clear()
+        with _lock:
+            try:
+                _drain()
+            except Exception as e:
+                sys.stderr.write(f"OpenSCAD_Ext log write failed: {e}\n")
+
+
+def _start_writer():
+    global _writer
+    with _lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_run_writer, name="workbench-log", daemon=True)
+            _writer.start()
+
+
+def flush_log():
+    """Write buffered messages now (blocking)."""
+    with _lock:
+        _drain()
+
+
+def _after_fork():
+    # the writer thread does not survive fork, start a new one on demand;
+    # the parent still writes its unflushed messages, so drop the child's copy
+    global _writer, _lock, _seq_lock, _written_seq
+    _writer = None
+    _lock = threading.Lock()
+    _seq_lock = threading.Lock()
+    _buffer.clear()
+    _written_seq = -1
+
+
+atexit.register(flush_log)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+_load_preferences()
+
 # --- Redirect Python print ---
 #class PrintLogger:
 #    def write(self, msg):
@@ -0,0 +1,315 @@
+"""
+Span based timing of CSG / AST imports.
+
+Code to be measured is wrapped in spans:
+
+    with span("parse", "parse", file=filename):
+        ...
+
+    @profiled("openscad")
+    def callopenscad(...):
+        ...
+
+Spans are only recorded while a profile is active (start_profile() ...
+end_profile(), or the import_profile() context manager); otherwise span()
+returns a shared do-nothing object, so the instrumentation can stay in the
+importer's hot paths.
+
+Each span keeps its inclusive time and its self time (inclusive minus its
+child spans), so time by category adds up to the import's wall time without
+counting nested work twice.  A finished profile gives
+
+    report()              top-N slowest AST nodes (with CSG source line)
+                          and self time by category / node type
+    write_json(path)      the report as JSON
+    write_chrome_trace()  Chrome trace-event file - open in chrome://tracing
+                          or https://ui.perfetto.dev
+
+With the preference Mod/OpenSCAD_Ext ProfileImports set, processCSG writes
+both next to the workbench log under ``profiles/``.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import LOG_DIR, write_log
+
+PROFILE_DIR = os.path.join(LOG_DIR, "profiles")
+
+# category of the per AST node spans, see process_AST_node
+NODE_CATEGORY = "node"
+
+_active = None              # ImportProfile being recorded, or None
+_local = threading.local()  # per thread stack of open spans
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profile", "name", "category", "args", "start", "child_time")
+
+    def __init__(self, profile, name, category, args):
+        self.profile = profile
+        self.name = name
+        self.category = category
+        self.args = args
+        self.child_time = 0.0
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        duration = end - self.start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].child_time += duration
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.profile._record(self, duration, len(stack))
+        return False
+
+
+def span(name, category="", **args):
+    """Context manager timing one span (no-op unless a profile is active)."""
+    profile = _active
+    if profile is None:
+        return _NULL_SPAN
+    return _Span(profile, name, category, args)
+
+
+def profiled(category, name=None):
+    """Decorator: time every call of the function as a span."""
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def profiled_node(func):
+    """
+    Decorator for process_AST_node(node, ...): one span per AST node, named
+    after its node type and carrying its CSG source line.
+    """
+    @functools.wraps(func)
+    def wrapper(node, *args, **kwargs):
+        if _active is None:
+            return func(node, *args, **kwargs)
+        name = getattr(node, "node_type", None) or type(node).__name__
+        with span(name, NODE_CATEGORY, line=getattr(node, "line", None)):
+            return func(node, *args, **kwargs)
+    return wrapper
+
+
+def profiling():
+    return _active is not None
+
+
+class ImportProfile:
+    """The spans recorded for one import."""
+
+    def __init__(self, label):
+        self.label = label
+        self.started = time.time()
+        self.origin = time.perf_counter()
+        self.wall = None
+        self.events = []    # (name, category, start, duration, self, depth, tid, args)
+        self._lock = threading.Lock()
+
+    def _record(self, s, duration, depth):
+        event = (s.name, s.category, s.start - self.origin, duration,
+                 max(0.0, duration - s.child_time), depth,
+                 threading.get_ident(), s.args)
+        with self._lock:
+            self.events.append(event)
+
+    def finish(self):
+        if self.wall is None:
+            self.wall = time.perf_counter() - self.origin
+
+    # --------------------------------------------------------------
+    # Report
+    # --------------------------------------------------------------
+
+    def report(self, top=20):
+        by_category = {}
+        by_node_type = {}
+        nodes = []
+        for name, category, start, duration, self_time, depth, tid, args in self.events:
+            entry = by_category.setdefault(category or "other", [0.0, 0])
+            entry[0] += self_time
+            entry[1] += 1
+            if category == NODE_CATEGORY:
+                entry = by_node_type.setdefault(name, [0.0, 0])
+                entry[0] += self_time
+                entry[1] += 1
+                nodes.append((self_time, duration, name, args))
+        nodes.sort(key=lambda n: n[0], reverse=True)
+
+        def table(totals):
+            return [
+                {"name": k, "self_secs": round(v[0], 6), "count": v[1]}
+                for k, v in sorted(totals.items(), key=lambda kv: kv[1][0], reverse=True)
+            ]
+
+        return {
+            "label": self.label,
+            "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+            "wall_secs": round(self.wall if self.wall is not None
+                               else time.perf_counter() - self.origin, 6),
+            "spans": len(self.events),
+            "by_category": table(by_category),
+            "by_node_type": table(by_node_type),
+            "slowest_nodes": [
+                {
+                    "node_type": name,
+                    "line": args.get("line"),
+                    "self_secs": round(self_time, 6),
+                    "total_secs": round(duration, 6),
+                }
+                for self_time, duration, name, args in nodes[:top]
+            ],
+        }
+
+    def summary(self, top=5):
+        """A few lines for the log."""
+        r = self.report(top)
+        lines = [f"Import profile {self.label}: {r['wall_secs']:.3f} secs, {r['spans']} spans"]
+        for c in r["by_category"]:
+            lines.append(f"  {c['name']:<12} {c['self_secs']:9.3f} secs  x{c['count']}")
+        for n in r["slowest_nodes"]:
+            where = f" line {n['line']}" if n["line"] else ""
+            lines.append(f"  slow {n['node_type']}{where}: {n['self_secs']:.3f} secs")
+        return "\n".join(lines)
+
+    # --------------------------------------------------------------
+    # Output
+    # --------------------------------------------------------------
+
+    def write_json(self, path, top=20):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(top), f, indent=2, default=str)
+        return path
+
+    def write_chrome_trace(self, path):
+        """Trace-event format, complete ("X") events in microseconds."""
+        pid = os.getpid()
+        events = [{
+            "name": "process_name", "ph": "M", "pid": pid,
+            "args": {"name": f"import {self.label}"},
+        }]
+        for name, category, start, duration, self_time, depth, tid, args in self.events:
+            events.append({
+                "name": name,
+                "cat": category or "other",
+                "ph": "X",
+                "ts": round(start * 1e6, 3),
+                "dur": round(duration * 1e6, 3),
+                "pid": pid,
+                "tid": tid,
+                "args": {k: v if isinstance(v, (int, float, bool)) or v is None else str(v)
+                         for k, v in args.items()},
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    def write_reports(self, directory=PROFILE_DIR, top=20):
+        """Write <label>-<time>.json and .trace.json; return both paths."""
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        base = os.path.join(directory, f"{self.label}-{stamp}")
+        return (self.write_json(base + ".json", top),
+                self.write_chrome_trace(base + ".trace.json"))
+
+
+# ------------------------------------------------
+# Start / stop
+# ------------------------------------------------
+
+def start_profile(label="import"):
+    """Start recording; an already active profile is returned unchanged."""
+    global _active
+    if _active is None:
+        _active = ImportProfile(label)
+    return _active
+
+
+def end_profile():
+    """Stop recording and return the finished profile (or None)."""
+    global _active
+    profile, _active = _active, None
+    if profile is not None:
+        profile.finish()
+    return profile
+
+
+class import_profile:
+    """
+    ``with import_profile(label) as profile:`` - profile the block.
+    Nested use joins the outer profile, which the outer block finishes.
+    """
+
+    def __init__(self, label="import"):
+        self.label = label
+        self.profile = None
+        self._owner = False
+
+    def __enter__(self):
+        self._owner = _active is None
+        self.profile = start_profile(self.label)
+        return self.profile
+
+    def __exit__(self, *exc):
+        if self._owner:
+            end_profile()
+        return False
+
+
+def profile_imports_enabled():
+    try:
+        import FreeCAD
+        return FreeCAD.ParamGet(
+            "User parameter:BaseApp/Preferences/Mod/OpenSCAD_Ext"
+        ).GetBool("ProfileImports", False)
+    except Exception:
+        return False
+
+
+def save_profile(profile, top=20):
+    """Write the reports of a finished profile and log where they went."""
+    try:
+        json_path, trace_path = profile.write_reports(top=top)
+    except OSError as e:
+        write_log("Error", f"Cannot write import profile: {e}")
+        return None
+    write_log("Info", profile.summary())
+    write_log("Info", f"Import profile written to {json_path} and {trace_path}")
+    return json_path, trace_path
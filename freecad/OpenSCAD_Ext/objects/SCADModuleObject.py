@@ -1,4 +1,9 @@
+import hashlib
 import os
+import re
+
+import FreeCAD
+
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
 from freecad.OpenSCAD_Ext.commands.baseSCAD import BaseParams
 from freecad.OpenSCAD_Ext.objects.SCADObject import SCADfileBase, ViewSCADProvider
@@ -150,31 +155,100 @@ def generate_scad_import_lines(meta) -> list:
 # SCAD file writer
 # ---------------------------------------------------------------------------
 
-def write_scad_file(obj, module, meta) -> None:
+# Wrapper files are named <module>_<first 12 hex digits of the text's hash>.scad
+_WRAPPER_NAME = re.compile(r"_[0-9a-f]{12}\.scad$")
+
+
+def scad_wrapper_text(obj, module, meta) -> str:
     """
-    Write a minimal SCAD file that imports a library and calls *module*.
+    Text of the wrapper SCAD file: the library imports and a call of *module*
+    with the argument values of *obj*.  The same (library, module, args)
+    always gives the same text.
     """
     module_name       = module.name.strip("()")
     params            = _module_params(module)
     args_declaration  = ", ".join(p.name for p in params)
     args_values       = build_arg_assignments(obj, module)
 
-    try:
-        os.makedirs(os.path.dirname(obj.Proxy.sourceFile), exist_ok=True)
-        with open(obj.Proxy.sourceFile, "w", encoding="utf-8") as fp:
-            write_log("Info", f"Writing SCAD file: {obj.Proxy.sourceFile}")
+    lines = [f"{line};" for line in generate_scad_import_lines(meta)]
+    lines += [
+        "",
+        f"// module {module_name}({args_declaration});",
+        f"{module_name}({args_values});",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def wrapper_path(scad_dir, module, text) -> str:
+    """Content addressed path of a wrapper: identical text, identical file."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(scad_dir, f"{module.name.strip('()')}_{digest}.scad")
+
 
-            for line in generate_scad_import_lines(meta):
-                print(f"{line};", file=fp)
+def write_scad_file(obj, module, meta, scad_dir=None) -> str:
+    """
+    Write the wrapper SCAD file that imports a library and calls *module*.
 
-            print("", file=fp)
-            print(f"// module {module_name}({args_declaration});", file=fp)
-            print(f"{module_name}({args_values});", file=fp)
+    The file is content addressed and only written when it does not already
+    hold the text, so an unchanged wrapper keeps its mtime (and every cache
+    keyed on it stays valid).  Returns the path, or None on error.
+    """
+    if scad_dir is None:
+        scad_dir = BaseParams.getScadSourcePath()
+    text = scad_wrapper_text(obj, module, meta)
+    path = wrapper_path(scad_dir, module, text)
 
-            write_log("Info", f"Module '{module_name}' written with args: {args_values}")
+    try:
+        with open(path, "r", encoding="utf-8") as fp:
+            if fp.read() == text:
+                return path
+    except OSError:
+        pass
 
+    try:
+        os.makedirs(scad_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write(text)
+        write_log("Info", f"Wrote SCAD wrapper {path}")
+        return path
     except Exception as exc:
-        write_log("Error", f"Failed to write SCAD file {obj.Proxy.sourceFile}: {exc}")
+        write_log("Error", f"Failed to write SCAD file {path}: {exc}")
+        return None
+
+
+def _release_wrapper(path, obj) -> None:
+    """Delete a wrapper *obj* no longer uses, unless another open object does."""
+    if not path or not _WRAPPER_NAME.search(os.path.basename(path)):
+        return
+    for doc in FreeCAD.listDocuments().values():
+        for other in doc.Objects:
+            if other is not obj and getattr(other, "sourceFile", None) == path:
+                return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _shared_render(obj, render_key):
+    """
+    Result already rendered by another module object of the document with
+    the same render key (same wrapper text, hence the same library, module
+    and args, and the same mode / fnmax), or None.
+    """
+    if render_key is None:
+        return None
+    for other in obj.Document.Objects:
+        proxy = getattr(other, "Proxy", None)
+        if other is obj or not isinstance(proxy, SCADModuleObject):
+            continue
+        if getattr(proxy, "_render_key", None) != render_key:
+            continue
+        for cached in (getattr(proxy, "_cached_shape", None), getattr(proxy, "_cached_mesh", None)):
+            if cached is not None:
+                write_log("Info", f"{obj.Label}: sharing render of {other.Label}")
+                return cached.copy()
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -204,8 +278,7 @@ class SCADModuleObject(SCADfileBase):
 
         self._init_module_properties(obj)
         self.add_params_as_properties(obj)
-        self._prepare_scad_file(obj)
-        self.renderFunction(obj)
+        self.renderFunction(obj)        # writes the wrapper first
 
     # ------------------------------------------------------------------
     # Helpers
@@ -235,10 +308,27 @@ class SCADModuleObject(SCADfileBase):
         return build_arg_assignments(obj, self.module)
 
     def _prepare_scad_file(self, obj) -> None:
-        scad_dir = BaseParams.getScadSourcePath()
-        obj.Proxy.sourceFile = os.path.join(scad_dir, obj.Name + ".scad")
-        os.makedirs(scad_dir, exist_ok=True)
-        write_scad_file(obj, self.module, self.meta)
+        """Point the object at the wrapper for its current args (written if new)."""
+        path = write_scad_file(obj, self.module, self.meta)
+        if path is None:
+            return
+        old = obj.sourceFile
+        self.sourceFile = path
+        if old != path:
+            obj.sourceFile = path
+            _release_wrapper(old, obj)
+
+    def executeFunction(self, obj, force=False) -> None:
+        # Args may have changed since the last render
+        self._prepare_scad_file(obj)
+        super().executeFunction(obj, force)
+
+    def _render(self, obj, render_key, force=False):
+        # a forced render must run OpenSCAD, not reuse a peer's result
+        shared = None if force else _shared_render(obj, render_key)
+        if shared is not None:
+            return shared
+        return super()._render(obj, render_key, force)
 
     def execute(self, obj) -> None:
         pass
@@ -122,7 +122,9 @@ def createBrep(srcObj, mode, tmpDir, wrkSrc, d_params=None):
 		
         #processCSG(wrkDoc, pathName, tmpFileName, srcObj.fnmax)
         if mode == 'AST-Brep':
-            importASTCSG.processCSG(wrkDoc, tmpFileName, srcObj.fnmax)
+            # Result must be a Part.Shape so keep polyhedra as BRep
+            importASTCSG.processCSG(wrkDoc, tmpFileName, srcObj.fnmax,
+                                    mesh_threshold=0)
 
         elif mode == 'Brep':
             importAltCSG.processCSG(wrkDoc, tmpFileName, srcObj.fnmax)
@@ -226,6 +228,23 @@ def _get_linked_varset(fp):
         return None
 
 
+def _render_key(obj, d_params, closure=None):
+    """
+    Key identifying a render of *obj*: the include closure hash of its source
+    file (the file plus everything it includes / uses) with mode, fnmax and
+    the -D overrides.  *closure* is the closure hash if the caller already
+    has it.  Returns None if the closure cannot be hashed.
+    """
+    try:
+        if closure is None:
+            from freecad.OpenSCAD_Ext.parsers.scadmeta import closure_hash
+            closure = closure_hash(obj.sourceFile)
+        return (closure, obj.mode, obj.fnmax, tuple(d_params or ()))
+    except Exception as e:
+        write_log("SCADfileBase", f"Cannot hash include closure: {e}")
+        return None
+
+
 def shapeFromSourceFile(srcObj, module=False, modules=False):
     print(f"shapeFrom Source File : keepWork {srcObj.keep_work_doc}")
     tmpDir = tempfile.gettempdir()
@@ -469,6 +488,27 @@ class SCADfileBase:
                         "Name of the VarSet whose properties override SCAD variables via -D on execution")
         obj.addProperty("App::PropertyString","companion_mesh","OpenSCAD",
                         "Name of companion Mesh::Feature used for Mesh-mode display (avoids TNP)")
+        self._init_preview_property(obj)
+
+    def _init_preview_property(self, obj):
+        if "live_preview" not in obj.PropertiesList:
+            obj.addProperty("App::PropertyBool","live_preview","OpenSCAD",
+                            "Preview VarSet edits at low resolution while editing, full render when edits stop")
+
+    def onDocumentRestored(self, fp):
+        # Documents saved before live preview existed lack the property
+        self._init_preview_property(fp)
+        if fp.live_preview:
+            self._set_live_preview(fp, True)
+
+    def _set_live_preview(self, fp, on):
+        preview = getattr(self, '_live_preview', None)
+        if preview is not None:
+            preview.stop()
+            self._live_preview = None
+        if on and FreeCAD.GuiUp:
+            from freecad.OpenSCAD_Ext.gui.scad_live_preview import LivePreview
+            self._live_preview = LivePreview(fp)
 
     def onChanged(self, fp, prop):
 
@@ -494,11 +534,14 @@ class SCADfileBase:
         # Set execute=True to re-render after changing mode.
 
         if prop == "execute" and fp.execute:
-            self.executeFunction(fp)
+            self.executeFunction(fp, force=True)
             fp.execute = False
             from PySide.QtCore import QTimer
             QTimer.singleShot(200, lambda: FreeCADGui.SendMsgToActiveView("ViewFit"))
 
+        if prop == "live_preview":
+            self._set_live_preview(fp, fp.live_preview)
+
         if prop == "edit":
             if fp.edit:
                 self.editFile(fp.sourceFile)
@@ -531,12 +574,12 @@ class SCADfileBase:
     # use name render for new workbench
     # redirect for compatibility with old Alternate
     #
-    def renderFunction(self, obj):
+    def renderFunction(self, obj, force=False):
         write_log("Info","Render Function")
-        self.executeFunction(obj)
+        self.executeFunction(obj, force)
 
 
-    def executeFunction(self, obj):
+    def executeFunction(self, obj, force=False):
         import traceback as _tb, datetime as _dt
         _fn = getattr(self, '_execfn_count', 0) + 1
         self._execfn_count = _fn
@@ -548,6 +591,10 @@ class SCADfileBase:
             _f.flush()
         from timeit import default_timer as timer
         write_log("SCADfileBase",f"Execute {obj.Name} Mode {obj.mode} keepWork {obj.keep_work_doc}")
+
+        # A full render supersedes any live preview (pending or on display)
+        if getattr(self, '_live_preview', None) is not None:
+            self._live_preview.clear()
         start = timer()
 
         # Snapshot the VarSet params used for this run so execute() can detect
@@ -561,15 +608,39 @@ class SCADfileBase:
         else:
             self._last_d_params = None
 
+        # Skip OpenSCAD if neither the source, anything it includes / uses,
+        # nor the render settings changed since the last successful run.
+        # The key does not cover import() / surface() files or the OpenSCAD
+        # binary, so an explicit execute / Render (force) always runs.
+        render_key = _render_key(obj, self._last_d_params)
+        if not force and render_key is not None \
+                and render_key == getattr(self, '_render_key', None) \
+                and self._has_render(obj):
+            write_log("SCADfileBase",
+                f"{obj.Name}: source, includes and parameters unchanged - keeping render")
+            obj.execute = False
+            return
+        self._render_key = None
+
         obj.message = ""
-        result = shapeFromSourceFile(obj, modules=obj.modules)
+        result = self._render(obj, render_key, force)
+        self._show_result(obj, result, render_key)
 
+        obj.execute = False
+        end = timer()
+        print(f"==== Create Shape took {end-start} secs ====")
+        FreeCADGui.Selection.addSelection(obj)
+
+
+    def _show_result(self, obj, result, render_key):
+        """Display a render result (Mesh.Mesh, Part.Shape or None) on *obj*."""
         if isinstance(result, Mesh.Mesh):
             # Mesh mode: store mesh on proxy and create/update companion Mesh::Feature.
             # The FeaturePython itself keeps an EMPTY Part.Shape so FreeCAD's TNP
             # never indexes mesh triangles → no spinning cursor on selection.
             self._cached_mesh   = result
             self._cached_shape  = None
+            self._render_key    = render_key
             obj.Shape = Part.Shape()        # empty — companion provides display
             companion_name = getattr(obj, 'companion_mesh', '')
             companion = obj.Document.getObject(companion_name) if companion_name else None
@@ -603,6 +674,7 @@ class SCADfileBase:
 
             self._cached_shape = result
             self._cached_mesh  = None
+            self._render_key   = render_key
             obj.Shape = result
             try:
                 obj.ViewObject.Visibility = True
@@ -616,11 +688,18 @@ class SCADfileBase:
             self._cached_mesh  = None
             obj.Shape = Part.Shape()
 
-        obj.execute = False
-        end = timer()
-        print(f"==== Create Shape took {end-start} secs ====")
-        FreeCADGui.Selection.addSelection(obj)
+    def _render(self, obj, render_key, force=False):
+        """Run OpenSCAD: Mesh.Mesh, Part.Shape or None on failure."""
+        return shapeFromSourceFile(obj, modules=obj.modules)
 
+    def _has_render(self, obj):
+        """True if the result of the last render is still on display."""
+        if getattr(self, '_cached_shape', None) is not None:
+            return True
+        if getattr(self, '_cached_mesh', None) is not None:
+            companion_name = getattr(obj, 'companion_mesh', '')
+            return bool(companion_name) and obj.Document.getObject(companion_name) is not None
+        return False
 
     def editFunction(self, new_file=False):
         obj = self.Object
@@ -767,11 +846,13 @@ class SCADfileBase:
         # Transient runtime attributes must be excluded:
         #   _cached_shape  — Part.Shape/Compound, not JSON serializable
         #   _last_d_params — rebuilt by executeFunction on next run
+        #   _render_key    — identifies the cached render, which is not saved
+        #   _live_preview  — Qt timers / document observer, restarted on restore
         #   _executing     — runtime re-entrancy flag
         #   _initializing  — only meaningful during __init__
         #   Object         — FreeCAD re-injects this; storing it causes cycles
-        _TRANSIENT = {"Object", "_cached_shape", "_cached_mesh", "_last_d_params",
-                      "_executing", "_initializing", "_execute_count", "_execfn_count"}
+        _TRANSIENT = {"Object", "_cached_shape", "_cached_mesh", "_last_d_params", "_render_key",
+                      "_live_preview", "_executing", "_initializing", "_execute_count", "_execfn_count"}
         return {k: v for k, v in self.__dict__.items() if k not in _TRANSIENT}
 
     def __setstate__(self, state):
@@ -781,6 +862,8 @@ class SCADfileBase:
         self._cached_shape  = None
         self._cached_mesh   = None
         self._last_d_params = None
+        self._render_key    = None
+        self._live_preview  = None
         self._executing     = False
         self._initializing  = False
 
@@ -48,4 +48,13 @@ class SCADProjectObject(SCADfileBase):
         """
         Hook for OpenSCAD execution (can be implemented later).
         """
-        return
\ No newline at end of file
+        return
+
+    def renderFunction(self, obj, force=False):
+        """Render All: every SCAD file of the project, concurrently."""
+        from freecad.OpenSCAD_Ext.core.project_render import render_project
+        return render_project(obj, force=force)
+
+    def executeFunction(self, obj, force=False):
+        # The project file itself is not OpenSCAD source
+        return self.renderFunction(obj, force)
\ No newline at end of file
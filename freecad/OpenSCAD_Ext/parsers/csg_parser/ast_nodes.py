@@ -11,6 +11,7 @@ class AstNode:
       - params: typed parameters (for FreeCAD BRep creation)
       - csg_params: raw parameters (for flattening / OpenSCAD fallback)
       - children: child AST nodes
+      - line: 1-based line in the CSG file (set by the parser)
     """
     def __init__(
         self,
@@ -23,6 +24,7 @@ class AstNode:
         self.params = params or {}
         self.csg_params = csg_params
         self.children = children or []
+        self.line = None
 
     def __repr__(self):
         return (
@@ -9,6 +9,7 @@ import ast
 import re
 from FreeCAD import Matrix, Vector
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.logger.import_profiler import profiled
 from freecad.OpenSCAD_Ext.parsers.csg_parser.ast_nodes import (
     AstNode, Cube, Sphere, Cylinder, Union, Difference, Intersection,
     Circle, Square, Polygon, Group, Translate, Rotate, Scale,
@@ -236,6 +237,7 @@ def parse_csg_lines(lines, start=0, indent=0, max_depth=1000):
                 write_log("CSG_PARSE", f"AST node creation failed for '{node_type}': {e}")
                 node = AstNode(node_type, params, raw_csg_params, children)
 
+        node.line = i + 1
         nodes.append(node)
         i = max(next_i, i + 1)
 
@@ -245,6 +247,7 @@ def parse_csg_lines(lines, start=0, indent=0, max_depth=1000):
 # -----------------------------
 # Main entry
 # -----------------------------
+@profiled("parse")
 def parse_csg_file_to_AST_nodes(filename):
     write_log("CSG_PARSE", f"Parsing CSG file: {filename}")
     with open(filename, "r") as f:
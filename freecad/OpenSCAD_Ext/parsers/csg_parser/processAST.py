@@ -23,6 +23,8 @@ from FreeCAD import Vector
 
 #from freecad.OpenSCAD_Ext.commands.baseSCAD import BaseParams
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.logger.import_profiler import profiled, profiled_node
+from freecad.OpenSCAD_Ext.core.scad_primitives import make_primitive, clear_primitive_cache
 #from freecad.OpenSCAD_Ext.parsers.csg_parser.ast_helpers import get_tess, apply_transform
 from freecad.OpenSCAD_Ext.parsers.csg_parser.ast_utils import dump_ast_node
 
@@ -34,7 +36,12 @@ from freecad.OpenSCAD_Ext.parsers.csg_parser.ast_nodes import (
 from freecad.OpenSCAD_Ext.parsers.csg_parser.flattenAST_to_csg import flatten_ast_node_back_to_csg
 
 from freecad.OpenSCAD_Ext.parsers.csg_parser.process_utils import call_openscad_scad_string#
-from freecad.OpenSCAD_Ext.parsers.csg_parser.process_polyhedron import process_polyhedron
+from freecad.OpenSCAD_Ext.parsers.csg_parser.process_polyhedron import (
+    process_polyhedron,
+    polyhedron_to_mesh,
+    mesh_to_shape,
+    DECIMATE_TOLERANCE
+    )
 from freecad.OpenSCAD_Ext.parsers.csg_parser.processHull import try_hull
 from freecad.OpenSCAD_Ext.parsers.csg_parser.processMinkowski import (
     is_ast_sphere,
@@ -44,6 +51,13 @@ from freecad.OpenSCAD_Ext.parsers.csg_parser.processMinkowski import (
     minkowski_shape_with_cylinder
     )    
 from freecad.OpenSCAD_Ext.parsers.csg_parser.process_text import process_text 
+from freecad.OpenSCAD_Ext.parsers.csg_parser.process_extrude import (
+    get_extrude_scale,
+    get_extrude_slices,
+    twisted_extrude_face,
+    make_child_regions,
+    combine_solids
+    )
 
 def generate_stl_from_scad(scad_str, timeout_sec=60):
     write_log("AST","Generate STL from SCAD string")
@@ -87,6 +101,7 @@ def shape_from_scad(scad_str, refine=True):
 
 
     # See also shape_from_scad - uses refine, no so much checking
+@profiled("mesh")
 def stl_to_shape(stl_path, tolerance=0.05, timeout=None):
     """
     Import STL into FreeCAD and convert to Part.Shape.
@@ -175,6 +190,7 @@ def stl_to_shape(stl_path, tolerance=0.05, timeout=None):
         return None
 
 
+@profiled("fallback")
 def fallback_to_OpenSCAD(node, operation_type="Hull", tolerance=1.0, timeout=60):
     """
     Fallback processing for Hull / Minkowski nodes:
@@ -259,6 +275,46 @@ def placement_from_matrix(matrix):
     return FreeCAD.Placement(FreeCAD.Matrix(*fm))
 
 
+# ----------------------------------------------------------
+# Import settings
+# ----------------------------------------------------------
+# fnmax     : $fn / slices above this are treated as smooth (0 = never)
+# threshold : polyhedra with more facets are kept as Mesh.Mesh (0 = never).
+#             They are only converted to BRep when a boolean, extrusion
+#             or Minkowski needs them.
+# decimate  : Mesh.decimate reduction applied to kept meshes (0.0 = off).
+# decimate_tolerance : Mesh.decimate tolerance (simplifier error bound).
+_import_params = {"fnmax": 16, "threshold": 0, "decimate": 0.0,
+                  "decimate_tolerance": DECIMATE_TOLERANCE}
+
+
+def configure_import(fnmax=None, threshold=None, decimate=None):
+    """
+    Set fnmax / facet threshold / decimation, defaults from preferences
+    (the decimation tolerance always comes from preferences)
+    """
+    prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/OpenSCAD")
+    if fnmax is None:
+        fnmax = prefs.GetInt('useMaxFN', 16)
+    if threshold is None:
+        threshold = prefs.GetInt('meshFacetThreshold', 100000)
+    if decimate is None:
+        decimate = prefs.GetFloat('meshDecimate', 0.0)
+    _import_params["fnmax"] = int(fnmax)
+    _import_params["threshold"] = int(threshold)
+    _import_params["decimate"] = float(decimate)
+    _import_params["decimate_tolerance"] = prefs.GetFloat(
+        'meshDecimateTolerance', DECIMATE_TOLERANCE)
+    write_log("AST", f"Import fnmax={fnmax} mesh threshold={threshold} decimate={decimate}")
+
+
+def as_brep(shape):
+    """Return shape as Part.Shape, converting a kept Mesh.Mesh if needed."""
+    if isinstance(shape, Mesh.Mesh):
+        return mesh_to_shape(shape)
+    return shape
+
+
 
 # ----------------------------------------------------------
 # AST Processing
@@ -345,6 +401,7 @@ def make_polygon_with_paths(points, paths):
 
     return Part.Compound(faces)
 
+@profiled_node
 def process_AST_node(node):
 
     """
@@ -403,7 +460,7 @@ def process_AST_node(node):
         else:
             sx = sy = sz = size
 
-        shape = Part.makeBox(sx, sy, sz)
+        shape = make_primitive("cube", (sx, sy, sz))
 
         if center:
             # Encode centering in local_pl (not via translate) so that the
@@ -417,7 +474,7 @@ def process_AST_node(node):
 
     if node_type == "sphere":
         r = node.params.get("r", 1)
-        shape = Part.makeSphere(r)
+        shape = make_primitive("sphere", (r,), params.get("$fn", 0), _import_params["fnmax"])
         return (shape, local_pl)
 
     if node_type == "cylinder":
@@ -426,12 +483,8 @@ def process_AST_node(node):
         r2 = params.get("r2", r1)
         center = params.get("center", False)
 
-        if r1 == r2:
-            shape = Part.makeCylinder(r1, h)
-        elif r1 == 0 or r2 == 0:
-            shape = Part.makeCone(r1, r2, h)  # true cone
-        else:
-            shape = Part.makeCone(r1, r2, h)
+        # cylinder, cone or $fn faceted prism / pyramid
+        shape = make_primitive("cylinder", (h, r1, r2), params.get("$fn", 0), _import_params["fnmax"])
 
         if center:
             # Same pattern as cube: encode centering in local_pl
@@ -440,7 +493,13 @@ def process_AST_node(node):
         return (shape, local_pl)
 
     elif node.node_type == "polyhedron":
-        write_log("AST", f"Processing Polyhedron: points={node.points}, faces={node.faces}")
+        write_log("AST", f"Processing Polyhedron: points={len(node.points)}, faces={len(node.faces)}")
+        threshold = _import_params["threshold"]
+        if threshold and len(node.faces) > threshold:
+            write_log("AST", f"Polyhedron faces > {threshold}, keeping as Mesh")
+            mesh = polyhedron_to_mesh(node.points, node.faces, _import_params["decimate"],
+                                      _import_params["decimate_tolerance"])
+            return (mesh, local_pl)
         return (process_polyhedron(node), local_pl)
 
     elif node.node_type == "text":
@@ -490,12 +549,14 @@ def process_AST_node(node):
 
             # Unpack tuple
             shape_a, placement_a = process_AST_node(child_a)
+            shape_a = as_brep(shape_a)
             return (shape_a.makeOffsetShape(r, 1e-3), placement_a * local_pl)
 
         if is_ast_sphere(child_a):
             r = get_ast_radius(child_a)
             # unpack tuple
             shape_b, placement_b = process_AST_node(child_b)
+            shape_b = as_brep(shape_b)
             print(f"shape b {shape_b}")
             return (shape_b.makeOffsetShape(r, 1e-3), placement_b * local_pl)
 
@@ -504,12 +565,14 @@ def process_AST_node(node):
         if is_ast_cylinder(child_b):
             # unpack tuple
             shape_a, placement_a = process_AST_node(child_a)
+            shape_a = as_brep(shape_a)
             print(f"shape {shape_a} type {shape_a.ShapeType}")
             return (minkowski_shape_with_cylinder(shape_a, child_b), placement_a * local_pl)
 
         if is_ast_cylinder(child_a):
             # unpack tuple
             shape_b, placement_b = process_AST_node(child_b)
+            shape_b = as_brep(shape_b)
             #print(f"shape {shape_b} type {shape_b.ShapeType}")
 
             return (minkowski_shape_with_cylinder(shape_b, child_a),  placement_b * local_pl)
@@ -615,11 +678,20 @@ def process_AST_node(node):
             height = params.get("height", 1)
             center = params.get("center", False)
             twist = params.get("twist", 0)
+            scale = get_extrude_scale(params)
+            slices = get_extrude_slices(params, twist)
+            scaled = scale != (1.0, 1.0)
 
-            write_log("Extrusion", f"Height={height} Center={center} Twist={twist}")
+            write_log("Extrusion", f"Height={height} Center={center} Twist={twist} Scale={scale}")
 
-            solids = []
+            if abs(height) < 1e-9:
+                write_log("Extrusion", "Height ≈ 0 — skipping")
+                return []
 
+            # Collect the faces of each 2D child, then combine each child
+            # into a region (faces with holes) so each is extruded once and
+            # the solids need no fuse when known to be disjoint.
+            children = []
             for child in node.children:
                 child_results = _as_list(process_AST_node(child))
 
@@ -630,49 +702,42 @@ def process_AST_node(node):
                     s = shape.copy()
                     s.Placement = pl
 
-                    faces = compound_to_faces(s)
-                    write_log("Extrusion", f"Faces found: {len(faces)}")
-
-                    for idx, face in enumerate(faces):
-
+                    child_faces = []
+                    for idx, face in enumerate(compound_to_faces(s)):
                         if face.Area < 1e-9:
                             write_log("Extrusion", f"Skipping degenerate face {idx}")
                             continue
+                        child_faces.append(face)
+                    if child_faces:
+                        children.append(child_faces)
 
-                        if abs(height) < 1e-9:
-                            write_log("Extrusion", "Height ≈ 0 — skipping")
-                            continue
+            write_log("Extrusion", f"Faces found: {sum(len(c) for c in children)}")
+            faces, disjoint = make_child_regions(children)
+
+            solids = []
+            for idx, face in enumerate(faces):
+                if twist == 0 and not scaled:
+                    solid = face.extrude(App.Vector(0, 0, height))
+                else:
+                    solid = twisted_extrude_face(
+                        face, height, twist, scale,
+                        slices if twist != 0 else 1,
+                        _import_params["fnmax"]
+                    )
+
+                write_log(
+                    "Extrusion",
+                    f"Solid {idx} Z-range: "
+                    f"{solid.BoundBox.ZMin} → {solid.BoundBox.ZMax}"
+                )
 
-                        if twist == 0:
-                            solid = face.extrude(App.Vector(0, 0, height))
-                        else:
-                            segments = max(int(abs(twist) / 5), 1)
-                            layers = []
-                            for i in range(segments + 1):
-                                z = height * i / segments
-                                angle = twist * i / segments
-                                f2 = face.copy()
-                                f2.rotate(App.Vector(0,0,0), App.Vector(0,0,1), angle)
-                                f2.translate(App.Vector(0,0,z))
-                                layers.append(f2)
-
-                            solid = Part.makeLoft(layers, True, True)
-
-                        write_log(
-                            "Extrusion",
-                            f"Solid {idx} Z-range: "
-                            f"{solid.BoundBox.ZMin} → {solid.BoundBox.ZMax}"
-                        )
-
-                        solids.append(solid)
+                solids.append(solid)
 
             if not solids:
                 write_log("Extrusion", "No solids produced")
                 return []
 
-            result = solids[0]
-            for s in solids[1:]:
-                result = result.fuse(s)
+            result = combine_solids(solids, disjoint)
 
             # Encode centering in local_pl rather than calling translate().
             # shape.translate() may modify the shape's internal TopLoc_Location;
@@ -702,51 +767,53 @@ def process_AST_node(node):
             center = params.get("center", False)
             segments = max(int(abs(angle) / 5), 8)  # 5° per segment, min 8
 
-            solids = []
-
+            children = []
             for child in node.children:
                 for shape, pl in _as_list(process_AST_node(child)):
+                    if shape is None:
+                        continue
                     s = shape.copy()
                     s.Placement = pl  # transforms already applied
 
                     # Expect Wire or Face
                     if isinstance(s, Part.Wire):
-                        face = Part.Face(s)
-                    elif isinstance(s, Part.Face):
-                        face = s
+                        children.append([Part.Face(s)])
+                    elif isinstance(s, (Part.Face, Part.Compound)):
+                        children.append(compound_to_faces(s))
                     else:
                         write_log("Extrusion", f"Skipping non-face/wire child: {s}")
-                        continue
 
-                    # ---- Fast path: full rotation with single segment
-                    if angle == 360:
-                        solid = face.revolve(App.Vector(0,0,0), App.Vector(0,0,1), angle)
-                    else:
-                        # ---- Slow path: partial rotation or segments
-                        step_angle = angle / segments
-                        layers = [face]
-                        for i in range(1, segments + 1):
-                            rotated = face.copy()
-                            rotated.rotate(App.Vector(0,0,0), App.Vector(0,0,1), step_angle * i)
-                            layers.append(rotated)
+            faces, disjoint = make_child_regions(children)
 
-                        solid = Part.makeLoft(layers, True, True)
+            solids = []
+            for face in faces:
+                # ---- Fast path: full rotation with single segment
+                if angle == 360:
+                    solid = face.revolve(App.Vector(0,0,0), App.Vector(0,0,1), angle)
+                else:
+                    # ---- Slow path: partial rotation or segments
+                    step_angle = angle / segments
+                    layers = [face]
+                    for i in range(1, segments + 1):
+                        rotated = face.copy()
+                        rotated.rotate(App.Vector(0,0,0), App.Vector(0,0,1), step_angle * i)
+                        layers.append(rotated)
 
-                    # ---- Center after extrusion using bounding box
-                    if center:
-                        bb = solid.BoundBox
-                        dz = (bb.ZMin + bb.ZMax) / 2
-                        solid.translate(App.Vector(0, 0, -dz))
+                    solid = Part.makeLoft(layers, True, True)
 
-                    solids.append(solid)
+                solids.append(solid)
 
             if not solids:
                 return []
 
-            # fuse all child extrusions
-            result = solids[0]
-            for s in solids[1:]:
-                result = result.fuse(s)
+            # disjoint region faces → compound, otherwise one fuse
+            result = combine_solids(solids, disjoint)
+
+            # ---- Center after extrusion using bounding box
+            if center:
+                bb = result.BoundBox
+                dz = (bb.ZMin + bb.ZMax) / 2
+                result.translate(App.Vector(0, 0, -dz))
 
             return (result, local_pl)
 
@@ -762,7 +829,7 @@ def process_AST_node(node):
             for shape, pl in _as_list(lst):
                 if shape is None:
                     continue
-                s = shape.copy()
+                s = as_brep(shape).copy()
                 # Part.Shape.copy() resets the OCC TopLoc_Location, so setting
                 # s.Placement afterwards would be lost by any subsequent copy().
                 # transformShape() bakes the placement directly into vertex/edge
@@ -914,7 +981,7 @@ def process_AST_node(node):
                 r = 1.0
                 write_log("AST", "Circle missing radius, defaulting to 1")
 
-        face = Part.Face(Part.Wire([Part.makeCircle(r)]))
+        face = make_primitive("circle", (r,), params.get("$fn", 0), _import_params["fnmax"])
         return face, local_pl
 
 
@@ -983,7 +1050,7 @@ def _make_compound_from_results(shape_pl_list):
     solids = []
     for shape, pl in shape_pl_list:
         try:
-            s = shape.copy()
+            s = as_brep(shape).copy()
             s.transformShape(pl.Matrix)
             solids.append(s)
         except Exception as e:
@@ -997,10 +1064,14 @@ def _make_compound_from_results(shape_pl_list):
         return None
 
 
-def process_AST(nodes, mode="multiple"):
+def process_AST(nodes, mode="multiple", fnmax=None, mesh_threshold=None, mesh_decimate=None):
     """
     Process a list of AST nodes.
 
+    fnmax / mesh_threshold / mesh_decimate : see configure_import, None
+    uses the preference values.  Results may then contain Mesh.Mesh objects
+    in place of Part.Shape for oversized polyhedra.
+
     Returns:
         List of (name, shape, placement) tuples
 
@@ -1021,6 +1092,8 @@ def process_AST(nodes, mode="multiple"):
     child produces multiple shapes (inner group leak), bundle them into a
     single Part.Compound before adding to the document.
     """
+    configure_import(fnmax, mesh_threshold, mesh_decimate)
+    clear_primitive_cache()
     results = []
 
     for node in nodes:
@@ -1,5 +1,6 @@
 from FreeCAD import Vector, Matrix
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.logger.import_profiler import profiled
 from freecad.OpenSCAD_Ext.parsers.csg_parser.process_hull_spheres import hull_spheres
 from freecad.OpenSCAD_Ext.parsers.csg_parser.process_hull_cylinders import hull_cylinders_cones
 from freecad.OpenSCAD_Ext.parsers.csg_parser.process_hull_cubes import hull_cubes
@@ -8,6 +9,7 @@ from freecad.OpenSCAD_Ext.parsers.csg_parser.process_hull_cubes import hull_cube
 # -----------------------------
 # Public API
 # -----------------------------
+@profiled("hull")
 def try_hull(node):
     write_log("AST", f"Try Hull node_type={node.node_type}")
 
@@ -0,0 +1,259 @@
+import math
+import FreeCAD as App
+import Part
+
+from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+
+# ------------------------------------------------
+# linear_extrude with twist and / or scale
+# ------------------------------------------------
+#
+# OpenSCAD semantics
+#   - positive twist rotates clockwise looking down Z (left handed)
+#   - scale is a number or [sx, sy] applied at the top, linearly in z
+#   - slices is emitted in CSG output; if missing derive from $fn
+#
+# Constant twist with no scale is built as a single sweep guided by an
+# auxiliary helix when the slice count exceeds fnmax (treated as smooth,
+# as importAltCSG does for circles).  Otherwise a ruled loft through
+# slices + 1 sections is built.
+
+
+def get_extrude_scale(params):
+    """Return (sx, sy) from linear_extrude scale param."""
+    scale = params.get("scale", 1)
+    if isinstance(scale, (list, tuple)):
+        if len(scale) >= 2:
+            return float(scale[0]), float(scale[1])
+        if len(scale) == 1:
+            return float(scale[0]), float(scale[0])
+        return 1.0, 1.0
+    try:
+        return float(scale), float(scale)
+    except (TypeError, ValueError):
+        return 1.0, 1.0
+
+
+def get_extrude_slices(params, twist):
+    """
+    Number of slices for a twisted / scaled linear_extrude.
+    slices param first, then $fn, then the old 5 degree per layer rule.
+    """
+    slices = params.get("slices")
+    if isinstance(slices, (int, float)) and slices >= 1:
+        return int(slices)
+
+    fn = params.get("$fn", 0)
+    if isinstance(fn, (int, float)) and fn > 0:
+        return max(int(math.ceil(fn * abs(twist) / 360.0)), 1)
+
+    return max(int(abs(twist) / 5), 1)
+
+
+def _section_matrix(z, angle, sx, sy):
+    """
+    Matrix for a section at height z: rotate about Z, scale, move -
+    Scaling * Rotation as OpenSCAD's add_slice, so a non-uniform scale
+    stretches the twisted profile along the fixed X / Y axes.
+    """
+    m = App.Matrix()
+    m.rotateZ(math.radians(angle))
+    m.scale(sx, sy, 1)
+    m.move(App.Vector(0, 0, z))
+    return m
+
+
+def _loft_wire(wire, height, twist, sx, sy, slices):
+    """Ruled loft of one profile wire through slices + 1 sections."""
+    sections = []
+    for i in range(slices + 1):
+        t = i / slices
+        z = height * t
+        fx = 1.0 + (sx - 1.0) * t
+        fy = 1.0 + (sy - 1.0) * t
+        if abs(fx) < 1e-9 and abs(fy) < 1e-9:
+            # scale=0 top, loft to apex
+            sections.append(Part.Vertex(App.Vector(0, 0, z)))
+            break
+        sections.append(wire.transformGeometry(_section_matrix(z, -twist * t, fx, fy)))
+    return Part.makeLoft(sections, True, True)
+
+
+def _helix_sweep_wire(wire, height, twist, radius):
+    """
+    Sweep one profile wire along Z keeping its orientation tied to an
+    auxiliary helix - one face per profile edge, no intermediate sections.
+    """
+    spine = Part.Wire(Part.LineSegment(App.Vector(0, 0, 0),
+                                       App.Vector(0, 0, height)).toShape())
+    pitch = height * 360.0 / abs(twist)
+    helix = Part.makeHelix(pitch, height, radius, 0, twist > 0)
+
+    sweep = Part.BRepOffsetAPI.MakePipeShell(spine)
+    sweep.setAuxiliarySpine(Part.Wire(helix.Edges), True, 0)
+    sweep.add(wire)
+    if not sweep.isReady():
+        raise RuntimeError("MakePipeShell not ready")
+    sweep.build()
+    sweep.makeSolid()
+    return sweep.shape()
+
+
+def twisted_extrude_face(face, height, twist, scale=(1.0, 1.0), slices=1, fnmax=0):
+    """
+    Extrude a face with twist and / or scale.
+    Holes are built from the inner wires and cut from the outer solid.
+    Returns Part.Shape
+    """
+    sx, sy = scale
+    smooth = (
+        twist != 0
+        and abs(sx - 1.0) < 1e-9 and abs(sy - 1.0) < 1e-9
+        and fnmax != 0 and slices > fnmax
+    )
+
+    if smooth:
+        bb = face.BoundBox
+        radius = max(math.hypot(bb.XMax, bb.YMax), math.hypot(bb.XMin, bb.YMin), 1.0)
+
+        def build(w):
+            return _helix_sweep_wire(w, height, twist, radius)
+        method = "helix sweep"
+    else:
+        def build(w):
+            return _loft_wire(w, height, twist, sx, sy, slices)
+        method = f"ruled loft slices={slices}"
+
+    outer = face.OuterWire
+    try:
+        solid = build(outer)
+        holes = [build(w) for w in face.Wires if not w.isSame(outer)]
+    except Exception as e:
+        if not smooth:
+            raise
+        write_log("Extrusion", f"Helix sweep failed ({e}), using ruled loft")
+        return twisted_extrude_face(face, height, twist, scale, slices, fnmax=0)
+
+    if holes:
+        solid = solid.cut(holes)
+
+    write_log(
+        "Extrusion",
+        f"Twist={twist} scale={scale} via {method}, faces={len(solid.Faces)}"
+    )
+    return solid
+
+
+# ------------------------------------------------
+# 2D regions for extrusion
+# ------------------------------------------------
+#
+# The faces of one 2D child (one polygon) are normally disjoint or
+# nested (holes), so they can be combined into faces-with-holes and
+# extruded / revolved in one go, without fusing the per face solids.
+# Overlapping faces still need the boolean so are reported and the
+# caller falls back.
+#
+# Even-odd nesting only applies within a child: OpenSCAD unions the
+# children, so a child inside another is filled, not a hole.  Children
+# are kept as a compound only when they are fully separate.
+
+
+def _bbox_overlap(a, b, tol):
+    return not (
+        a.XMax < b.XMin - tol or b.XMax < a.XMin - tol or
+        a.YMax < b.YMin - tol or b.YMax < a.YMin - tol
+    )
+
+
+def faces_disjoint_or_nested(faces, tol=1e-7):
+    """
+    True if no two face boundaries touch or cross, i.e. each pair is
+    either separate or one lies completely inside the other.
+    Cheap bounding box rejection first, boundary distance only for
+    overlapping boxes.
+    """
+    boxes = [f.BoundBox for f in faces]
+    for i in range(len(faces)):
+        for j in range(i + 1, len(faces)):
+            if not _bbox_overlap(boxes[i], boxes[j], tol):
+                continue
+            dist = faces[i].OuterWire.distToShape(faces[j].OuterWire)[0]
+            if dist <= tol:
+                return False
+    return True
+
+
+def make_region(faces, tol=1e-7):
+    """
+    Combine a list of 2D faces into faces-with-holes using even-odd
+    nesting (as makeholedshape does) via FaceMakerBullseye.
+    Returns (list_of_faces, disjoint) - disjoint False means the faces
+    overlap and the input faces are returned unchanged.
+    """
+    if len(faces) < 2:
+        return faces, True
+
+    if not faces_disjoint_or_nested(faces, tol):
+        write_log("Extrusion", f"{len(faces)} faces overlap, region not built")
+        return faces, False
+
+    wires = []
+    for f in faces:
+        wires.extend(f.Wires)
+    try:
+        region = Part.makeFace(wires, "Part::FaceMakerBullseye")
+    except Exception as e:
+        write_log("Extrusion", f"FaceMakerBullseye failed ({e}), using faces")
+        return faces, False
+
+    region_faces = list(region.Faces)
+    write_log("Extrusion", f"Region {len(faces)} faces -> {len(region_faces)} face(s) with holes")
+    return region_faces, True
+
+
+def _faces_apart(a, b, tol):
+    """True if no face of *a* touches, crosses or lies inside a face of *b*."""
+    for fa in a:
+        for fb in b:
+            if not _bbox_overlap(fa.BoundBox, fb.BoundBox, tol):
+                continue
+            if fa.distToShape(fb)[0] <= tol:
+                return False
+    return True
+
+
+def make_child_regions(children, tol=1e-7):
+    """
+    Regions of several 2D children - *children* is a list of face lists,
+    one per child.  Each child is combined with make_region; the children
+    are then only disjoint if they are fully separate from one another.
+    Returns (list_of_faces, disjoint) - disjoint False means the caller
+    must fuse the solids (union of the children).
+    """
+    faces, disjoint = [], True
+    regions = []
+    for child_faces in children:
+        region, child_disjoint = make_region(child_faces, tol)
+        disjoint = disjoint and child_disjoint
+        regions.append(region)
+        faces.extend(region)
+
+    if disjoint:
+        for i in range(len(regions)):
+            for j in range(i + 1, len(regions)):
+                if not _faces_apart(regions[i], regions[j], tol):
+                    write_log("Extrusion", f"Children {i} and {j} touch or nest, fusing")
+                    return faces, False
+    return faces, disjoint
+
+
+def combine_solids(solids, disjoint):
+    """
+    Compound for disjoint solids, a single multi-argument fuse otherwise.
+    """
+    if len(solids) == 1:
+        return solids[0]
+    if disjoint:
+        return Part.makeCompound(solids)
+    return solids[0].fuse(solids[1:])
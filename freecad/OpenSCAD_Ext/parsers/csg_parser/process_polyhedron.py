@@ -1,60 +1,204 @@
 import numpy as np
+from timeit import default_timer as timer
+
 import FreeCAD
 import Part
 # from OCC.Core.TopoDS import TopoDS_Shape
 
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
 
-def process_polyhedron(node):
+# Faces per timing report unit
+_FACES_PER_REPORT = 10000
+
+# Tolerance used when sewing / converting mesh facets
+_SEW_TOLERANCE = 1e-6
+
+# Mesh.decimate tolerance - the simplifier's error bound, not a sewing
+# distance.  Same default as the Mesh workbench Decimation dialog.
+DECIMATE_TOLERANCE = 0.1
+
+
+def _is_triangle_mesh(faces):
+    """True if every polyhedron face has exactly three indices."""
+    return all(len(f) == 3 for f in faces)
+
+
+def _solid_from_shell(shell):
     """
-    Convert a Polyhedron AST node into a FreeCAD Part.Shape.
-    Uses only FreeCAD Part methods (makePolygon, makeFace, makeSolid).
-    Retains centroid instrumentation.
+    Turn a closed shell into a correctly oriented Solid.
+    OpenSCAD polyhedra list faces clockwise (inward normals in OCC terms),
+    so reverse the solid if the volume comes out negative.
+    Returns None if the shell is not closed.
     """
+    if not shell.isClosed():
+        return None
+    solid = Part.Solid(shell)
+    if solid.Volume < 0:
+        solid.reverse()
+    return solid
 
-    points = node.points
-    faces = node.faces
 
-    if not points or not faces:
-        return None
+def polyhedron_to_mesh(points, faces, decimate=0.0, tolerance=DECIMATE_TOLERANCE):
+    """
+    Build a Mesh.Mesh from polyhedron points / faces in one call.
+    Polygonal faces are fan triangulated.
+    decimate  : reduction factor 0.0 - 1.0 passed to Mesh.decimate,
+                0.0 leaves the mesh untouched.
+    tolerance : Mesh.decimate tolerance.
+    """
+    import Mesh
+
+    facets = []
+    for face_indices in faces:
+        idx = [int(i) for i in face_indices]
+        for k in range(1, len(idx) - 1):
+            facets.append((idx[0], idx[k], idx[k + 1]))
+
+    mesh = Mesh.Mesh()
+    mesh.addFacets(([FreeCAD.Vector(*p) for p in points], facets))
+    mesh.harmonizeNormals()
+
+    if decimate > 0.0:
+        before = mesh.CountFacets
+        mesh.decimate(tolerance, min(decimate, 0.99))
+        write_log("Polyhedron", f"Decimated mesh {before} -> {mesh.CountFacets} facets")
+        if mesh.CountFacets >= before:
+            write_log("Polyhedron",
+                      f"Decimation removed nothing - tolerance {tolerance} too small?")
+
+    return mesh
+
+
+def mesh_to_shape(mesh, tolerance=_SEW_TOLERANCE):
+    """
+    Convert a Mesh.Mesh to a Part Solid (or shell if not closed).
+    Used when a polyhedron kept as a mesh is needed for a boolean.
+    """
+    start = timer()
+    shape = Part.Shape()
+    shape.makeShapeFromMesh(mesh.Topology, tolerance)
+
+    if len(shape.Shells) == 1:
+        solid = _solid_from_shell(shape.Shells[0])
+        if solid is not None:
+            shape = solid
+
+    write_log(
+        "Polyhedron",
+        f"Mesh -> BRep {mesh.CountFacets} facets in {timer() - start:.3f} secs"
+    )
+    return shape
+
+
+def polyhedron_from_triangles(points, faces):
+    """
+    Fast path for pure triangle polyhedra.
+    Build a Mesh.Mesh in one call then convert with makeShapeFromMesh,
+    which sews the facets in C++ rather than per face in Python.
+    """
+    mesh = polyhedron_to_mesh(points, faces)
+
+    shape = Part.Shape()
+    shape.makeShapeFromMesh(mesh.Topology, _SEW_TOLERANCE)
+    return shape
 
-    # ---- centroid for instrumentation
-    cx = sum(p[0] for p in points) / len(points)
-    cy = sum(p[1] for p in points) / len(points)
-    cz = sum(p[2] for p in points) / len(points)
-    poly_center = (cx, cy, cz)
 
-    # ---- build faces using FreeCAD Part API
+def polyhedron_from_polygons(points, faces):
+    """
+    Index based builder for polygonal (non triangle) polyhedra.
+    Every vertex and every edge is created once and shared by the
+    faces using it, so the resulting shell is already connected.
+    """
+    vertices = [Part.Vertex(FreeCAD.Vector(*p)) for p in points]
+    edges = {}
     part_faces = []
+
     for face_indices in faces:
-        face_pts = [FreeCAD.Vector(*points[idx]) for idx in face_indices]
+        idx = [int(i) for i in face_indices]
+        face_edges = []
+        for a, b in zip(idx, idx[1:] + idx[:1]):
+            if a == b:
+                continue
+            key = (a, b) if a < b else (b, a)
+            edge = edges.get(key)
+            if edge is None:
+                edge = Part.Edge(vertices[key[0]], vertices[key[1]])
+                edges[key] = edge
+            face_edges.append(edge)
+
+        try:
+            wire = Part.Wire(face_edges)
+            face = Part.Face(wire)
+        except Part.OCCError:
+            # Non planar polygon, let OCC fill it
+            face = Part.makeFilledFace(face_edges)
+        part_faces.append(face)
 
-        # optional: reverse face if orientation check fails
-        # if should_reverse(face_pts, poly_center):
-        #     face_pts.reverse()
+    write_log(
+        "Polyhedron",
+        f"shared vertices={len(vertices)}, edges={len(edges)}, faces={len(part_faces)}"
+    )
+    return Part.Shell(part_faces)
 
-        # make wire & face
-        wire = Part.makePolygon(face_pts + [face_pts[0]])  # close polygon
-        face = Part.Face(wire)
-        part_faces.append(face)
 
-    # ---- assemble into a compound
-    shape = Part.Compound(part_faces)
+def process_polyhedron(node):
+    """
+    Convert a Polyhedron AST node into a FreeCAD Part.Shape.
+
+    Triangle meshes go via Mesh -> makeShapeFromMesh, polygonal faces
+    via the index based builder with shared edges.  A single sewing
+    pass is only run if the result is not already closed.
+    Returns a Solid when possible, otherwise the (open) shell.
+    """
+    points = node.points
+    faces = node.faces
+
+    if not points or not faces:
+        return None
 
-    # ---- try to make a solid if possible
-    try:
-        shape = Part.makeSolid(shape)
-    except Exception:
-        # fallback to compound if faces don't form closed shell
-        pass
+    start = timer()
+
+    # ---- centroid for instrumentation
+    poly_center = tuple(np.asarray(points, dtype=float).mean(axis=0))
+
+    if _is_triangle_mesh(faces):
+        build = "mesh"
+        shape = polyhedron_from_triangles(points, faces)
+    else:
+        build = "shared-edge"
+        shape = polyhedron_from_polygons(points, faces)
+
+    shell = shape if shape.ShapeType == "Shell" else None
+    if shell is None and len(shape.Shells) == 1:
+        shell = shape.Shells[0]
+
+    solid = _solid_from_shell(shell) if shell is not None else None
+    if solid is None:
+        # ---- single sewing pass
+        write_log("Polyhedron", "Shell not closed, sewing")
+        sewn = shape.copy()
+        sewn.sewShape(_SEW_TOLERANCE)
+        if len(sewn.Shells) == 1:
+            solid = _solid_from_shell(sewn.Shells[0])
+        if solid is None:
+            write_log("Polyhedron", "Sewing did not close shell, returning open shape")
+            solid = sewn
+
+    elapsed = timer() - start
 
     # ---- instrumentation
     write_log(
         "Polyhedron",
-        f"centroid: {poly_center}, points={len(points)}, faces={len(faces)}"
+        f"centroid: {poly_center}, points={len(points)}, faces={len(faces)}, "
+        f"build={build}, type={solid.ShapeType}"
+    )
+    write_log(
+        "Polyhedron",
+        f"Built in {elapsed:.3f} secs "
+        f"({elapsed * _FACES_PER_REPORT / len(faces):.3f} secs per 10k faces)"
     )
 
-    return shape
+    return solid
 
 '''
 def topo_to_part_shape(solid: TopoDS_Shape):
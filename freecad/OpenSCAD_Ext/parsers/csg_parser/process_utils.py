@@ -20,6 +20,7 @@ from pathlib import Path
 
 #from freecad.OpenSCAD_Ext.commands.baseSCAD import BaseParams
 from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
+from freecad.OpenSCAD_Ext.logger.import_profiler import profiled
 # -----------------------------
 # Utility functions
 # -----------------------------
@@ -47,6 +48,7 @@ def get_openscad_executable():          # Shared Function
     return openscad_exe
 
 
+@profiled("openscad")
 def call_openscad_scad_string(
     scad_str,
     export_type="stl",      # "stl"  Note: dxf does not work with Pipes use different function
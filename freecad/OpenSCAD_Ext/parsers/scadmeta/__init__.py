@@ -5,12 +5,18 @@ Public API
 ----------
     from freecad.OpenSCAD_Ext.parsers.scadmeta import (
         scan_scad_file,
+        scan_scad_files,
         scan_scad_directory,
         ScadMeta,
         ScadModuleMeta,
         ScadFunctionMeta,
         ScadParam,
         ScadFileType,
+        include_closure,   # file + everything it includes / uses
+        closure_hash,      # content hash of include_closure()
+        closure_hashes,    # closure_hash of many files, one shared walk
+        dependants,        # files including / using a file
+        get_symbol_index,  # name search over every cached symbol
     )
 
 File type classification
@@ -36,9 +42,17 @@ from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_model import (
 )
 from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_scanner import (
     scan_scad_file,
+    scan_scad_files,
     scan_scad_directory,
 )
 from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import get_cache
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_deps import (
+    include_closure,
+    closure_hash,
+    closure_hashes,
+    dependants,
+)
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_index import get_symbol_index
 
 __all__ = [
     "ScadMeta",
@@ -48,6 +62,12 @@ __all__ = [
     "ScadFileType",
     "classify_file_type",
     "scan_scad_file",
+    "scan_scad_files",
     "scan_scad_directory",
     "get_cache",
+    "include_closure",
+    "closure_hash",
+    "closure_hashes",
+    "dependants",
+    "get_symbol_index",
 ]
@@ -1,32 +1,55 @@
 """
-TinyDB-backed cache for SCAD file metadata, with optional Watchdog monitoring.
+SQLite-backed cache for SCAD file metadata, with optional Watchdog monitoring.
 
 Workflow
 --------
 1. ``ScadMetaCache.get(path)`` returns a cached ``ScadMeta`` dict if the file
-   has not changed since it was last parsed (checked via mtime then SHA-256).
-2. ``ScadMetaCache.put(path, meta_dict)`` stores a fresh result.
-3. ``ScadMetaCache.watch_directory(dir)`` starts a Watchdog observer that
-   automatically invalidates stale cache entries when SCAD files change on disk.
-
-The cache is stored as a plain JSON file managed by TinyDB.  Its default
-location is::
-
-    <FreeCAD-user-data>/OpenSCAD_Ext/scad_meta_cache.json
+   has not changed since it was last parsed (checked via size, mtime and
+   inode, then SHA-256 only if those differ).  ``get_many(paths)`` does the
+   same for many files with one ``os.scandir`` pass per directory and one
+   database read.
+2. ``ScadMetaCache.put(path, meta_dict)`` stores a fresh result
+   (``put_many`` stores a batch in one transaction).
+3. ``ScadMetaCache.watch_directory(dir, recursive=True)`` starts a Watchdog
+   observer that invalidates stale cache entries when SCAD files change on
+   disk.  Events are debounced per path (``debounce``, default 250 ms) and
+   applied in batches; with ``set_background_reparse(True)`` changed files
+   are re-parsed straight away so the next ``get`` is a hit.
+4. ``ScadMetaCache.set_dependencies`` / ``dependants`` persist the resolved
+   include/use graph (see :mod:`scadmeta_deps`).  Invalidating a file
+   notifies listeners of it and of every file that includes it, directly or
+   transitively.
+5. Each stored file's modules, functions and variables are kept in a
+   ``scad_symbols`` table for the library symbol search
+   (see :mod:`scadmeta_index`).
+
+The cache is a SQLite database (stdlib ``sqlite3``, WAL mode) with one row
+per file keyed by absolute path.  Each thread uses its own connection, so
+readers do not block each other or a writer; writes are serialised by a lock
+and run in a transaction.  Its default location is::
+
+    <FreeCAD-user-data>/OpenSCAD_Ext/scad_meta_cache.db
 
 On non-FreeCAD environments (unit tests, CLI tools) it falls back to::
 
-    ~/.cache/openscad_ext/scad_meta_cache.json
+    ~/.cache/openscad_ext/scad_meta_cache.db
+
+Entries from the previous TinyDB cache (``scad_meta_cache.json`` in the same
+directory) are imported once when the database is created, and the JSON
+file is renamed to ``scad_meta_cache.json.migrated``.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import os
+import sqlite3
 import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set
 
 log = logging.getLogger(__name__)
 
@@ -34,15 +57,6 @@ log = logging.getLogger(__name__)
 # Optional dependencies – degrade gracefully if not installed
 # ---------------------------------------------------------------------------
 
-try:
-    from tinydb import TinyDB, Query
-    from tinydb.storages import JSONStorage
-    from tinydb.middlewares import CachingMiddleware
-    _TINYDB_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    _TINYDB_AVAILABLE = False
-    log.warning("tinydb not installed – SCAD metadata cache disabled.")
-
 try:
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
@@ -56,15 +70,96 @@ except ImportError:  # pragma: no cover
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _default_cache_path() -> str:
-    """Return the platform-appropriate cache file path."""
+_SCHEMA_VERSION = 4
+
+_SCHEMA = ("""
+CREATE TABLE IF NOT EXISTS scad_meta (
+    path     TEXT PRIMARY KEY,
+    mtime    REAL NOT NULL,
+    hash     TEXT NOT NULL,
+    meta     TEXT NOT NULL,
+    size     INTEGER NOT NULL DEFAULT -1,
+    mtime_ns INTEGER NOT NULL DEFAULT -1,
+    inode    INTEGER NOT NULL DEFAULT -1
+) WITHOUT ROWID
+""", """
+CREATE TABLE IF NOT EXISTS scad_deps (
+    src TEXT NOT NULL,
+    dep TEXT NOT NULL,
+    PRIMARY KEY (src, dep)
+) WITHOUT ROWID
+""", """
+CREATE INDEX IF NOT EXISTS scad_deps_dep ON scad_deps (dep)
+""", """
+CREATE TABLE IF NOT EXISTS scad_symbols (
+    path        TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    line        INTEGER NOT NULL,
+    params      TEXT NOT NULL,
+    description TEXT NOT NULL
+)
+""", """
+CREATE INDEX IF NOT EXISTS scad_symbols_path ON scad_symbols (path)
+""")
+
+# Version 1 tables lack the fast-key columns; -1 forces a hash check once.
+_UPGRADE_V1 = (
+    "ALTER TABLE scad_meta ADD COLUMN size INTEGER NOT NULL DEFAULT -1",
+    "ALTER TABLE scad_meta ADD COLUMN mtime_ns INTEGER NOT NULL DEFAULT -1",
+    "ALTER TABLE scad_meta ADD COLUMN inode INTEGER NOT NULL DEFAULT -1",
+)
+
+# Max host parameters per statement (SQLite < 3.32 limit is 999)
+_SQL_BATCH = 900
+
+# Fewer wanted files than this in a directory are stat'ed, not scandir'ed
+_SCANDIR_MIN = 8
+
+
+def default_cache_dir() -> str:
+    """Return the platform-appropriate directory for cache files."""
     try:
         import FreeCAD  # type: ignore
         base = FreeCAD.getUserAppDataDir()
-        return os.path.join(base, "OpenSCAD_Ext", "scad_meta_cache.json")
+        return os.path.join(base, "OpenSCAD_Ext")
     except Exception:
-        cache_dir = Path.home() / ".cache" / "openscad_ext"
-        return str(cache_dir / "scad_meta_cache.json")
+        return str(Path.home() / ".cache" / "openscad_ext")
+
+
+def _default_cache_path() -> str:
+    """Return the platform-appropriate cache file path."""
+    return os.path.join(default_cache_dir(), "scad_meta_cache.db")
+
+
+def _legacy_json_path(cache_path: str) -> str:
+    """Path of the TinyDB JSON cache that preceded *cache_path*."""
+    return os.path.join(os.path.dirname(cache_path), "scad_meta_cache.json")
+
+
+def _symbol_rows(path: str, meta_dict: Dict) -> List[tuple]:
+    """
+    ``(path, kind, name, line, params, description)`` rows for the symbol
+    index: every module, function and top-level variable in *meta_dict*.
+    """
+    rows = []
+    for kind, key in (("module", "modules"), ("function", "functions")):
+        for m in meta_dict.get(key, []):
+            params = ", ".join(
+                p["name"] if p.get("default") is None else f"{p['name']}={p['default']}"
+                for p in m.get("params", [])
+            )
+            rows.append((path, kind, m.get("name", ""), m.get("line_number", 0),
+                         params, m.get("description", "")))
+    descriptions = meta_dict.get("variable_descriptions", {})
+    for name in meta_dict.get("variables", {}):
+        rows.append((path, "variable", name, 0, "", descriptions.get(name, "")))
+    return rows
+
+
+def _fast_key(st) -> tuple:
+    """(size, mtime_ns, inode) from an ``os.stat_result``."""
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
 
 
 def _sha256(path: str) -> str:
@@ -75,22 +170,118 @@ def _sha256(path: str) -> str:
     return h.hexdigest()
 
 
+# ---------------------------------------------------------------------------
+# Debounced invalidation queue
+# ---------------------------------------------------------------------------
+
+class _InvalidationQueue:
+    """
+    Collects changed paths from Watchdog and applies them in batches.
+
+    Editors emit several events per save (truncate, write, chmod, rename),
+    so each path is only applied once no new event has arrived for it for
+    *debounce* seconds.  All paths due at the same time are invalidated in
+    one transaction and, optionally, re-parsed in the background so the next
+    :meth:`ScadMetaCache.get` is a hit.
+    """
+
+    def __init__(self, cache: "ScadMetaCache", debounce: float = 0.25) -> None:
+        self._cache = cache
+        self.debounce = debounce
+        self.reparse = False
+        self._pending: Dict[str, float] = {}   # path -> due time
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def push(self, path: str) -> None:
+        """Queue *path*, restarting its debounce interval."""
+        with self._cond:
+            self._pending[os.path.abspath(path)] = time.monotonic() + self.debounce
+            if self._thread is None:
+                self._stopping = False
+                self._thread = threading.Thread(
+                    target=self._run, name="scadmeta-invalidate", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _take_due(self) -> Optional[List[str]]:
+        """Wait for the next batch of due paths; None when stopping."""
+        with self._cond:
+            while True:
+                if self._stopping:
+                    return None
+                now = time.monotonic()
+                due = [p for p, t in self._pending.items() if t <= now]
+                if due:
+                    for p in due:
+                        del self._pending[p]
+                    return due
+                timeout = min(self._pending.values()) - now if self._pending else None
+                self._cond.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            paths = self._take_due()
+            if paths is None:
+                return
+            self._apply(paths)
+
+    def _apply(self, paths: List[str]) -> None:
+        log.debug("watchdog: invalidating %d file(s)", len(paths))
+        self._cache.invalidate_many(paths)
+        if self.reparse:
+            existing = [p for p in paths if os.path.isfile(p)]
+            if existing:
+                try:
+                    from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_scanner import (
+                        scan_scad_files,
+                    )
+                    scan_scad_files(existing)
+                except Exception as exc:
+                    log.debug("Background re-parse failed: %s", exc)
+
+    def flush(self) -> None:
+        """Apply everything pending now, ignoring the debounce interval."""
+        with self._cond:
+            paths = list(self._pending)
+            self._pending.clear()
+        if paths:
+            self._cache.invalidate_many(paths)
+
+    def stop(self) -> None:
+        """Stop the worker thread; pending paths are dropped."""
+        with self._cond:
+            self._stopping = True
+            self._pending.clear()
+            thread, self._thread = self._thread, None
+            self._cond.notify()
+        if thread is not None:
+            thread.join(timeout=5)
+
+
 # ---------------------------------------------------------------------------
 # Watchdog handler
 # ---------------------------------------------------------------------------
 
 if _WATCHDOG_AVAILABLE:
     class _ScadChangeHandler(FileSystemEventHandler):
-        """Invalidates cache entries when SCAD files are modified or deleted."""
+        """Queues SCAD files that are created, modified, moved or deleted."""
 
-        def __init__(self, cache: "ScadMetaCache") -> None:
+        def __init__(self, queue: _InvalidationQueue) -> None:
             super().__init__()
-            self._cache = cache
+            self._queue = queue
 
-        def _handle(self, path: str) -> None:
+        def _handle(self, path) -> None:
+            if isinstance(path, bytes):
+                path = os.fsdecode(path)
             if path.lower().endswith(".scad"):
-                log.debug("watchdog: invalidating cache for %s", path)
-                self._cache.invalidate(path)
+                self._queue.push(path)
+
+        def on_created(self, event: "FileSystemEvent") -> None:
+            if not event.is_directory:
+                self._handle(event.src_path)
 
         def on_modified(self, event: "FileSystemEvent") -> None:
             if not event.is_directory:
@@ -102,7 +293,9 @@ if _WATCHDOG_AVAILABLE:
 
         def on_moved(self, event: "FileSystemEvent") -> None:
             if not event.is_directory:
+                # editors often save by renaming a temp file over the target
                 self._handle(event.src_path)
+                self._handle(event.dest_path)
 
 
 # ---------------------------------------------------------------------------
@@ -116,40 +309,114 @@ class ScadMetaCache:
     Parameters
     ----------
     cache_path:
-        Path to the TinyDB JSON file.  Defaults to the FreeCAD user-data
+        Path to the SQLite database.  Defaults to the FreeCAD user-data
         directory or ``~/.cache/openscad_ext/``.
+    debounce:
+        Seconds without a new Watchdog event before a changed file is
+        invalidated.
     """
 
-    def __init__(self, cache_path: Optional[str] = None) -> None:
+    def __init__(self, cache_path: Optional[str] = None, debounce: float = 0.25) -> None:
         self._path = cache_path or _default_cache_path()
-        self._lock = threading.Lock()
-        self._db: Optional[object] = None
-        self._table: Optional[object] = None
+        self._lock = threading.Lock()          # serialises writers
+        self._local = threading.local()        # per-thread connection
+        self._conns: List[sqlite3.Connection] = []
+        self._available = False
         self._observer: Optional[object] = None
-        self._watched: set = set()
+        self._watches: Dict[str, tuple] = {}   # directory -> (ObservedWatch, recursive)
+        self._watch_lock = threading.Lock()
+        self._queue = _InvalidationQueue(self, debounce)
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        self._store_listeners: List[Callable[[Set[str]], None]] = []
 
-        if _TINYDB_AVAILABLE:
-            self._open_db()
+        self._open_db()
 
     # ------------------------------------------------------------------
     # Database lifecycle
     # ------------------------------------------------------------------
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=5.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conns.append(conn)
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
     def _open_db(self) -> None:
-        os.makedirs(os.path.dirname(self._path), exist_ok=True)
         try:
-            self._db = TinyDB(
-                self._path,
-                storage=CachingMiddleware(JSONStorage),
-            )
-            self._table = self._db.table("scad_meta")
-        except Exception as exc:  # pragma: no cover
-            log.warning("Failed to open TinyDB cache at %s: %s", self._path, exc)
-            self._db = None
-            self._table = None
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            conn = self._conn()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            with self._lock, conn:
+                for stmt in _SCHEMA:
+                    conn.execute(stmt)
+                if version == 1:
+                    for stmt in _UPGRADE_V1:
+                        conn.execute(stmt)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._available = True
+        except (OSError, sqlite3.Error) as exc:  # pragma: no cover
+            log.warning("Failed to open SQLite cache at %s: %s", self._path, exc)
+            return
+
+        if version == 0:
+            self._migrate_json(_legacy_json_path(self._path))
+        if version < 4:
+            self._backfill_symbols()
+
+    def _backfill_symbols(self) -> None:
+        """Fill ``scad_symbols`` from metadata stored before it existed."""
+        try:
+            conn = self._conn()
+            rows = []
+            for path, meta_json in conn.execute("SELECT path, meta FROM scad_meta"):
+                try:
+                    rows.extend(_symbol_rows(path, json.loads(meta_json)))
+                except (ValueError, KeyError, TypeError):
+                    continue
+            with self._lock, conn:
+                conn.execute("DELETE FROM scad_symbols")
+                conn.executemany(
+                    "INSERT INTO scad_symbols VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+        except sqlite3.Error as exc:
+            log.warning("Could not build symbol table: %s", exc)
+
+    def _migrate_json(self, json_path: str) -> None:
+        """Import entries from a TinyDB JSON cache, then rename it."""
+        if not os.path.isfile(json_path):
+            return
+        try:
+            with open(json_path, "r", encoding="utf-8") as fh:
+                table = json.load(fh).get("scad_meta", {})
+            rows = [
+                (r["path"], r["mtime"], r["hash"], json.dumps(r["meta"]))
+                for r in table.values()
+                if "path" in r and "meta" in r
+            ]
+            conn = self._conn()
+            with self._lock, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO scad_meta (path, mtime, hash, meta) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            os.replace(json_path, json_path + ".migrated")
+            log.info("Migrated %d entries from %s", len(rows), json_path)
+        except (OSError, ValueError, KeyError, AttributeError, sqlite3.Error) as exc:
+            log.warning("Could not migrate JSON cache %s: %s", json_path, exc)
 
     def close(self) -> None:
-        """Flush cache to disk and stop watchdog observer."""
+        """Close database connections and stop watchdog observer."""
         if self._observer and _WATCHDOG_AVAILABLE:
             try:
                 self._observer.stop()
@@ -157,13 +424,18 @@ class ScadMetaCache:
             except Exception:
                 pass
             self._observer = None
+            self._watches.clear()
+        self._queue.stop()
 
-        if self._db is not None:
-            try:
-                self._db.close()  # type: ignore[union-attr]
-            except Exception:
-                pass
-            self._db = None
+        with self._lock:
+            for conn in self._conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._conns.clear()
+        self._local = threading.local()
+        self._available = False
 
     # ------------------------------------------------------------------
     # Cache read / write
@@ -173,119 +445,413 @@ class ScadMetaCache:
         """
         Return the cached metadata dict for *path* if still valid, else ``None``.
 
-        Validity is determined first by mtime (cheap), then confirmed by
-        SHA-256 hash (only when mtime changed).
+        Validity is determined first by (size, mtime_ns, inode) (cheap), then
+        confirmed by SHA-256 hash (only when size matches but the rest changed).
         """
-        if self._table is None:
-            return None
-
-        path = os.path.abspath(path)
-
-        with self._lock:
-            Q = Query()
-            record = self._table.get(Q.path == path)  # type: ignore[union-attr]
-
-        if record is None:
-            return None
+        return self.get_many([path]).get(os.path.abspath(path))
 
+    def get_many(self, paths: List[str]) -> Dict[str, Dict]:
+        """
+        Return ``{abs_path: meta_dict}`` for those *paths* with a valid entry.
+
+        Files are stat'ed with one ``os.scandir`` pass per directory (plain
+        ``os.stat`` for just a few files) and all rows are fetched in one read
+        transaction.  An entry is valid when
+        (size, mtime_ns, inode) match; if only mtime / inode changed (touch,
+        copy, atomic save) the SHA-256 decides, and matching entries have
+        their fast key refreshed in one write.
+        """
+        if not self._available or not paths:
+            return {}
+
+        wanted = {os.path.abspath(p) for p in paths}
+
+        # --- one scandir pass per directory ---
+        stats: Dict[str, tuple] = {}
+        by_dir: Dict[str, set] = {}
+        for p in wanted:
+            by_dir.setdefault(os.path.dirname(p), set()).add(os.path.basename(p))
+        for directory, names in by_dir.items():
+            if len(names) < _SCANDIR_MIN:
+                # a few files in a big folder - stat them directly
+                for name in names:
+                    p = os.path.join(directory, name)
+                    try:
+                        stats[p] = _fast_key(os.stat(p))
+                    except OSError:
+                        pass
+                continue
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name in names:
+                            try:
+                                # follows symlinks like os.stat() in put();
+                                # DirEntry.stat() has st_ino = 0 on Windows
+                                st = entry.stat()
+                                stats[entry.path] = (st.st_size, st.st_mtime_ns,
+                                                     st.st_ino or entry.inode())
+                            except OSError:
+                                pass
+            except OSError:
+                continue
+
+        # --- one locked read ---
+        present = [p for p in wanted if p in stats]
+        rows = []
         try:
-            current_mtime = os.path.getmtime(path)
-            cached_mtime = record.get("mtime", -1)
-
-            if abs(current_mtime - cached_mtime) < 0.002:
-                # mtime matches – trust the cache
-                return record.get("meta")
-
-            # mtime changed – confirm with hash
-            if _sha256(path) == record.get("hash", ""):
-                # content unchanged, update mtime
-                with self._lock:
-                    Q = Query()
-                    self._table.update(  # type: ignore[union-attr]
-                        {"mtime": current_mtime}, Q.path == path
-                    )
-                return record.get("meta")
+            conn = self._conn()
+            with self._lock:
+                conn.execute("BEGIN")
+                try:
+                    for i in range(0, len(present), _SQL_BATCH):
+                        chunk = present[i:i + _SQL_BATCH]
+                        rows.extend(conn.execute(
+                            "SELECT path, size, mtime_ns, inode, hash, meta "
+                            "FROM scad_meta WHERE path IN "
+                            f"({','.join('?' * len(chunk))})",
+                            chunk,
+                        ).fetchall())
+                finally:
+                    conn.commit()
+        except sqlite3.Error as exc:
+            log.debug("Cache get_many failed: %s", exc)
+            return {}
+
+        # --- validate ---
+        result: Dict[str, Dict] = {}
+        refresh = []
+        for path, size, mtime_ns, inode, cached_hash, meta_json in rows:
+            key = stats[path]
+            if key != (size, mtime_ns, inode):
+                if size not in (-1, key[0]):
+                    continue
+                try:
+                    if _sha256(path) != cached_hash:
+                        continue
+                except OSError:
+                    continue
+                refresh.append((key[1] / 1e9, key[0], key[1], key[2], path))
+            try:
+                result[path] = json.loads(meta_json)
+            except ValueError:
+                pass
 
-        except OSError:
-            pass
+        if refresh:
+            try:
+                with self._lock, conn:
+                    conn.executemany(
+                        "UPDATE scad_meta SET mtime = ?, size = ?, mtime_ns = ?, inode = ? "
+                        "WHERE path = ?",
+                        refresh,
+                    )
+            except sqlite3.Error as exc:
+                log.debug("Cache fast-key refresh failed: %s", exc)
 
-        return None
+        return result
 
     def put(self, path: str, meta_dict: Dict) -> None:
         """Store *meta_dict* for *path* in the cache."""
-        if self._table is None:
+        self.put_many({path: meta_dict})
+
+    def put_many(self, items: Dict[str, Dict]) -> None:
+        """
+        Store several ``{path: meta_dict}`` results in one transaction.
+
+        Files are stat'ed and hashed before the write lock is taken.
+        """
+        if not self._available or not items:
             return
 
-        path = os.path.abspath(path)
+        rows = []
+        symbols = []
+        for path, meta_dict in items.items():
+            path = os.path.abspath(path)
+            try:
+                st = os.stat(path)
+                rows.append((
+                    path,
+                    st.st_mtime,
+                    _sha256(path),
+                    json.dumps(meta_dict),
+                    *_fast_key(st),
+                ))
+                symbols.extend(_symbol_rows(path, meta_dict))
+            except OSError as exc:
+                log.debug("Cache put failed for %s: %s", path, exc)
 
         try:
-            record = {
-                "path": path,
-                "mtime": os.path.getmtime(path),
-                "hash": _sha256(path),
-                "meta": meta_dict,
-            }
-            with self._lock:
-                Q = Query()
-                self._table.upsert(record, Q.path == path)  # type: ignore[union-attr]
-                # Flush the caching middleware
-                if hasattr(self._db, "storage") and hasattr(self._db.storage, "flush"):
-                    self._db.storage.flush()  # type: ignore[union-attr]
-        except Exception as exc:
-            log.debug("Cache put failed for %s: %s", path, exc)
+            conn = self._conn()
+            with self._lock, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO scad_meta "
+                    "(path, mtime, hash, meta, size, mtime_ns, inode) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.executemany(
+                    "DELETE FROM scad_symbols WHERE path = ?", [(r[0],) for r in rows]
+                )
+                conn.executemany(
+                    "INSERT INTO scad_symbols VALUES (?, ?, ?, ?, ?, ?)", symbols
+                )
+        except sqlite3.Error as exc:
+            log.debug("Cache put_many failed: %s", exc)
+            return
+
+        self._notify_stored({r[0] for r in rows})
 
     def invalidate(self, path: str) -> None:
-        """Remove the cache entry for *path*."""
-        if self._table is None:
+        """
+        Remove the cache entry for *path* and notify invalidation listeners
+        with *path* plus all of its (transitive) dependants.
+        """
+        self.invalidate_many([path])
+
+    def invalidate_many(self, paths: Iterable[str]) -> None:
+        """Remove the entries for *paths* in one transaction, then notify once."""
+        if not self._available:
             return
 
-        path = os.path.abspath(path)
-        with self._lock:
-            Q = Query()
-            self._table.remove(Q.path == path)  # type: ignore[union-attr]
+        paths = sorted({os.path.abspath(p) for p in paths})
+        if not paths:
+            return
+        try:
+            conn = self._conn()
+            with self._lock, conn:
+                conn.executemany(
+                    "DELETE FROM scad_meta WHERE path = ?", [(p,) for p in paths]
+                )
+                conn.executemany(
+                    "DELETE FROM scad_symbols WHERE path = ?", [(p,) for p in paths]
+                )
+        except sqlite3.Error as exc:
+            log.debug("Cache invalidate failed for %s: %s", paths, exc)
+            return
+
+        self._notify(set(paths) | self.dependants(paths))
+
+    # ------------------------------------------------------------------
+    # include / use dependency graph
+    # ------------------------------------------------------------------
+
+    def set_dependencies(self, deps: Dict[str, List[str]]) -> None:
+        """
+        Replace the resolved include/use targets of each source file in
+        *deps* (``{src_path: [dep_path, ...]}``) in one transaction.
+        """
+        if not self._available or not deps:
+            return
+        try:
+            conn = self._conn()
+            with self._lock, conn:
+                for src, targets in deps.items():
+                    src = os.path.abspath(src)
+                    conn.execute("DELETE FROM scad_deps WHERE src = ?", (src,))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO scad_deps (src, dep) VALUES (?, ?)",
+                        [(src, os.path.abspath(d)) for d in targets],
+                    )
+        except sqlite3.Error as exc:
+            log.debug("Cache set_dependencies failed: %s", exc)
+
+    def dependencies(self, path: str) -> List[str]:
+        """Return the stored include/use targets of *path*."""
+        if not self._available:
+            return []
+        try:
+            rows = self._conn().execute(
+                "SELECT dep FROM scad_deps WHERE src = ?", (os.path.abspath(path),)
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+        return [r[0] for r in rows]
+
+    def dependants(self, paths: Iterable[str], transitive: bool = True) -> Set[str]:
+        """
+        Return the files that include / use any of *paths*, following the
+        reverse graph to all levels when *transitive* is ``True``.
+        The given *paths* themselves are not included.
+        """
+        if not self._available:
+            return set()
+
+        start = {os.path.abspath(p) for p in paths}
+        found: Set[str] = set()
+        frontier = list(start)
+        try:
+            conn = self._conn()
+            while frontier:
+                level: Set[str] = set()
+                for i in range(0, len(frontier), _SQL_BATCH):
+                    chunk = frontier[i:i + _SQL_BATCH]
+                    level.update(r[0] for r in conn.execute(
+                        "SELECT src FROM scad_deps WHERE dep IN "
+                        f"({','.join('?' * len(chunk))})",
+                        chunk,
+                    ))
+                frontier = list(level - found - start)
+                found.update(frontier)
+                if not transitive:
+                    break
+        except sqlite3.Error as exc:
+            log.debug("Cache dependants failed: %s", exc)
+        return found
+
+    def add_invalidation_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """
+        Call *callback(paths)* whenever entries are invalidated; *paths* holds
+        the changed files and all files depending on them.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_invalidation_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Remove a callback added by :meth:`add_invalidation_listener`."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def add_store_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Call *callback(paths)* after new results for *paths* are stored."""
+        if callback not in self._store_listeners:
+            self._store_listeners.append(callback)
+
+    def remove_store_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Remove a callback added by :meth:`add_store_listener`."""
+        if callback in self._store_listeners:
+            self._store_listeners.remove(callback)
+
+    def _notify_stored(self, paths: Set[str]) -> None:
+        for callback in list(self._store_listeners):
+            try:
+                callback(paths)
+            except Exception as exc:
+                log.debug("Store listener failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Symbol table
+    # ------------------------------------------------------------------
+
+    def symbols(self, paths: Optional[Iterable[str]] = None) -> List[tuple]:
+        """
+        Return ``(path, kind, name, line, params, description)`` rows for all
+        cached files, or only for *paths*.
+        """
+        if not self._available:
+            return []
+        try:
+            conn = self._conn()
+            if paths is None:
+                return conn.execute("SELECT * FROM scad_symbols").fetchall()
+            wanted = [os.path.abspath(p) for p in paths]
+            rows: List[tuple] = []
+            for i in range(0, len(wanted), _SQL_BATCH):
+                chunk = wanted[i:i + _SQL_BATCH]
+                rows.extend(conn.execute(
+                    "SELECT * FROM scad_symbols WHERE path IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                ))
+            return rows
+        except sqlite3.Error as exc:
+            log.debug("Cache symbols failed: %s", exc)
+            return []
+
+    def _notify(self, paths: Set[str]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(paths)
+            except Exception as exc:
+                log.debug("Invalidation listener failed: %s", exc)
 
     def clear(self) -> None:
         """Remove all cached entries."""
-        if self._table is None:
+        if not self._available:
             return
-        with self._lock:
-            self._table.truncate()  # type: ignore[union-attr]
+        try:
+            conn = self._conn()
+            with self._lock, conn:
+                paths = {r[0] for r in conn.execute("SELECT path FROM scad_meta")}
+                conn.execute("DELETE FROM scad_meta")
+                conn.execute("DELETE FROM scad_deps")
+                conn.execute("DELETE FROM scad_symbols")
+        except sqlite3.Error as exc:
+            log.debug("Cache clear failed: %s", exc)
+            return
+        self._notify(paths)
 
     # ------------------------------------------------------------------
     # Watchdog directory monitoring
     # ------------------------------------------------------------------
 
-    def watch_directory(self, directory: str, recursive: bool = False) -> None:
+    def watch_directory(self, directory: str, recursive: bool = True) -> None:
         """
         Start watching *directory* for SCAD file changes.
 
-        When a watched file changes on disk its cache entry is automatically
-        invalidated so the next call to :meth:`get` triggers a re-parse.
-        Does nothing if watchdog is not installed.
+        When a watched file changes on disk its cache entry is invalidated
+        (debounced, see :class:`_InvalidationQueue`) so the next call to
+        :meth:`get` triggers a re-parse.  A directory already covered by a
+        recursive watch is not scheduled again, and a new recursive watch
+        replaces the watches below it.  Does nothing if watchdog is not
+        installed.
         """
         if not _WATCHDOG_AVAILABLE:
             log.debug("watchdog not available – directory watching skipped.")
             return
 
         directory = os.path.abspath(directory)
-        if directory in self._watched:
-            return
-
-        if self._observer is None:
-            self._observer = Observer()
-            self._observer.start()  # type: ignore[union-attr]
+        with self._watch_lock:
+            for watched, (_, rec) in self._watches.items():
+                if watched == directory and (rec or not recursive):
+                    return
+                if rec and directory.startswith(watched + os.sep):
+                    return
+
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.start()  # type: ignore[union-attr]
+
+            if recursive:
+                for watched in [w for w in self._watches
+                                if w == directory or w.startswith(directory + os.sep)]:
+                    self._unschedule(watched)
 
-        handler = _ScadChangeHandler(self)
-        self._observer.schedule(handler, directory, recursive=recursive)  # type: ignore[union-attr]
-        self._watched.add(directory)
-        log.debug("watchdog: watching %s", directory)
+            try:
+                watch = self._observer.schedule(  # type: ignore[union-attr]
+                    _ScadChangeHandler(self._queue), directory, recursive=recursive
+                )
+            except OSError as exc:
+                log.debug("watchdog: cannot watch %s: %s", directory, exc)
+                return
+            self._watches[directory] = (watch, recursive)
+        log.debug("watchdog: watching %s recursive=%s", directory, recursive)
+
+    def _unschedule(self, directory: str) -> None:
+        watch, _ = self._watches.pop(directory)
+        try:
+            self._observer.unschedule(watch)  # type: ignore[union-attr]
+        except Exception as exc:
+            log.debug("watchdog: unschedule %s failed: %s", directory, exc)
 
     def stop_watching(self, directory: str) -> None:
-        """Stop watching a specific directory (best-effort)."""
-        # Watchdog does not expose per-directory unschedule easily; clear all
-        # and restart remaining watches.
+        """Stop watching *directory* (as passed to :meth:`watch_directory`)."""
         directory = os.path.abspath(directory)
-        self._watched.discard(directory)
+        with self._watch_lock:
+            if directory in self._watches:
+                self._unschedule(directory)
+
+    def watched_directories(self) -> Dict[str, bool]:
+        """Return ``{directory: recursive}`` for the active watches."""
+        with self._watch_lock:
+            return {d: rec for d, (_, rec) in self._watches.items()}
+
+    def set_background_reparse(self, enabled: bool) -> None:
+        """Re-parse changed files in the background after invalidation."""
+        self._queue.reparse = enabled
+
+    def flush_invalidations(self) -> None:
+        """Apply pending Watchdog invalidations immediately."""
+        self._queue.flush()
 
 
 # ---------------------------------------------------------------------------
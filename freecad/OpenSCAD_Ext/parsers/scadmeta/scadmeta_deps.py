@@ -0,0 +1,214 @@
+"""
+include / use dependency graph for SCAD files.
+
+OpenSCAD looks up ``include <name>`` and ``use <name>`` first relative to
+the including file's directory, then in each ``OPENSCADPATH`` entry.  This
+module resolves the ``includes`` / ``uses`` recorded in :class:`ScadMeta`
+to real files the same way and stores the edges in the metadata cache
+(``scad_deps`` table) so that reverse queries work across sessions.
+
+Public API
+----------
+    resolve_include(name, from_file) -> str | None
+    resolve_dependencies(path, meta) -> list[str]
+    include_closure(path) -> list[str]
+    include_closures(paths) -> dict[str, list[str]]
+    closure_hash(path) -> str
+    closure_hashes(paths) -> dict[str, str]
+    dependants(path, transitive=True) -> set[str]
+
+``closure_hash`` is a SHA-256 over the content of a file and everything it
+includes or uses, directly or indirectly.  It changes when any file in the
+closure changes, so render results can be keyed on it.  File hashes are
+memoised by (size, mtime_ns, inode), so an unchanged closure costs a
+metadata cache hit and an ``os.stat`` per file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import get_cache, _sha256
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_model import ScadMeta
+
+# path -> ((size, mtime_ns, inode), sha256)
+_hash_memo: Dict[str, Tuple[tuple, str]] = {}
+_memo_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Resolution
+# ---------------------------------------------------------------------------
+
+def library_search_path() -> List[str]:
+    """Directories from ``OPENSCADPATH`` (default library dir if unset)."""
+    from freecad.OpenSCAD_Ext.libraries.ensure_openSCADPATH import ensure_openSCADPATH
+    return [p for p in ensure_openSCADPATH().split(os.pathsep) if p]
+
+
+def resolve_include(name: str, from_file: str,
+                    search_path: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Resolve an include / use *name* as seen from *from_file*.
+
+    Returns the absolute path, or ``None`` if it cannot be found.
+    """
+    if os.path.isabs(name):
+        return os.path.normpath(name) if os.path.isfile(name) else None
+
+    dirs = [os.path.dirname(os.path.abspath(from_file))]
+    dirs.extend(search_path if search_path is not None else library_search_path())
+    for directory in dirs:
+        candidate = os.path.normpath(os.path.join(directory, name))
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def resolve_dependencies(path: str, meta: ScadMeta,
+                         search_path: Optional[List[str]] = None) -> List[str]:
+    """
+    Resolved targets of the ``include`` and ``use`` statements in *meta*.
+
+    ``comment_includes`` (BOSL2 documentation headers) are not dependencies.
+    Unresolvable names are skipped.
+    """
+    if search_path is None:
+        search_path = library_search_path()
+    deps: List[str] = []
+    for name in list(meta.includes) + list(meta.uses):
+        target = resolve_include(name, path, search_path)
+        if target is not None and target not in deps:
+            deps.append(target)
+    return deps
+
+
+def record_dependencies(metas: Dict[str, ScadMeta]) -> None:
+    """Resolve and store the dependency edges of freshly scanned files."""
+    search_path = library_search_path()
+    get_cache().set_dependencies({
+        path: resolve_dependencies(path, meta, search_path)
+        for path, meta in metas.items()
+    })
+
+
+# ---------------------------------------------------------------------------
+# Closure
+# ---------------------------------------------------------------------------
+
+def _dependency_edges(paths: List[str]) -> Dict[str, List[str]]:
+    """
+    Resolved dependencies of *paths* and of everything they reach, walking
+    the graph once for all of them: a file included by several roots is
+    scanned once.  Metadata comes from the scanner (cache hits for unchanged
+    files), so the graph is always current even for files scanned before
+    edges were stored.
+    """
+    from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_scanner import scan_scad_files
+
+    search_path = library_search_path()
+    frontier = list(dict.fromkeys(paths))
+    seen: Set[str] = set(frontier)
+    edges: Dict[str, List[str]] = {}
+
+    while frontier:
+        level: List[str] = []
+        for src, meta in zip(frontier, scan_scad_files(frontier)):
+            deps = resolve_dependencies(src, meta, search_path)
+            edges[src] = deps
+            for dep in deps:
+                if dep not in seen:
+                    seen.add(dep)
+                    level.append(dep)
+        frontier = level
+
+    cache = get_cache()
+    changed = {
+        src: deps for src, deps in edges.items()
+        if sorted(cache.dependencies(src)) != sorted(deps)
+    }
+    cache.set_dependencies(changed)
+    return edges
+
+
+def _closure_order(path: str, edges: Dict[str, List[str]]) -> List[str]:
+    """*path* and everything reachable from it in *edges*, breadth first."""
+    order = [path]
+    seen: Set[str] = {path}
+    frontier = [path]
+    while frontier:
+        level: List[str] = []
+        for src in frontier:
+            for dep in edges.get(src, ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    order.append(dep)
+                    level.append(dep)
+        frontier = level
+    return order
+
+
+def include_closure(path: str) -> List[str]:
+    """
+    Return *path* followed by every file it includes or uses, directly or
+    transitively, in breadth-first order.
+    """
+    path = os.path.abspath(path)
+    return _closure_order(path, _dependency_edges([path]))
+
+
+def include_closures(paths: List[str]) -> Dict[str, List[str]]:
+    """:func:`include_closure` of each of *paths*, sharing one graph walk."""
+    roots = [os.path.abspath(p) for p in paths]
+    edges = _dependency_edges(roots)
+    return {p: _closure_order(root, edges) for p, root in zip(paths, roots)}
+
+
+def _file_hash(path: str) -> str:
+    """SHA-256 of *path*, memoised by (size, mtime_ns, inode)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ""
+    key = (st.st_size, st.st_mtime_ns, st.st_ino)
+    with _memo_lock:
+        memo = _hash_memo.get(path)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+    digest = _sha256(path)
+    with _memo_lock:
+        _hash_memo[path] = (key, digest)
+    return digest
+
+
+def _hash_members(members: List[str]) -> str:
+    h = hashlib.sha256()
+    for member in members:
+        h.update(member.encode("utf-8"))
+        h.update(b"\0")
+        h.update(_file_hash(member).encode("ascii"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def closure_hash(path: str) -> str:
+    """
+    SHA-256 over the paths and contents of :func:`include_closure` (*path*).
+    """
+    return _hash_members(include_closure(path))
+
+
+def closure_hashes(paths: List[str]) -> Dict[str, str]:
+    """
+    :func:`closure_hash` of each of *paths*.  Includes shared between them
+    are scanned and hashed once.
+    """
+    return {p: _hash_members(members) for p, members in include_closures(paths).items()}
+
+
+def dependants(path: str, transitive: bool = True) -> Set[str]:
+    """Files that include / use *path* (see :meth:`ScadMetaCache.dependants`)."""
+    return get_cache().dependants([path], transitive=transitive)
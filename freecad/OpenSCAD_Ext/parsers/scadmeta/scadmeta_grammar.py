@@ -161,3 +161,133 @@ SCAD_META_GRAMMAR = r"""
     %ignore /\/\/[^\n]*/
     %ignore /\/\*(.|\n)*?\*\//
 """
+
+
+# ---------------------------------------------------------------------------
+# LALR variant
+# ---------------------------------------------------------------------------
+#
+# Same rule and alias names as SCAD_META_GRAMMAR so the tree walker is shared,
+# but written for parser="lalr" with the contextual lexer:
+#
+#   - include / use statements, module bodies and function bodies are
+#     removed by a pre-lexer before parsing (see ``_skim_source``), so
+#     ``<path>`` never reaches the lexer and ``<`` is always the comparison
+#     operator.
+#   - NUMBER has no leading minus; negative literals parse as ``neg``, which
+#     reconstructs to the same string.
+#   - BOOL has a higher priority than NAME.
+#
+# Files the LALR parser rejects are re-parsed with the Earley grammar.
+
+SCAD_META_LALR_GRAMMAR = r"""
+    start: statement*
+
+    ?statement: assign_stmt
+              | module_def
+              | function_def
+              | if_stmt
+              | for_stmt
+              | let_stmt
+              | modifier_stmt
+              | call_stmt
+              | ";"
+
+    assign_stmt  : NAME "=" expr ";"
+
+    module_def   : "module" NAME "(" param_list? ")" block
+
+    function_def : "function" NAME "(" param_list? ")" "=" expr ";"
+
+    if_stmt      : "if" "(" expr ")" stmt_body ("else" stmt_body)?
+    for_stmt     : "for" "(" for_assignments ")" stmt_body
+    let_stmt     : "let" "(" assign_list ")" stmt_body
+
+    modifier_stmt : MODIFIER statement
+
+    call_stmt    : call_expr (";" | stmt_body)
+
+    stmt_body    : block | call_stmt | if_stmt | for_stmt | let_stmt | modifier_stmt
+
+    block        : "{" statement* "}"
+
+    call_expr    : NAME "(" arg_list? ")"
+
+    param_list   : param ("," param)* ","?
+    param        : NAME ("=" expr)?
+
+    arg_list     : arg ("," arg)* ","?
+    arg          : (NAME "=")? expr
+
+    for_assignments : for_assign ("," for_assign)*
+    for_assign      : NAME "=" expr
+
+    assign_list  : NAME "=" expr ("," NAME "=" expr)*
+
+    ?expr        : ternary
+
+    ?ternary     : or_expr
+                 | or_expr "?" ternary ":" ternary
+
+    ?or_expr     : and_expr
+                 | or_expr "||" and_expr
+
+    ?and_expr    : not_expr
+                 | and_expr "&&" not_expr
+
+    ?not_expr    : cmp_expr
+                 | "!" not_expr
+
+    ?cmp_expr    : add_expr
+                 | cmp_expr "==" add_expr  -> eq
+                 | cmp_expr "!=" add_expr  -> neq
+                 | cmp_expr "<"  add_expr  -> lt
+                 | cmp_expr "<=" add_expr  -> lte
+                 | cmp_expr ">"  add_expr  -> gt
+                 | cmp_expr ">=" add_expr  -> gte
+
+    ?add_expr    : mul_expr
+                 | add_expr "+" mul_expr   -> add
+                 | add_expr "-" mul_expr   -> sub
+
+    ?mul_expr    : unary_expr
+                 | mul_expr "*" unary_expr -> mul
+                 | mul_expr "/" unary_expr -> div
+                 | mul_expr "%" unary_expr -> mod
+
+    ?unary_expr  : postfix_expr
+                 | "-" unary_expr          -> neg
+                 | "+" unary_expr          -> pos
+
+    ?postfix_expr : primary_expr
+                  | postfix_expr "[" expr "]"    -> index
+                  | NAME "(" arg_list? ")"        -> func_call
+
+    ?primary_expr : NUMBER                 -> number
+                  | ESCAPED_STRING         -> string
+                  | BOOL                   -> bool_val
+                  | "undef"               -> undef_val
+                  | NAME                  -> name_ref
+                  | "(" expr ")"
+                  | vector
+                  | range_expr
+                  | let_expr
+
+    vector       : "[" (expr ("," expr)* ","?)? "]"
+    range_expr   : "[" expr ":" expr (":" expr)? "]"
+    let_expr     : "let" "(" assign_list ")" expr
+
+    MODIFIER    : /[%#!*]/
+
+    BOOL.2      : /(true|false)\b/
+
+    NAME        : /[\$]?[a-zA-Z_][a-zA-Z0-9_]*/
+
+    NUMBER      : /([0-9]+(\.[0-9]*)?|\.[0-9]+)(e[+-]?[0-9]+)?/i
+
+    %import common.ESCAPED_STRING
+    %import common.WS
+    %ignore WS
+    %ignore /\/\/[^\n]*/
+    %ignore /\/\*(.|\n)*?\*\//
+"""
@@ -0,0 +1,294 @@
+"""
+Library-wide symbol index built from the metadata cache.
+
+Every module, function and top-level variable of every cached SCAD file is
+kept in the cache's ``scad_symbols`` table (written together with the
+metadata, so it is persistent and always in step with it).  This module
+loads that table once and answers name searches in memory:
+
+    from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_index import get_symbol_index
+
+    for sym in get_symbol_index().search("cyl"):
+        print(sym.kind, sym.name, sym.path, sym.line)
+
+Ranking
+-------
+1. exact name
+2. name prefix
+3. name substring
+4. fuzzy - the query letters appear in order in the name (``cyl`` -> ``cuboid_cylinder``)
+5. parameter names / description text contain every query word
+
+Within a rank shorter names come first.  The index follows the cache: new
+results and invalidations only reload the symbols of the files concerned.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import os
+import re
+import threading
+from dataclasses import dataclass
+from itertools import accumulate, count
+from operator import add, itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import ScadMetaCache, get_cache
+
+
+@dataclass(frozen=True, order=True)
+class ScadSymbol:
+    """One module, function or variable defined in a SCAD file."""
+
+    name: str
+    kind: str          # "module" | "function" | "variable"
+    path: str
+    line: int          # 1-based, 0 if unknown (variables)
+    params: str        # "a, b=1" for modules / functions
+    description: str
+
+
+class SymbolIndex:
+    """
+    In-memory search structure over the cache's symbol table.
+
+    Sorted lower-case names give prefix search by bisection; newline-joined
+    name and text blobs let substring and fuzzy matching run as single
+    ``str.find`` / regex scans instead of a Python loop per symbol.
+    """
+
+    def __init__(self, cache: Optional[ScadMetaCache] = None) -> None:
+        self._cache = cache or get_cache()
+        self._lock = threading.Lock()
+        # path -> [(name.lower(), name, path, line, search text, ScadSymbol)]
+        self._by_path: Dict[str, List[tuple]] = {}
+        self._load_lock = threading.Lock()
+        self._loaded = False
+        # paths refreshed since the last rebuild, None = rebuild everything
+        self._changed: Optional[Set[str]] = None
+
+        # rebuilt from _by_path on the next search after a change
+        self._entries: List[tuple] = []
+        self._names = ""
+        self._name_starts: List[int] = []
+        self._texts = ""
+        self._text_starts: List[int] = []
+
+    # ------------------------------------------------------------------
+    # Loading / incremental update
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """
+        Load all symbols from the cache and follow its changes.  Safe to
+        call from a background thread; searches wait for it.
+        """
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._cache.add_store_listener(self.refresh)
+            self._cache.add_invalidation_listener(self.refresh)
+            by_path: Dict[str, List[tuple]] = {}
+            for row in self._cache.symbols():
+                by_path.setdefault(row[0], []).append(_entry(row))
+            with self._lock:
+                self._by_path = by_path
+                self._changed = None
+                self._rebuild()
+                self._loaded = True
+
+    def refresh(self, paths: Iterable[str]) -> None:
+        """Reload the symbols of *paths* from the cache."""
+        paths = {os.path.abspath(p) for p in paths}
+        by_path: Dict[str, List[tuple]] = {p: [] for p in paths}
+        for row in self._cache.symbols(paths):
+            by_path.setdefault(row[0], []).append(_entry(row))
+        with self._lock:
+            for path, entries in by_path.items():
+                if entries:
+                    self._by_path[path] = entries
+                else:
+                    self._by_path.pop(path, None)
+            if self._changed is not None:
+                self._changed |= paths
+
+    def _rebuild(self) -> None:
+        """
+        Rebuild the sorted entries and blobs (caller holds the lock).  After
+        a refresh only the changed files' entries are removed and re-inserted.
+        """
+        changed = self._changed
+        if changed is None:
+            entries = [e for group in self._by_path.values() for e in group]
+            entries.sort()
+        else:
+            entries = [e for e in self._entries if e[2] not in changed]
+            for path in changed:
+                for e in self._by_path.get(path, ()):
+                    bisect.insort(entries, e)
+        self._entries = entries
+        self._names, self._name_starts = _blob(list(map(itemgetter(0), entries)))
+        self._texts, self._text_starts = _blob(list(map(itemgetter(4), entries)))
+        self._changed = set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(group) for group in self._by_path.values())
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 100,
+               kinds: Optional[Iterable[str]] = None) -> List[ScadSymbol]:
+        """
+        Return up to *limit* symbols matching *query*, best first.
+        *kinds* restricts the result to e.g. ``{"module"}``.
+        """
+        words = query.lower().split()
+        if not words:
+            return []
+        self.load()
+        with self._lock:
+            if self._changed is None or self._changed:
+                self._rebuild()
+            entries = self._entries
+            names, name_starts = self._names, self._name_starts
+            texts, text_starts = self._texts, self._text_starts
+
+        kinds = set(kinds) if kinds is not None else None
+        seen = set()
+        result: List[ScadSymbol] = []
+
+        def kind_ok(i: int) -> bool:
+            return kinds is None or entries[i][5].kind in kinds
+
+        def shortest(i: int) -> tuple:
+            return (len(entries[i][0]), i)
+
+        def take(indices: List[int]) -> bool:
+            """Append a rank's matches, shortest name first; True when full."""
+            picked = [i for i in indices if i not in seen and kind_ok(i)]
+            picked.sort(key=shortest)
+            for i in picked:
+                seen.add(i)
+                result.append(entries[i][5])
+                if len(result) >= limit:
+                    return True
+            return False
+
+        cap = limit * 4
+        if len(words) == 1:
+            w = words[0]
+            lo = bisect.bisect_left(entries, (w,))
+            hi = bisect.bisect_left(entries, (w + "\uffff",), lo)
+            exact = [i for i in range(lo, hi) if entries[i][0] == w]
+            if take(exact):
+                return result
+            # shortest names of the whole prefix range, not its first cap
+            # alphabetically ("cyl_*" sorts before "cylinder")
+            prefix = heapq.nsmallest(cap, filter(kind_ok, range(lo, hi)), key=shortest)
+            if take(prefix):
+                return result
+            if take(_find_all(names, name_starts, w, cap, kind_ok)):
+                return result
+            fuzzy = re.compile("[^\n]*?".join(re.escape(c) for c in w))
+            if take(_regex_all(names, name_starts, fuzzy, cap, kind_ok)):
+                return result
+
+        # every word somewhere in name / params / description - scan for the
+        # longest (likely rarest) word and cap only lines holding all of them
+        first = max(words, key=len)
+        rest = [w for w in words if w != first]
+
+        def has_rest(i: int) -> bool:
+            if not kind_ok(i):
+                return False
+            line = _line(texts, text_starts, i)
+            return all(r in line for r in rest)
+
+        take(_find_all(texts, text_starts, first, cap, has_rest))
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _entry(row: tuple) -> tuple:
+    """Sort keys and search text for a cache symbol row, plus the symbol."""
+    path, kind, name, line, params, description = row
+    sym = ScadSymbol(name=name, kind=kind, path=path, line=line,
+                     params=params, description=description)
+    text = f"{name} {params} {description}".lower().replace("\n", " ")
+    return (name.lower(), name, path, line, text, sym)
+
+
+def _blob(lines: List[str]):
+    """Join *lines* with newlines; return the text and each line's offset."""
+    starts = [0]
+    starts.extend(map(add, accumulate(map(len, lines)), count(1)))
+    starts.pop()
+    return "\n".join(lines), starts
+
+
+def _line(text: str, starts: List[int], i: int) -> str:
+    end = starts[i + 1] - 1 if i + 1 < len(starts) else len(text)
+    return text[starts[i]:end]
+
+
+def _find_all(text: str, starts: List[int], needle: str, cap: int,
+              keep: Optional[Callable[[int], bool]] = None) -> List[int]:
+    """
+    Indices of the lines of *text* containing *needle* (at most *cap*).
+    With *keep*, only lines for which ``keep(index)`` is true are counted.
+    """
+    found: List[int] = []
+    pos = text.find(needle)
+    while pos >= 0 and len(found) < cap:
+        i = bisect.bisect_right(starts, pos) - 1
+        if keep is None or keep(i):
+            found.append(i)
+        # continue on the next line
+        nxt = starts[i + 1] if i + 1 < len(starts) else len(text)
+        pos = text.find(needle, nxt)
+    return found
+
+
+def _regex_all(text: str, starts: List[int], pattern, cap: int,
+               keep: Optional[Callable[[int], bool]] = None) -> List[int]:
+    """
+    Indices of the lines of *text* matching *pattern* (at most *cap*).
+    With *keep*, only lines for which ``keep(index)`` is true are counted.
+    """
+    found: List[int] = []
+    last = -1
+    for m in pattern.finditer(text):
+        i = bisect.bisect_right(starts, m.start()) - 1
+        if i != last:
+            last = i
+            if keep is None or keep(i):
+                found.append(i)
+                if len(found) >= cap:
+                    break
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton (lazy-initialised)
+# ---------------------------------------------------------------------------
+
+_index_instance: Optional[SymbolIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_symbol_index() -> SymbolIndex:
+    """Return the shared :class:`SymbolIndex` over :func:`get_cache`."""
+    global _index_instance
+    if _index_instance is None:
+        with _index_lock:
+            if _index_instance is None:
+                _index_instance = SymbolIndex()
+    return _index_instance
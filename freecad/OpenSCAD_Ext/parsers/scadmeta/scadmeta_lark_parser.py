@@ -2,8 +2,16 @@
 Lark-based OpenSCAD metadata parser.
 
 Parses a SCAD source file and returns a populated :class:`ScadMeta` object.
-Uses Earley parser with dynamic lexer for robustness against the syntactic
-quirks of OpenSCAD (e.g. ``<path>`` vs ``<`` comparison operator).
+
+Parsing is tried in order of cost:
+
+1. LALR parser with contextual lexer over a skimmed source: a pre-lexer
+   removes include/use statements, module bodies and function bodies so
+   only top-level statement headers reach the grammar.  Handles the vast
+   majority of files.
+2. Earley parser with dynamic lexer for files LALR rejects - slower but
+   robust against the syntactic quirks of OpenSCAD.
+3. Regex extraction (``_regex_fallback``) if Earley also fails.
 
 Public API
 ----------
@@ -12,13 +20,20 @@ Public API
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
-from typing import List
+import threading
+from typing import List, Optional
 
+import lark
 from lark import Lark, Tree, Token, UnexpectedInput
 
-from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_grammar import SCAD_META_GRAMMAR
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_grammar import (
+    SCAD_META_GRAMMAR,
+    SCAD_META_LALR_GRAMMAR,
+)
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import default_cache_dir
 from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_model import (
     ScadMeta,
     ScadModuleMeta,
@@ -27,16 +42,64 @@ from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_model import (
 )
 
 # ---------------------------------------------------------------------------
-# Build the Lark parser once at import time (shared across calls).
-# Earley + dynamic lexer handles SCAD's ambiguous angle-bracket syntax.
+# Lark parsers are built lazily on first parse (grammar analysis is slow and
+# this module is imported by the library browser and importers).
+#
+# The LALR parser is cached on disk with Lark's built-in cache, in a file
+# keyed by grammar hash and Lark version under the user data dir, so later
+# sessions load it instead of re-analysing the grammar.  Earley cannot be
+# cached by Lark; it is only built if a file is rejected by LALR.
 # ---------------------------------------------------------------------------
-_parser = Lark(
-    SCAD_META_GRAMMAR,
-    parser="earley",
-    lexer="dynamic",
-    ambiguity="resolve",
-    propagate_positions=True,
-)
+_lalr_parser: Optional[Lark] = None
+_earley_parser: Optional[Lark] = None
+_parser_lock = threading.Lock()
+
+
+def _lalr_cache_path() -> str:
+    """Cache file for the serialised LALR parser."""
+    key = hashlib.sha256(SCAD_META_LALR_GRAMMAR.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(
+        default_cache_dir(),
+        f"scadmeta_lalr_{key}_lark{lark.__version__}.cache",
+    )
+
+
+def _get_lalr_parser() -> Lark:
+    """Return the LALR parser, loading / building it on first use."""
+    global _lalr_parser
+    if _lalr_parser is None:
+        with _parser_lock:
+            if _lalr_parser is None:
+                options = dict(
+                    parser="lalr",
+                    lexer="contextual",
+                    propagate_positions=True,
+                )
+                try:
+                    os.makedirs(default_cache_dir(), exist_ok=True)
+                    _lalr_parser = Lark(
+                        SCAD_META_LALR_GRAMMAR, cache=_lalr_cache_path(), **options
+                    )
+                except OSError:
+                    # read-only / unavailable user dir – build without cache
+                    _lalr_parser = Lark(SCAD_META_LALR_GRAMMAR, **options)
+    return _lalr_parser
+
+
+def _get_earley_parser() -> Lark:
+    """Return the Earley fallback parser, building it on first use."""
+    global _earley_parser
+    if _earley_parser is None:
+        with _parser_lock:
+            if _earley_parser is None:
+                _earley_parser = Lark(
+                    SCAD_META_GRAMMAR,
+                    parser="earley",
+                    lexer="dynamic",
+                    ambiguity="resolve",
+                    propagate_positions=True,
+                )
+    return _earley_parser
 
 # Regex fallback for BOSL2-style header comment blocks
 _BOSL2_HEADER_RE = re.compile(r"/{60,}")
@@ -190,6 +253,103 @@ def _parse_bosl2_header_includes(source_lines: List[str]) -> List[str]:
     return found
 
 
+# ---------------------------------------------------------------------------
+# Skim pre-lexer (LALR path)
+#
+# Only top-level statements are used, so the grammar does not need to see
+# module bodies or function expressions.  A brace, string and comment aware
+# scan reduces the source to the top-level statement headers before parsing.
+# ---------------------------------------------------------------------------
+
+_SKIM_RE = re.compile(
+    r"""
+      (?P<string>"(?:[^"\\]|\\.)*")
+    | (?P<line_comment>//[^\n]*)
+    | (?P<block_comment>/\*.*?\*/)
+    | (?P<dep>\b(?P<kw>include|use)\s*<(?P<path>[^>\n]*)>)
+    | (?P<function>\bfunction(?=\s+[A-Za-z_$]))
+    | (?P<open>\{)
+    | (?P<close>\})
+    | (?P<open_paren>[(\[])
+    | (?P<close_paren>[)\]])
+    | (?P<semi>;)
+    | (?P<eq>(?<![=!<>])=(?!=))
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def _skim_source(source: str):
+    """
+    Reduce *source* to the top-level statements the metadata walk uses.
+
+    * ``include <path>`` / ``use <path>`` statements are removed (so
+      ``<path>`` never meets the ``<`` comparison operator).
+    * The contents of every top-level ``{ ... }`` block (module bodies and
+      the children of top-level calls) are removed, leaving ``{}``.
+    * Function bodies (``= expr ;``) are replaced by ``= 0;``.
+
+    Strings and comments are skipped so braces, paths etc. inside them are
+    ignored.  Removed text is replaced by its newlines, so line numbers in
+    the remaining text are unchanged.
+
+    Returns ``(skimmed_source, includes, uses)`` where *includes* and *uses*
+    only contain top-level (brace depth 0) statements, in source order.
+    """
+    includes: List[str] = []
+    uses: List[str] = []
+    pieces: List[str] = []
+    depth = 0           # brace depth
+    nest = 0            # paren / bracket depth at brace depth 0
+    in_function = False  # between "function" and its header "="
+    body_start = -1     # start of block or function body being removed
+    pos = 0
+
+    def drop(start, stop, keep=""):
+        pieces.append(source[pos:start])
+        pieces.append(keep + "\n" * source.count("\n", start, stop))
+        return stop
+
+    for m in _SKIM_RE.finditer(source):
+        kind = m.lastgroup
+        if kind == "open":
+            if depth == 0 and body_start < 0:
+                body_start = m.end()
+            depth += 1
+        elif kind == "close":
+            depth = max(depth - 1, 0)
+            if depth == 0 and body_start >= 0:
+                pos = drop(body_start, m.start())
+                body_start = -1
+        elif kind == "dep":
+            if depth == 0:
+                target = includes if m.group("kw") == "include" else uses
+                target.append(m.group("path").strip())
+                if body_start < 0:
+                    pos = drop(m.start(), m.end())
+        elif depth > 0:
+            continue
+        elif kind == "open_paren":
+            nest += 1
+        elif kind == "close_paren":
+            nest = max(nest - 1, 0)
+        elif kind == "function":
+            in_function = nest == 0 and body_start < 0
+        elif kind == "eq":
+            if in_function and nest == 0:
+                in_function = False
+                body_start = m.end()
+        elif kind == "semi":
+            if nest == 0:
+                in_function = False
+                if body_start >= 0:
+                    pos = drop(body_start, m.start(), " 0")
+                    body_start = -1
+
+    pieces.append(source[pos:])
+    return "".join(pieces), includes, uses
+
+
 # ---------------------------------------------------------------------------
 # Top-level geometry detection
 # ---------------------------------------------------------------------------
@@ -237,13 +397,20 @@ def parse_scad_file(path: str) -> ScadMeta:
     # Cheap pre-pass: detect BOSL2 header comment includes
     meta.comment_includes = _parse_bosl2_header_includes(source_lines)
 
-    # --- Lark parse ---
+    # --- Lark parse: LALR over the skimmed source first, Earley over the
+    #     full source only for files LALR rejects ---
+    skimmed, includes, uses = _skim_source(source)
     try:
-        tree = _parser.parse(source)
+        tree = _get_lalr_parser().parse(skimmed)
+        meta.includes.extend(includes)
+        meta.uses.extend(uses)
     except UnexpectedInput:
-        # Fall back to regex extraction so a single bad file does not block scanning
-        _regex_fallback(source, source_lines, meta)
-        return meta
+        try:
+            tree = _get_earley_parser().parse(source)
+        except UnexpectedInput:
+            # Fall back to regex extraction so a single bad file does not block scanning
+            _regex_fallback(source, source_lines, meta)
+            return meta
 
     # Walk top-level statements only
     _walk_top_level(tree, source_lines, meta)
@@ -12,23 +12,33 @@ This module is the single entry point for all metadata extraction:
 
 The scanner
 -----------
-1. Checks the TinyDB cache (hash + mtime validated).
+1. Checks the SQLite cache (hash + mtime validated).
 2. On cache miss, delegates to the Lark-based parser.
 3. Classifies the file type via :func:`classify_file_type`.
-4. Persists the result to cache.
+4. Persists the result and its resolved include/use edges to cache.
 5. Optionally starts a Watchdog observer for the file's directory so future
    on-disk changes are automatically detected.
 
+:func:`scan_scad_directory` can parse cache misses in a process pool
+(``workers`` argument).  Workers return :func:`_serialise` dicts and the
+parent stores them in the cache in one batch.  :func:`scan_scad_files`
+validates the cache for a whole list of files in one call.
+
 Serialisation
 -------------
-:class:`ScadMeta` is serialised to / from plain dicts so TinyDB can store it
-without any custom JSON encoder.
+:class:`ScadMeta` is serialised to / from plain dicts so the cache can store
+it as JSON without any custom encoder.
 """
 
 from __future__ import annotations
 
 import dataclasses
+import multiprocessing
 import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer as timer
 from typing import Dict, List, Optional
 
 from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_model import (
@@ -41,6 +51,10 @@ from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_model import (
 )
 from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_lark_parser import parse_scad_file
 from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_cache import get_cache
+from freecad.OpenSCAD_Ext.parsers.scadmeta.scadmeta_deps import (
+    library_search_path,
+    record_dependencies,
+)
 
 try:
     from freecad.OpenSCAD_Ext.logger.Workbench_logger import write_log
@@ -132,6 +146,28 @@ def _deserialise(d: Dict) -> ScadMeta:
 # Public API
 # ---------------------------------------------------------------------------
 
+def watch_scad_path(path: str, recursive: bool = False) -> None:
+    """
+    Watch *path* (a file or directory) for changes.
+
+    Anything under an ``OPENSCADPATH`` entry is covered by one recursive
+    watch on that library root; other locations get a watch on their own
+    directory (recursive only if requested).
+    """
+    path = os.path.abspath(path)
+    directory = path if os.path.isdir(path) else os.path.dirname(path)
+    try:
+        cache = get_cache()
+        for root in library_search_path():
+            root = os.path.abspath(root)
+            if directory == root or directory.startswith(root + os.sep):
+                cache.watch_directory(root, recursive=True)
+                return
+        cache.watch_directory(directory, recursive=recursive)
+    except Exception:
+        pass
+
+
 def scan_scad_file(path: str, use_cache: bool = True, watch: bool = True) -> ScadMeta:
     """
     Scan a single SCAD file and return its :class:`ScadMeta`.
@@ -141,7 +177,7 @@ def scan_scad_file(path: str, use_cache: bool = True, watch: bool = True) -> Sca
     path:
         Absolute or relative path to the ``.scad`` file.
     use_cache:
-        When ``True`` (default) check the TinyDB cache before parsing.
+        When ``True`` (default) check the persistent cache before parsing.
         Re-parses and refreshes the cache when the file has changed.
     watch:
         When ``True`` (default) register the file's parent directory with
@@ -189,24 +225,180 @@ def scan_scad_file(path: str, use_cache: bool = True, watch: bool = True) -> Sca
         f"includes={len(meta.includes)}  uses={len(meta.uses)}"
     )
 
-    # --- cache store ---
+    # --- cache store (metadata and resolved include/use edges) ---
     if cache is not None:
         cache.put(path, _serialise(meta))
+        record_dependencies({path: meta})
 
-    # --- start watchdog for this directory ---
+    # --- start watchdog for this file's library root / directory ---
     if watch and cache is not None:
-        try:
-            cache.watch_directory(os.path.dirname(path))
-        except Exception:
-            pass
+        watch_scad_path(path)
 
     return meta
 
 
+# ---------------------------------------------------------------------------
+# Parallel parsing
+# ---------------------------------------------------------------------------
+
+def _parse_serialised(path: str) -> Optional[Dict]:
+    """
+    Process-pool worker: parse and classify *path*, return a
+    :func:`_serialise` dict, or ``None`` if parsing raised.
+    """
+    try:
+        meta = parse_scad_file(path)
+        meta.file_type = classify_file_type(meta)
+        meta.refresh_counts()
+        return _serialise(meta)
+    except Exception:
+        return None
+
+
+# fewer cache misses than this parse faster than a process pool starts
+_PARALLEL_MIN = 16
+
+# files per scan_scad_files() call when a directory scan can be stopped
+_STOP_CHUNK = 512
+
+
+def _python_executable() -> Optional[str]:
+    """
+    A Python interpreter for spawned workers, or ``None``.  Inside FreeCAD
+    ``sys.executable`` is the FreeCAD binary; its bundled interpreter sits
+    next to it.
+    """
+    exe = sys.executable or ""
+    if "python" in os.path.basename(exe).lower():
+        return exe
+    for name in ("python3", "python", "python.exe"):
+        candidate = os.path.join(os.path.dirname(exe), name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _pool_context():
+    """
+    Return a multiprocessing context usable from here, or ``None``.
+
+    ``fork`` is only used while this is the process's only thread - forking
+    a threaded process (FreeCAD's GUI, a scan from a background thread) can
+    leave the child waiting on a lock another thread held.  Otherwise
+    workers start through ``forkserver`` (or ``spawn``) with a Python
+    interpreter, if one can be found.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    python = _python_executable()
+    if python is None:
+        return None
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    if python != sys.executable:
+        ctx.set_executable(python)
+    return ctx
+
+
+def _parse_parallel(paths: List[str], workers: int) -> Dict[str, Optional[Dict]]:
+    """
+    Parse *paths* in a process pool of *workers* processes.
+
+    Returns ``{path: serialised_dict_or_None}``.  Paths are missing from the
+    result if the pool could not be used.
+    """
+    ctx = _pool_context()
+    if ctx is None:
+        write_log("Warning", "[scadmeta] no usable process start method, scanning serially")
+        return {}
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            return dict(zip(paths, pool.map(_parse_serialised, paths, chunksize=chunksize)))
+    except Exception as exc:
+        write_log("Warning", f"[scadmeta] parallel scan failed ({exc}), scanning serially")
+        return {}
+
+
+def scan_scad_files(
+    paths: List[str],
+    use_cache: bool = True,
+    workers: Optional[int] = 1,
+) -> List[ScadMeta]:
+    """
+    Scan several ``.scad`` files and return their :class:`ScadMeta` objects
+    in the order given.
+
+    Cache entries for all *paths* are validated in one
+    :meth:`~ScadMetaCache.get_many` call; only the misses are parsed and
+    they are written back to the cache in one batch.
+
+    Parameters
+    ----------
+    paths:
+        Paths of the ``.scad`` files.
+    use_cache:
+        When ``True`` (default) use and refresh the persistent cache.
+    workers:
+        Number of processes used to parse cache misses.  ``1`` (default)
+        parses in this process, ``None`` uses ``os.cpu_count()``.  Full
+        library scans pass ``None``; small batches stay serial anyway.
+    """
+    paths = [os.path.abspath(p) for p in paths]
+    cache = get_cache() if use_cache else None
+    found: Dict[str, ScadMeta] = {}
+
+    cached = cache.get_many(paths) if cache is not None else {}
+    for path, data in cached.items():
+        meta = _deserialise(data)
+        # Always re-classify, as scan_scad_file does
+        meta.file_type = classify_file_type(meta)
+        found[path] = meta
+    misses = [p for p in paths if p not in found and os.path.isfile(p)]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    start = timer()
+    parallel = workers > 1 and len(misses) >= _PARALLEL_MIN
+    parsed = _parse_parallel(misses, workers) if parallel else {}
+
+    to_store: Dict[str, Dict] = {}
+    for path in misses:
+        data = parsed.get(path)
+        if data is None:
+            # serial scan, pool unavailable or worker failed
+            meta = scan_scad_file(path, use_cache=False, watch=False)
+            data = _serialise(meta)
+        else:
+            meta = _deserialise(data)
+        found[path] = meta
+        to_store[path] = data
+
+    if cache is not None:
+        cache.put_many(to_store)
+        record_dependencies({path: found[path] for path in to_store})
+
+    if misses:
+        write_log(
+            "Info",
+            f"[scadmeta] {len(paths) - len(misses)} cached, {len(misses)} parsed "
+            f"(workers={workers}) in {timer() - start:.2f}s"
+        )
+
+    return [
+        found.get(path) or scan_scad_file(path, use_cache=False, watch=False)
+        for path in paths
+    ]
+
+
 def scan_scad_directory(
     directory: str,
     recursive: bool = False,
     use_cache: bool = True,
+    workers: Optional[int] = 1,
+    stop: Optional[threading.Event] = None,
 ) -> List[ScadMeta]:
     """
     Scan all ``.scad`` files in *directory* and return a list of
@@ -219,32 +411,40 @@ def scan_scad_directory(
     recursive:
         If ``True`` descend into sub-directories.
     use_cache:
-        Passed through to :func:`scan_scad_file`.
+        Passed through to :func:`scan_scad_files`.
+    workers:
+        Passed through to :func:`scan_scad_files`.
+    stop:
+        When set (from another thread) the scan ends after the current
+        chunk of files and returns what it has so far.
     """
     directory = os.path.abspath(directory)
-    results: List[ScadMeta] = []
 
     if not os.path.isdir(directory):
         write_log("Warning", f"scan_scad_directory: not a directory: {directory}")
-        return results
+        return []
 
-    # Register the top-level directory with watchdog once
+    # Register the library root / directory with watchdog once
     if use_cache:
-        try:
-            get_cache().watch_directory(directory, recursive=recursive)
-        except Exception:
-            pass
+        watch_scad_path(directory, recursive=recursive)
 
+    paths: List[str] = []
     for root, dirs, files in os.walk(directory):
         for fname in sorted(files):
             if fname.lower().endswith(".scad"):
-                full_path = os.path.join(root, fname)
-                meta = scan_scad_file(full_path, use_cache=use_cache, watch=False)
-                results.append(meta)
+                paths.append(os.path.join(root, fname))
 
         if not recursive:
             dirs.clear()  # prevent os.walk from descending
 
+    chunk = _STOP_CHUNK if stop is not None else max(1, len(paths))
+    results: List[ScadMeta] = []
+    for i in range(0, len(paths), chunk):
+        if stop is not None and stop.is_set():
+            write_log("Info", f"[scadmeta] scan of {directory} stopped")
+            break
+        results.extend(scan_scad_files(paths[i:i + chunk], use_cache=use_cache, workers=workers))
+
     write_log(
         "Info",
         f"[scadmeta] scanned {len(results)} SCAD files in {directory}"
@@ -1,7 +1,7 @@
 """
 scan_scad_library – scan the OpenSCAD library path for SCAD files.
 
-Uses the new Lark-based scanner (with TinyDB cache + Watchdog monitoring) to
+Uses the new Lark-based scanner (with SQLite cache + Watchdog monitoring) to
 extract metadata from every ``.scad`` file found in the configured library
 directory.
 
@@ -44,7 +44,8 @@ def scan_scad_library(recursive: bool = False) -> List[ScadMeta]:
     library_path = ensure_openSCADPATH()
     write_log("Info", f"[scan_scad_library] scanning: {library_path}  recursive={recursive}")
 
-    results = scan_scad_directory(library_path, recursive=recursive, use_cache=True)
+    results = scan_scad_directory(library_path, recursive=recursive, use_cache=True,
+                                  workers=None)
 
     if not results:
         write_log("Warning", f"[scan_scad_library] no SCAD files found in {library_path}")